@@ -0,0 +1,139 @@
+"""Content-addressed persistence for run audits, lineage and manifests."""
+
+import hashlib
+import json
+import logging
+import os
+from datetime import date, datetime, time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+OBJECTS_DIR = "objects"
+MANIFEST_VERSION = 2
+# Keys of the reference ``AuditStore.put`` returns in place of an inline payload.
+REF_KEYS = ("sha256", "object", "bytes")
+READ_ONLY = 0o444
+
+
+def _default(obj: Any) -> Any:
+    """Encode values ``json`` does not support natively."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    return str(obj)
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Compact JSON bytes with sorted keys, so equal objects hash equally.
+
+    numpy values are written as plain numbers, dates in ISO 8601 and
+    anything else as ``str(value)``. NaN and infinity are written as
+    ``NaN``/``Infinity``, as ``json.dump`` did for the run files before.
+    """
+    return json.dumps(
+        obj, default=_default, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+def write_atomic(path: Path, payload: bytes, mode: Optional[int] = None) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(payload)
+    if mode is not None:
+        tmp_path.chmod(mode)
+    tmp_path.replace(path)
+
+
+def append_ndjson(path: Path, records: Iterable[Any]) -> int:
+    """Append one compact JSON line per record to ``path``; return the count."""
+    lines = [dumps(record) + b"\n" for record in records]
+    if lines:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("ab") as handle:
+            handle.write(b"".join(lines))
+    return len(lines)
+
+
+def is_ref(value: Any) -> bool:
+    return isinstance(value, dict) and all(key in value for key in REF_KEYS)
+
+
+def manifest_objects(manifest_path: Path) -> Dict[str, Path]:
+    """``object name -> local path`` for every object a manifest references."""
+    manifest = json.loads(Path(manifest_path).read_bytes())
+    root = Path(manifest_path).parent
+    return {value["object"]: root / value["object"] for value in manifest.values() if is_ref(value)}
+
+
+def load_manifest(manifest_path: Path) -> Dict[str, Any]:
+    """
+    Read a run manifest with every referenced payload loaded inline.
+
+    Objects are resolved relative to the manifest's directory, which holds
+    for both ``logs/runs`` and the exported blob prefix. Version 1
+    manifests, which stored payloads inline, are returned unchanged.
+    """
+    manifest = json.loads(Path(manifest_path).read_bytes())
+    root = Path(manifest_path).parent
+    return {
+        key: json.loads((root / value["object"]).read_bytes()) if is_ref(value) else value
+        for key, value in manifest.items()
+    }
+
+
+class AuditStore:
+    """
+    Write JSON objects once under ``root/objects/<sha256>.json``.
+
+    ``put`` returns a reference for use in manifests: the hash, the object
+    name relative to ``root``, the size and the local path. Storing an
+    object whose hash is already present does no I/O, so unchanged lineage
+    or raw-file lists are shared across manifest rewrites and runs. Object
+    files are read-only since any number of manifests may point at them.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.objects_dir = self.root / OBJECTS_DIR
+
+    def object_path(self, digest: str) -> Path:
+        return self.objects_dir / f"{digest}.json"
+
+    def put(self, obj: Any) -> Dict[str, Any]:
+        payload = dumps(obj)
+        digest = hashlib.sha256(payload).hexdigest()
+        path = self.object_path(digest)
+        if not path.exists():
+            write_atomic(path, payload, mode=READ_ONLY)
+        return {
+            "sha256": digest,
+            "object": f"{OBJECTS_DIR}/{digest}.json",
+            "bytes": len(payload),
+            "path": str(path),
+        }
+
+    def get(self, ref: Dict[str, Any]) -> Any:
+        """Load the object behind a reference returned by ``put``."""
+        return json.loads(self.object_path(ref["sha256"]).read_bytes())
+
+    def copy_to(self, ref: Dict[str, Any], path: Path) -> Path:
+        """
+        Write a stored object's bytes to ``path`` without re-serializing it.
+
+        The copy is a separate file, so editing it never touches the object.
+        """
+        write_atomic(path, self.object_path(ref["sha256"]).read_bytes())
+        return path
+
+    def write_manifest(self, path: Path, manifest: Dict[str, Any]) -> Path:
+        write_atomic(path, dumps({"manifest_version": MANIFEST_VERSION, **manifest}))
+        logger.info("Wrote manifest %s", path)
+        return path
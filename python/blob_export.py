@@ -0,0 +1,193 @@
+"""Concurrent export of run outputs to Azure Blob Storage."""
+
+import base64
+import hashlib
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from azure.core.exceptions import HttpResponseError, ResourceExistsError, ResourceNotFoundError
+from azure.identity import DefaultAzureCredential
+from azure.storage.blob import BlobServiceClient, ContentSettings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 8
+# Files above MAX_SINGLE_PUT_SIZE are sent as staged blocks of MAX_BLOCK_SIZE,
+# with up to BLOCK_CONCURRENCY blocks in flight per file.
+MAX_BLOCK_SIZE = 4 * 1024 * 1024
+MAX_SINGLE_PUT_SIZE = 8 * 1024 * 1024
+BLOCK_CONCURRENCY = 4
+CONTENT_TYPES = {
+    ".csv": "text/csv",
+    ".json": "application/json",
+    ".parquet": "application/octet-stream",
+    ".html": "text/html",
+    ".md": "text/markdown",
+}
+
+_clients: Dict[Tuple[Optional[str], Optional[str]], BlobServiceClient] = {}
+_ready_containers: set = set()
+_lock = threading.Lock()
+
+
+def guess_content_type(path: Path) -> str:
+    return CONTENT_TYPES.get(path.suffix.lower(), "application/octet-stream")
+
+
+def file_md5(path: Path, block_size: int = 1 << 20) -> bytes:
+    """Raw MD5 digest of a file, as stored in a blob's Content-MD5."""
+    digest = hashlib.md5()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(block_size), b""):
+            digest.update(block)
+    return digest.digest()
+
+
+def get_blob_service_client(
+    connection_string: Optional[str] = None, account_url: Optional[str] = None
+) -> BlobServiceClient:
+    """Process-wide client per account, so connections are pooled across runs."""
+    if not connection_string and not account_url:
+        raise ValueError("Azure export requires a connection_string or account_url.")
+    key = (connection_string, None if connection_string else account_url)
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            options = {
+                "max_block_size": MAX_BLOCK_SIZE,
+                "max_single_put_size": MAX_SINGLE_PUT_SIZE,
+            }
+            client = (
+                BlobServiceClient.from_connection_string(connection_string, **options)
+                if connection_string
+                else BlobServiceClient(
+                    account_url=account_url, credential=DefaultAzureCredential(), **options
+                )
+            )
+            _clients[key] = client
+    return client
+
+
+def get_container_client(service_client: Any, container_name: str) -> Any:
+    """Container client, creating the container only on first use per process."""
+    container_client = service_client.get_container_client(container_name)
+    key = (id(service_client), container_name)
+    if key not in _ready_containers:
+        try:
+            container_client.create_container()
+        except ResourceExistsError:
+            logger.info("Azure container '%s' already exists.", container_name)
+        _ready_containers.add(key)
+    return container_client
+
+
+class BlobExporter:
+    """
+    Upload files to one container on a thread pool.
+
+    Every blob is sent with its Content-MD5. With ``skip_unchanged=True`` a
+    file whose MD5 matches the existing blob's is not sent again; that costs
+    one properties request per file, so enable it only for blob names that
+    repeat across exports (run-scoped names never match). Any object with
+    the ``ContainerClient`` methods used here (``container_name``,
+    ``get_blob_client``, ``upload_blob``) works, which keeps the exporter
+    testable without a storage account.
+    """
+
+    def __init__(
+        self,
+        container_client: Any,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        skip_unchanged: bool = False,
+    ):
+        self.container_client = container_client
+        self.max_workers = max_workers
+        self.skip_unchanged = skip_unchanged
+        self.uploaded: Dict[str, str] = {}
+        self.skipped: Dict[str, str] = {}
+
+    def _remote_md5(self, blob_name: str) -> Optional[bytes]:
+        try:
+            properties = self.container_client.get_blob_client(blob_name).get_blob_properties()
+        except ResourceNotFoundError:
+            return None
+        except HttpResponseError as exc:
+            # Write-only SAS tokens and roles cannot read properties; just upload.
+            logger.info("Azure export cannot read properties of %s: %s", blob_name, exc)
+            return None
+        md5 = properties.content_settings.content_md5
+        return bytes(md5) if md5 else None
+
+    def upload_file(self, path: Path, blob_name: str) -> bool:
+        """Upload ``path`` unless the blob already has the same content; True if sent."""
+        md5 = file_md5(path)
+        if self.skip_unchanged and self._remote_md5(blob_name) == md5:
+            logger.info("Azure export skipped unchanged blob %s", blob_name)
+            return False
+        with path.open("rb") as handle:
+            self.container_client.upload_blob(
+                name=blob_name,
+                data=handle,
+                overwrite=True,
+                length=path.stat().st_size,
+                max_concurrency=BLOCK_CONCURRENCY,
+                content_settings=ContentSettings(
+                    content_type=guess_content_type(path), content_md5=bytearray(md5)
+                ),
+            )
+        return True
+
+    def upload_files(
+        self,
+        files: Mapping[str, Path],
+        prefix: str = "",
+        blob_names: Optional[Mapping[str, str]] = None,
+    ) -> Dict[str, str]:
+        """
+        Upload every file concurrently; return ``key -> container/blob`` for each.
+
+        Blobs are named after the file unless ``blob_names`` gives a name for the key.
+        """
+        names = {key: (blob_names or {}).get(key, Path(path).name) for key, path in files.items()}
+        blob_names = {key: f"{prefix}/{name}" if prefix else name for key, name in names.items()}
+        container = self.container_client.container_name
+        with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as pool:
+            futures = {
+                key: pool.submit(self.upload_file, Path(path), blob_names[key])
+                for key, path in files.items()
+            }
+            for key, future in futures.items():
+                target = f"{container}/{blob_names[key]}"
+                (self.uploaded if future.result() else self.skipped)[key] = target
+        return {key: f"{container}/{blob_names[key]}" for key in files}
+
+
+def export_files(
+    files: Mapping[str, Path],
+    container_name: str,
+    connection_string: Optional[str] = None,
+    account_url: Optional[str] = None,
+    prefix: str = "",
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    blob_names: Optional[Mapping[str, str]] = None,
+    skip_unchanged: bool = False,
+) -> Dict[str, str]:
+    """Upload ``files`` to ``container_name`` with the pooled client."""
+    if not container_name or not str(container_name).strip():
+        raise ValueError("Azure container_name is required for export.")
+    service_client = get_blob_service_client(connection_string, account_url)
+    container_client = get_container_client(service_client, str(container_name).strip())
+    exporter = BlobExporter(
+        container_client, max_workers=max_workers, skip_unchanged=skip_unchanged
+    )
+    result = exporter.upload_files(files, prefix, blob_names)
+    logger.info(
+        "Azure export to %s: %d uploaded, %d unchanged",
+        container_client.container_name,
+        len(exporter.uploaded),
+        len(exporter.skipped),
+    )
+    return result
@@ -1,9 +1,12 @@
 import hashlib
 import json
+import threading
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 PII_COLUMN_KEYWORDS = [
@@ -16,6 +19,7 @@ PII_COLUMN_KEYWORDS = [
     "identifier",
     "id_number",
 ]
+DEFAULT_DIGEST_CACHE_SIZE = 100_000
 
 
 def _mask_value(value: Any) -> Any:
@@ -26,20 +30,85 @@ def _mask_value(value: Any) -> Any:
     return f"MASKED:{digest[:8]}"
 
 
+class DigestCache:
+    """Bounded LRU of masked tokens keyed by the original text."""
+
+    def __init__(self, maxsize: int = DEFAULT_DIGEST_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._tokens: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def mask_many(self, texts: Iterable[str]) -> List[str]:
+        """Masked token for each text, hashing only texts not cached yet."""
+        tokens = []
+        with self._lock:
+            for text in texts:
+                token = self._tokens.get(text)
+                if token is None:
+                    self.misses += 1
+                    token = _mask_value(text)
+                    self._tokens[text] = token
+                    if len(self._tokens) > self.maxsize:
+                        self._tokens.popitem(last=False)
+                else:
+                    self.hits += 1
+                    self._tokens.move_to_end(text)
+                tokens.append(token)
+        return tokens
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tokens.clear()
+            self.hits = self.misses = 0
+
+
+def mask_series(values: pd.Series, cache: Optional[DigestCache] = None) -> pd.Series:
+    """
+    Mask a column by hashing each distinct value once (factorize, hash the
+    uniques, take by code). Nulls are kept as they are. Without ``cache``
+    the digests are only kept for this call.
+    """
+    cache = cache if cache is not None else DigestCache()
+    keys = values
+    if values.dtype == object:
+        # factorize treats 1, 1.0 and True as one value, but their text differs.
+        keys = values.astype(str).where(values.notna())
+    codes, uniques = pd.factorize(keys)
+    tokens = np.array(cache.mask_many(str(value) for value in uniques), dtype=object)
+    masked = np.empty(len(values), dtype=object)
+    present = codes >= 0
+    masked[present] = tokens[codes[present]]
+    masked[~present] = values.to_numpy(dtype=object)[~present]
+    return pd.Series(masked, index=values.index, name=values.name)
+
+
 def mask_pii_in_dataframe(
     df: pd.DataFrame,
     pii_columns: Optional[Iterable[str]] = None,
     keywords: Optional[Iterable[str]] = None,
+    cache: Optional[DigestCache] = None,
 ) -> Tuple[pd.DataFrame, List[str]]:
+    """
+    Mask PII columns, given or matched by keyword. Digests are shared
+    across this call's columns, or kept in ``cache`` when given, so no
+    plaintext outlives the call by default.
+    """
     columns = list(pii_columns) if pii_columns is not None else []
     keyword_source = list(keywords) if keywords is not None else PII_COLUMN_KEYWORDS
     if not columns:
         lowered = [keyword.lower() for keyword in keyword_source]
         columns = [col for col in df.columns if any(keyword in col.lower() for keyword in lowered)]
-    masked = df.copy()
+    cache = cache if cache is not None else DigestCache()
+    # Shallow copy: only the masked columns get new arrays.
+    masked = df.copy(deep=False)
     for column in columns:
         if column in masked.columns:
-            masked[column] = masked[column].apply(_mask_value)
+            masked[column] = mask_series(masked[column], cache)
     return masked, columns
 
 
@@ -1,13 +1,70 @@
 import pandas as pd
 import numpy as np
 import logging
+from dataclasses import dataclass
 from datetime import datetime, date
-from typing import List, Optional, Dict, Any, Callable
+from typing import List, Optional, Dict, Any, Callable, Sequence, Tuple
 from functools import wraps
-from python.validation import find_column
+from python.validation import find_column, resolve_columns
 
 logger = logging.getLogger(__name__)
 
+# Upper bounds (inclusive) of each DPD bucket; values above the last edge are 180+.
+DPD_BUCKET_EDGES: Tuple[float, ...] = (0, 29, 59, 89, 119, 149, 179)
+DPD_BUCKET_LABELS: Tuple[str, ...] = (
+    'Current', '1-29', '30-59', '60-89', '90-119', '120-149', '150-179', '180+'
+)
+# Lower bounds (inclusive) of each exposure segment after Micro.
+EXPOSURE_SEGMENT_EDGES: Tuple[float, ...] = (1000, 10000)
+EXPOSURE_SEGMENT_LABELS: Tuple[str, ...] = ('Micro', 'Small', 'Medium/Large')
+CLIENT_TYPE_LABELS: Tuple[str, ...] = ('New', 'Recurring', 'Recovered')
+
+DPD_CANDIDATES = ['days_past_due', 'dpd', 'dias_mora', 'days_late']
+EXPOSURE_CANDIDATES = ['outstanding_balance', 'balance', 'saldo', 'amount']
+ZSCORE_METRICS = ['apr', 'term', 'days_past_due', 'outstanding_balance', 'line_utilization']
+ENRICHMENT_COLUMNS = frozenset(
+    ['dpd_bucket', 'exposure_segment', 'client_type', 'days_since_active', 'line_utilization']
+    + [f'{metric}_zscore' for metric in ZSCORE_METRICS]
+)
+
+
+@dataclass(frozen=True)
+class BinningConfig:
+    """Bucket edges and labels used by the vectorized classifiers."""
+
+    dpd_edges: Tuple[float, ...] = DPD_BUCKET_EDGES
+    dpd_labels: Tuple[str, ...] = DPD_BUCKET_LABELS
+    exposure_edges: Tuple[float, ...] = EXPOSURE_SEGMENT_EDGES
+    exposure_labels: Tuple[str, ...] = EXPOSURE_SEGMENT_LABELS
+    recurring_window_days: int = 90
+
+    def __post_init__(self):
+        for edges, labels in (
+            (self.dpd_edges, self.dpd_labels),
+            (self.exposure_edges, self.exposure_labels),
+        ):
+            if len(labels) != len(edges) + 1:
+                raise ValueError("Bucket labels must have exactly one more entry than edges")
+            if list(edges) != sorted(edges):
+                raise ValueError("Bucket edges must be sorted ascending")
+
+
+def bin_series(
+    values: pd.Series, edges: Sequence[float], labels: Sequence[str], right: bool = True
+) -> pd.Series:
+    """
+    Assign each value to a labelled bin with ``np.searchsorted``.
+
+    With ``right=True`` edges are inclusive upper bounds (``val <= edge``);
+    otherwise they are inclusive lower bounds (``val >= edge``). NaN falls in
+    the last bin, matching the scalar rules. Returns an ordered categorical.
+    """
+    side = 'left' if right else 'right'
+    numeric = values.to_numpy(dtype='float64', na_value=np.nan)
+    codes = np.searchsorted(np.asarray(edges, dtype='float64'), numeric, side=side)
+    categorical = pd.Categorical.from_codes(codes, categories=list(labels), ordered=True)
+    return pd.Series(categorical, index=values.index)
+
 
 def resolve_column(candidates: List[str], fallback: Optional[str] = None):
     """Decorator to resolve column name before method execution."""
@@ -75,8 +132,8 @@ class Classification:
 class FinancialAnalyzer:
     """Financial analysis and enrichment engine."""
 
-    def __init__(self):
-        pass
+    def __init__(self, config: Optional[BinningConfig] = None):
+        self.config = config or BinningConfig()
 
     def validate_numeric_columns(self, df: pd.DataFrame, columns: list) -> list:
         """
@@ -96,29 +153,144 @@ class FinancialAnalyzer:
             raise ValueError(f"Numeric column validation errors: {errors}")
         return errors
 
-    @resolve_column(['days_past_due', 'dpd', 'dias_mora', 'days_late'])
-    def classify_dpd_buckets(self, df: pd.DataFrame, dpd_col: str) -> pd.DataFrame:
-        """Classify days past due into standard buckets."""
-        result = df.copy()
+    @staticmethod
+    def _numeric_or_coerced(
+        values: pd.Series, col: str, step: str
+    ) -> Tuple[pd.Series, bool]:
+        """Return (numeric values, ok); non-numeric input is coerced and logged."""
+        if pd.api.types.is_numeric_dtype(values):
+            return values, True
+        logger.error(f"{step} failed: Column {col} is not numeric")
+        return pd.to_numeric(values, errors='coerce'), False
+
+    def _dpd_bucket_columns(self, df: pd.DataFrame, dpd_col: str) -> Dict[str, pd.Series]:
+        values, ok = self._numeric_or_coerced(df[dpd_col], dpd_col, "DPD classification")
+        if not ok:
+            return {dpd_col: values, 'dpd_bucket': pd.Series('Unknown', index=df.index)}
+        return {'dpd_bucket': bin_series(values, self.config.dpd_edges, self.config.dpd_labels)}
+
+    def _exposure_segment_columns(
+        self, df: pd.DataFrame, exposure_col: str
+    ) -> Dict[str, pd.Series]:
+        values, ok = self._numeric_or_coerced(
+            df[exposure_col], exposure_col, "Exposure segmentation"
+        )
+        if not ok:
+            return {exposure_col: values, 'exposure_segment': pd.Series('Unknown', index=df.index)}
+        segments = bin_series(
+            values, self.config.exposure_edges, self.config.exposure_labels, right=False
+        )
+        return {'exposure_segment': segments}
+
+    def _client_type_columns(
+        self,
+        df: pd.DataFrame,
+        customer_id_col: str = 'customer_id',
+        loan_count_col: str = 'loan_count',
+        last_active_col: str = 'last_active_date',
+        reference_date: Optional[date] = None
+    ) -> Dict[str, pd.Series]:
+        resolved = resolve_columns(df, {
+            'id': [customer_id_col, 'client_id', 'id_cliente'],
+            'count': [loan_count_col, 'num_loans', 'prestamos'],
+            'active': [last_active_col, 'last_active', 'ultima_actividad'],
+        })
+        id_col, count_col, active_col = resolved['id'], resolved['count'], resolved['active']
+        if not id_col:
+            logger.error(f"Customer ID column not found")
+            return {}
+
+        unknown = pd.Series('Unknown', index=df.index)
+
+        if not (count_col and active_col):
+            logger.warning("Missing columns for client type classification")
+            return {'client_type': unknown}
+
+        counts, ok = self._numeric_or_coerced(
+            df[count_col], count_col, "Client type classification"
+        )
+        if not ok:
+            return {count_col: counts, 'client_type': unknown}
+
+        columns: Dict[str, pd.Series] = {}
         try:
-            self.validate_numeric_columns(result, [dpd_col])
-            result['dpd_bucket'] = result[dpd_col].apply(Classification.dpd_bucket_rules)
-        except ValueError as e:
-            logger.error(f"DPD classification failed: {e}")
-            result['dpd_bucket'] = 'Unknown'
+            ref_date = pd.to_datetime(reference_date or datetime.now().date())
+            columns[active_col] = pd.to_datetime(df[active_col], errors='coerce')
+            columns['days_since_active'] = (ref_date - columns[active_col]).dt.days
+            # Same truncation and NaN->0 handling as the scalar client_type_rules.
+            loan_count = np.trunc(counts.to_numpy(dtype='float64', na_value=np.nan))
+            days = np.trunc(
+                columns['days_since_active'].to_numpy(dtype='float64', na_value=np.nan)
+            )
+            codes = np.select(
+                [
+                    np.nan_to_num(loan_count) == 1,
+                    np.nan_to_num(days) <= self.config.recurring_window_days,
+                ],
+                [0, 1],
+                default=2,
+            )
+            columns['client_type'] = pd.Series(
+                pd.Categorical.from_codes(codes, categories=list(CLIENT_TYPE_LABELS)),
+                index=df.index,
+            )
+        except (ValueError, TypeError) as e:
+            logger.error(f"Client type classification failed: {e}")
+            columns['client_type'] = unknown
+        return columns
+
+    def _line_utilization_columns(
+        self,
+        loan_df: pd.DataFrame,
+        credit_line_field: str = 'line_amount',
+        loan_amount_field: str = 'outstanding_balance',
+        converted: Optional[Dict[str, pd.Series]] = None
+    ) -> Dict[str, pd.Series]:
+        """
+        Utilization of each credit line; ``converted`` holds columns already
+        coerced to numbers, used in place of those in ``loan_df``.
+        """
+        resolved = resolve_columns(loan_df, {
+            'credit': [credit_line_field, 'credit_line', 'line_limit', 'limite_credito'],
+            'loan': [
+                loan_amount_field, 'outstanding_balance', 'olb', 'current_balance', 'loan_amount'
+            ],
+        })
+        credit_col, loan_col = resolved['credit'], resolved['loan']
+
+        if not credit_col or not loan_col:
+            logger.warning(f"Line utilization columns not found")
+            return {}
+
+        columns: Dict[str, pd.Series] = {}
+        numeric: Dict[str, pd.Series] = {}
+        for col in dict.fromkeys([credit_col, loan_col]):
+            values = (converted or {}).get(col, loan_df[col])
+            numeric[col], ok = self._numeric_or_coerced(values, col, "Line utilization")
+            if not ok:
+                columns[col] = numeric[col]
+
+        credit, loan = numeric[credit_col], numeric[loan_col]
+        utilization = np.where(credit > 0, loan / credit, np.nan).clip(0.0, 1.0)
+        columns['line_utilization'] = pd.Series(utilization, index=loan_df.index)
+        return columns
+
+    @staticmethod
+    def _with_columns(df: pd.DataFrame, columns: Dict[str, pd.Series]) -> pd.DataFrame:
+        result = df.copy()
+        for name, values in columns.items():
+            result[name] = values
         return result
 
-    @resolve_column(['outstanding_balance', 'balance', 'saldo', 'amount'])
+    @resolve_column(DPD_CANDIDATES)
+    def classify_dpd_buckets(self, df: pd.DataFrame, dpd_col: str) -> pd.DataFrame:
+        """Classify days past due into standard buckets."""
+        return self._with_columns(df, self._dpd_bucket_columns(df, dpd_col))
+
+    @resolve_column(EXPOSURE_CANDIDATES)
     def segment_clients_by_exposure(self, df: pd.DataFrame, exposure_col: str) -> pd.DataFrame:
         """Segment clients by exposure level."""
-        result = df.copy()
-        try:
-            self.validate_numeric_columns(result, [exposure_col])
-            result['exposure_segment'] = result[exposure_col].apply(Classification.exposure_segment_rules)
-        except ValueError as e:
-            logger.error(f"Exposure segmentation failed: {e}")
-            result['exposure_segment'] = 'Unknown'
-        return result
+        return self._with_columns(df, self._exposure_segment_columns(df, exposure_col))
 
     def classify_client_type(
         self,
@@ -129,37 +301,10 @@ class FinancialAnalyzer:
         reference_date: Optional[date] = None
     ) -> pd.DataFrame:
         """Classify client type: New, Recurring, or Recovered."""
-        result = df.copy()
-        id_col = find_column(result, [customer_id_col, 'client_id', 'id_cliente'])
-        
-        if not id_col:
-            logger.error(f"Customer ID column not found")
-            return result
-
-        count_col = find_column(result, [loan_count_col, 'num_loans', 'prestamos'])
-        active_col = find_column(result, [last_active_col, 'last_active', 'ultima_actividad'])
-
-        if count_col and active_col:
-            try:
-                self.validate_numeric_columns(result, [count_col])
-                ref_date = pd.to_datetime(reference_date or datetime.now().date())
-                result[active_col] = pd.to_datetime(result[active_col], errors='coerce')
-                result['days_since_active'] = (ref_date - result[active_col]).dt.days
-                result['client_type'] = result.apply(
-                    lambda row: Classification.client_type_rules(
-                        int(row[count_col]) if pd.notna(row[count_col]) else 0,
-                        int(row['days_since_active']) if pd.notna(row['days_since_active']) else 0
-                    ),
-                    axis=1
-                )
-            except (ValueError, TypeError) as e:
-                logger.error(f"Client type classification failed: {e}")
-                result['client_type'] = 'Unknown'
-        else:
-            logger.warning("Missing columns for client type classification")
-            result['client_type'] = 'Unknown'
-
-        return result
+        columns = self._client_type_columns(
+            df, customer_id_col, loan_count_col, last_active_col, reference_date
+        )
+        return self._with_columns(df, columns)
 
     def calculate_weighted_stats(
         self,
@@ -196,22 +341,8 @@ class FinancialAnalyzer:
         loan_amount_field: str = 'outstanding_balance'
     ) -> pd.DataFrame:
         """Calculate credit line utilization rate."""
-        result_df = loan_df.copy()
-        
-        credit_col = find_column(result_df, [credit_line_field, 'credit_line', 'line_limit', 'limite_credito'])
-        loan_col = find_column(result_df, [loan_amount_field, 'outstanding_balance', 'olb', 'current_balance', 'loan_amount'])
-        
-        if not credit_col or not loan_col:
-            logger.warning(f"Line utilization columns not found")
-            return result_df
-
-        result_df['line_utilization'] = np.where(
-            result_df[credit_col] > 0,
-            result_df[loan_col] / result_df[credit_col],
-            np.nan
-        ).clip(0.0, 1.0)
-        
-        return result_df
+        columns = self._line_utilization_columns(loan_df, credit_line_field, loan_amount_field)
+        return self._with_columns(loan_df, columns)
 
     def calculate_hhi(
         self,
@@ -220,8 +351,11 @@ class FinancialAnalyzer:
         exposure_field: str = 'outstanding_balance'
     ) -> float:
         """Calculate HHI (Herfindahl-Hirschman Index) for concentration."""
-        exp_col = find_column(loan_df, [exposure_field, 'balance', 'saldo', 'amount'])
-        id_col = find_column(loan_df, [customer_id_field, 'client_id', 'id_cliente'])
+        resolved = resolve_columns(loan_df, {
+            'exposure': [exposure_field, 'balance', 'saldo', 'amount'],
+            'id': [customer_id_field, 'client_id', 'id_cliente'],
+        })
+        exp_col, id_col = resolved['exposure'], resolved['id']
 
         if not exp_col or not id_col:
             return 0.0
@@ -236,23 +370,80 @@ class FinancialAnalyzer:
         hhi = (market_shares ** 2).sum()
         return hhi * 10000
 
-    def enrich_master_dataframe(self, df: pd.DataFrame, reference_date: Optional[date] = None) -> pd.DataFrame:
-        """Apply all feature engineering to master dataframe."""
-        result = df.copy()
+    def enrich_master_dataframe(
+        self,
+        df: pd.DataFrame,
+        reference_date: Optional[date] = None,
+        columns: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Apply all feature engineering to master dataframe.
 
-        result = self.classify_dpd_buckets(result)
-        result = self.segment_clients_by_exposure(result)
-        
-        if all(col in result.columns for col in ['customer_id', 'loan_count', 'last_active_date']):
-            result = self.classify_client_type(result, reference_date=reference_date)
+        Derived columns are collected first and attached with a single concat,
+        so the master frame is allocated once. ``columns`` restricts the
+        derived columns that are computed and returned (see ENRICHMENT_COLUMNS).
+        """
+        wanted = None if columns is None else set(columns)
+        if wanted is not None:
+            unknown = wanted.difference(ENRICHMENT_COLUMNS)
+            if unknown:
+                raise ValueError(f"Unknown enrichment columns: {sorted(unknown)}")
+            zscore_sources = {c[:-len('_zscore')] for c in wanted if c.endswith('_zscore')}
+        else:
+            zscore_sources = set(ZSCORE_METRICS)
+
+        def needed(*names: str) -> bool:
+            return wanted is None or any(name in wanted for name in names)
+
+        derived: Dict[str, pd.Series] = {}
+
+        def current(col: str) -> pd.Series:
+            return derived[col] if col in derived else df[col]
+
+        if needed('dpd_bucket') or zscore_sources & {'days_past_due'}:
+            dpd_col = find_column(df, DPD_CANDIDATES)
+            if dpd_col:
+                derived.update(self._dpd_bucket_columns(df, dpd_col))
+            else:
+                logger.warning(
+                    f"Column not found for classify_dpd_buckets, tried: {DPD_CANDIDATES}"
+                )
+
+        if needed('exposure_segment') or zscore_sources & {'outstanding_balance'}:
+            exposure_col = find_column(df, EXPOSURE_CANDIDATES)
+            if exposure_col:
+                derived.update(self._exposure_segment_columns(df, exposure_col))
+            else:
+                logger.warning(
+                    "Column not found for segment_clients_by_exposure, "
+                    f"tried: {EXPOSURE_CANDIDATES}"
+                )
+
+        if needed('client_type', 'days_since_active') and all(
+            col in df.columns for col in ['customer_id', 'loan_count', 'last_active_date']
+        ):
+            derived.update(self._client_type_columns(df, reference_date=reference_date))
 
-        result = self.calculate_line_utilization(result)
+        if needed('line_utilization') or 'line_utilization' in zscore_sources:
+            derived.update(self._line_utilization_columns(df, converted=derived))
 
-        key_metrics = ['apr', 'term', 'days_past_due', 'outstanding_balance', 'line_utilization']
-        for metric in key_metrics:
-            if metric in result.columns and pd.api.types.is_numeric_dtype(result[metric]):
-                std_dev = result[metric].std()
-                if std_dev > 0:
-                    result[f'{metric}_zscore'] = (result[metric] - result[metric].mean()) / std_dev
+        for metric in ZSCORE_METRICS:
+            if metric not in zscore_sources:
+                continue
+            if metric in derived or metric in df.columns:
+                values = current(metric)
+                if pd.api.types.is_numeric_dtype(values):
+                    std_dev = values.std()
+                    if std_dev > 0:
+                        derived[f'{metric}_zscore'] = (values - values.mean()) / std_dev
 
+        replaced = {name: values for name, values in derived.items() if name in df.columns}
+        added = {
+            name: values.array
+            for name, values in derived.items()
+            if name not in df.columns and (wanted is None or name in wanted)
+        }
+        result = pd.concat([df, pd.DataFrame(added, index=df.index)], axis=1)
+        for name, values in replaced.items():
+            result[name] = values.array
         return result
@@ -2,7 +2,7 @@ import logging
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
 
 import pandas as pd
 
@@ -14,9 +14,80 @@ from python.validation import (
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CHUNK_SIZE = 100_000
+MEASUREMENT_DATE_COLUMN = "measurement_date"
+# File suffix -> pyarrow.dataset format for the columnar input path.
+COLUMNAR_FORMATS: Dict[str, str] = {
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".arrow": "ipc",
+    ".feather": "ipc",
+    ".ipc": "ipc",
+}
+
+
+def is_columnar_file(path: Any) -> bool:
+    """True if ``path`` has a Parquet or Arrow IPC suffix."""
+    return Path(path).suffix.lower() in COLUMNAR_FORMATS
+
+
+def _date_bound(value: Any, arrow_type: Any) -> Any:
+    """Convert a measurement_date bound to a scalar comparable with ``arrow_type``."""
+    import pyarrow as pa
+
+    timestamp = pd.Timestamp(value)
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        # ISO 8601 strings order lexicographically.
+        return timestamp.strftime("%Y-%m-%d")
+    if pa.types.is_date(arrow_type):
+        return pa.scalar(timestamp.date(), type=arrow_type)
+    if pa.types.is_timestamp(arrow_type) and arrow_type.tz is not None:
+        timestamp = timestamp.tz_localize(arrow_type.tz) if timestamp.tzinfo is None else timestamp
+    return pa.scalar(timestamp.to_pydatetime(), type=arrow_type)
+
+
+def read_columnar(
+    file_path: Path,
+    columns: Optional[Sequence[str]] = None,
+    start_date: Optional[Any] = None,
+    end_date: Optional[Any] = None,
+) -> pd.DataFrame:
+    """
+    Read a Parquet or Arrow IPC file with column projection and an inclusive
+    measurement_date range of days pushed down to the reader.
+
+    Requested columns missing from the file are skipped; schema checks
+    report them downstream.
+    """
+    import pyarrow.dataset as ds
+
+    dataset = ds.dataset(str(file_path), format=COLUMNAR_FORMATS[file_path.suffix.lower()])
+    schema_names = dataset.schema.names
+    projection = None
+    if columns is not None:
+        projection = [col for col in dict.fromkeys(columns) if col in schema_names]
+
+    predicate = None
+    if start_date is not None or end_date is not None:
+        if MEASUREMENT_DATE_COLUMN not in schema_names:
+            raise ValueError(f"Cannot filter on missing column: {MEASUREMENT_DATE_COLUMN}")
+        field = ds.field(MEASUREMENT_DATE_COLUMN)
+        arrow_type = dataset.schema.field(MEASUREMENT_DATE_COLUMN).type
+        # Bounds are whole days: any time of day on end_date is still in range.
+        if start_date is not None:
+            start = pd.Timestamp(start_date).normalize()
+            predicate = field >= _date_bound(start, arrow_type)
+        if end_date is not None:
+            next_day = pd.Timestamp(end_date).normalize() + pd.Timedelta(days=1)
+            upper = field < _date_bound(next_day, arrow_type)
+            predicate = upper if predicate is None else predicate & upper
+
+    table = dataset.to_table(columns=projection, filter=predicate)
+    return table.to_pandas(date_as_object=False)
+
 
 class CascadeIngestion:
-    """CSV ingestion with validation, error tracking, and audit logging."""
+    """CSV and Parquet/Arrow ingestion with validation, error tracking, and audit logging."""
 
     def __init__(self, data_dir: str = ".", strict_validation: bool = False):
         """
@@ -194,6 +265,215 @@ class CascadeIngestion:
                 str(e)
             )
 
+    def iter_csv_chunks(
+        self, filename: str, chunksize: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Ingest a CSV file in bounded chunks, yielding each validated chunk.
+
+        Every chunk is schema-checked and tagged with the ingest run metadata
+        before it is yielded, so peak memory is bounded by ``chunksize`` rather
+        than the size of the file. Row totals accumulate in the ingest summary
+        as chunks pass validation; a rejected chunk's size is logged with its
+        error. Errors stop the stream; check self.errors for details.
+        """
+        if chunksize <= 0:
+            raise ValueError("chunksize must be a positive integer")
+
+        file_path = self.data_dir / filename
+        self._log_step(
+            "ingestion:start",
+            "Starting chunked CSV ingestion",
+            file=str(file_path),
+            chunksize=chunksize,
+        )
+
+        if not file_path.exists():
+            self._handle_ingestion_error(
+                file_path,
+                filename,
+                "missing",
+                f"No such file or directory: {filename}"
+            )
+            return
+
+        rows = 0
+        chunks = 0
+        try:
+            for chunk in pd.read_csv(file_path, chunksize=chunksize):
+                rejected = len(chunk)
+                if chunks == 0 and not self._validate_schema(chunk, file_path):
+                    return
+
+                assert_dataframe_schema(
+                    chunk,
+                    required_columns=NUMERIC_COLUMNS,
+                    numeric_columns=NUMERIC_COLUMNS,
+                    stage="ingestion",
+                )
+
+                self._update_summary(len(chunk), filename)
+                chunk["_ingest_run_id"] = self.run_id
+                chunk["_ingest_timestamp"] = self.timestamp
+                rows += len(chunk)
+                chunks += 1
+                self._log_step(
+                    "ingestion:chunk",
+                    "CSV chunk ingested",
+                    file=str(file_path),
+                    chunk=chunks,
+                    rows=len(chunk),
+                )
+                yield chunk
+
+        except pd.errors.EmptyDataError:
+            self._handle_ingestion_error(
+                file_path,
+                filename,
+                "empty",
+                "File is empty or malformed"
+            )
+            return
+        except AssertionError as e:
+            self._handle_ingestion_error(
+                file_path,
+                filename,
+                "invalid_schema",
+                str(e),
+                rows=rows,
+                chunk=chunks + 1,
+                rejected_rows=rejected,
+            )
+            return
+        except Exception as e:
+            self._handle_ingestion_error(
+                file_path,
+                filename,
+                "error",
+                str(e),
+                rows=rows,
+            )
+            return
+
+        self._record_raw_file(file_path, rows=rows, status="ingested")
+        self._log_step(
+            "ingestion:completed",
+            "Chunked CSV ingestion complete",
+            file=str(file_path),
+            rows=rows,
+            chunks=chunks,
+        )
+
+    def ingest_csv_streaming(
+        self,
+        filename: str,
+        sink: Callable[[pd.DataFrame], None],
+        chunksize: int = DEFAULT_CHUNK_SIZE,
+    ) -> int:
+        """
+        Stream a CSV file chunk by chunk into ``sink``.
+
+        Returns the number of rows handed to the sink.
+        """
+        rows = 0
+        for chunk in self.iter_csv_chunks(filename, chunksize=chunksize):
+            sink(chunk)
+            rows += len(chunk)
+        return rows
+
+    def ingest_columnar(
+        self,
+        filename: str,
+        columns: Optional[Sequence[str]] = (),
+        start_date: Optional[Any] = None,
+        end_date: Optional[Any] = None,
+    ) -> pd.DataFrame:
+        """
+        Ingest a Parquet or Arrow IPC file with validation.
+
+        Only NUMERIC_COLUMNS, measurement_date and the extra ``columns`` are
+        read; pass ``columns=None`` to read every column. ``start_date`` and
+        ``end_date`` bound measurement_date (inclusive) at read time. Values
+        keep their stored types, so no CSV parsing or dtype inference runs.
+
+        Returns empty DataFrame on error; check self.errors for details.
+        """
+        file_path = self.data_dir / filename
+        self._log_step(
+            "ingestion:start",
+            "Starting columnar ingestion",
+            file=str(file_path),
+            start_date=start_date,
+            end_date=end_date,
+        )
+
+        if not file_path.exists():
+            return self._handle_ingestion_error(
+                file_path,
+                filename,
+                "missing",
+                f"No such file or directory: {filename}"
+            )
+        if not is_columnar_file(file_path):
+            return self._handle_ingestion_error(
+                file_path,
+                filename,
+                "error",
+                f"Unsupported columnar format: {file_path.suffix}"
+            )
+
+        projection = None
+        if columns is not None:
+            projection = [*NUMERIC_COLUMNS, MEASUREMENT_DATE_COLUMN, *columns]
+
+        try:
+            df = read_columnar(file_path, projection, start_date, end_date)
+            self._log_step(
+                "ingestion:file_read",
+                "Columnar file read",
+                file=str(file_path),
+                rows=len(df),
+                columns=len(df.columns),
+            )
+            self._update_summary(len(df), filename)
+
+            if not self._validate_schema(df, file_path):
+                return pd.DataFrame()
+
+            assert_dataframe_schema(
+                df,
+                required_columns=NUMERIC_COLUMNS,
+                numeric_columns=NUMERIC_COLUMNS,
+                stage="ingestion",
+            )
+
+            df["_ingest_run_id"] = self.run_id
+            df["_ingest_timestamp"] = self.timestamp
+            self._record_raw_file(file_path, rows=len(df), status="ingested")
+            self._log_step(
+                "ingestion:completed",
+                "Columnar ingestion complete",
+                file=str(file_path),
+                rows=len(df),
+            )
+            return df
+
+        except AssertionError as e:
+            return self._handle_ingestion_error(
+                file_path,
+                filename,
+                "invalid_schema",
+                str(e),
+                rows=len(df) if 'df' in locals() else 0
+            )
+        except Exception as e:
+            return self._handle_ingestion_error(
+                file_path,
+                filename,
+                "error",
+                str(e)
+            )
+
     def ingest_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         """Ingest DataFrame directly."""
         self._log_step("ingestion:inmemory", "In-memory ingestion", rows=len(df))
@@ -1,17 +1,58 @@
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Tuple, Callable
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Callable
 
+import numpy as np
 import pandas as pd
 
-from python.kpis.collection_rate import calculate_collection_rate
-from python.kpis.par_30 import calculate_par_30
-from python.kpis.par_90 import calculate_par_90
+from python.kpis.collection_rate import calculate_collection_rate, collection_rate_from_sums
+from python.kpis.par_30 import calculate_par_30, par_30_from_sums
+from python.kpis.par_90 import calculate_par_90, par_90_from_sums
 from python.kpis.portfolio_health import calculate_portfolio_health
-from python.validation import NUMERIC_COLUMNS, validate_dataframe
+from python.validation import (
+    NUMERIC_COLUMNS,
+    safe_numeric,
+    validate_dataframe,
+    validate_numeric_bounds,
+)
 
 logger = logging.getLogger(__name__)
 
+# (frame, codes, portfolio count, columns, non-negative columns) -> (sums, invalid)
+PortfolioColumnSums = Callable[
+    [pd.DataFrame, np.ndarray, int, List[str], List[str]],
+    Tuple[Dict[str, np.ndarray], Dict[int, str]],
+]
+
+
+def portfolio_column_sums(
+    df: pd.DataFrame,
+    codes: np.ndarray,
+    size: int,
+    columns: List[str],
+    non_negative: List[str],
+) -> Tuple[Dict[str, np.ndarray], Dict[int, str]]:
+    """
+    Sum ``columns`` per portfolio code with ``np.bincount``.
+
+    Rows with a negative code are skipped. Also returns, for each portfolio
+    with a negative or missing amount in a ``non_negative`` column, the
+    first such column in ``columns`` order.
+    """
+    keyed = codes >= 0
+    codes = codes[keyed]
+    sums: Dict[str, np.ndarray] = {}
+    invalid: Dict[int, str] = {}
+    for col in columns:
+        values = safe_numeric(df[col]).to_numpy(dtype="float64")[keyed]
+        nan = np.isnan(values)
+        if col in non_negative:
+            bad = np.bincount(codes, weights=nan | (values < 0), minlength=size)
+            for code in np.flatnonzero(bad):
+                invalid.setdefault(int(code), col)
+        sums[col] = np.bincount(codes, weights=np.where(nan, 0.0, values), minlength=size)
+    return sums, invalid
+
 
 class MetricDefinition:
     """Define a KPI metric configuration."""
@@ -21,12 +62,16 @@ class MetricDefinition:
         name: str,
         calculator: Callable,
         required_columns: List[str],
-        denominator_field: str = None
+        denominator_field: str = None,
+        sums_calculator: Optional[Callable[[Mapping[str, float]], float]] = None,
+        non_negative_columns: Optional[List[str]] = None,
     ):
         self.name = name
         self.calculator = calculator
         self.required_columns = required_columns
         self.denominator_field = denominator_field
+        self.sums_calculator = sums_calculator
+        self.non_negative_columns = non_negative_columns or []
 
 
 class KPIEngine:
@@ -37,19 +82,23 @@ class KPIEngine:
             'PAR30',
             calculate_par_30,
             ['dpd_30_60_usd', 'dpd_60_90_usd', 'dpd_90_plus_usd', 'total_receivable_usd'],
-            'total_receivable_usd'
+            'total_receivable_usd',
+            par_30_from_sums,
+            ['total_receivable_usd'],
         ),
         'PAR90': MetricDefinition(
             'PAR90',
             calculate_par_90,
             ['dpd_90_plus_usd', 'total_receivable_usd'],
-            'total_receivable_usd'
+            'total_receivable_usd',
+            par_90_from_sums,
         ),
         'CollectionRate': MetricDefinition(
             'CollectionRate',
             calculate_collection_rate,
             ['cash_available_usd', 'total_eligible_usd'],
-            'total_eligible_usd'
+            'total_eligible_usd',
+            collection_rate_from_sums,
         ),
     }
 
@@ -121,10 +170,15 @@ class KPIEngine:
             return False
         return True
 
-    def _warn_if_zero(self, metric: str, denominator_name: str, denominator_value: float) -> None:
+    def _warn_if_zero(
+        self, metric: str, denominator_name: str, denominator_value: float, **details: Any
+    ) -> None:
         if denominator_value == 0:
             self._record_warning(
-                metric, f"{denominator_name} is zero; returning 0", denominator=denominator_name
+                metric,
+                f"{denominator_name} is zero; returning 0",
+                denominator=denominator_name,
+                **details,
             )
 
     def calculate_metric(self, metric_key: str) -> Tuple[float, Dict[str, Any]]:
@@ -140,12 +194,250 @@ class KPIEngine:
         val = float(metric_def.calculator(self.df))
 
         if val == 0.0 and metric_def.denominator_field:
-            denom_value = float(self.df.get(metric_def.denominator_field, pd.Series()).sum())
+            denom_value = float(
+                safe_numeric(self.df.get(metric_def.denominator_field, pd.Series())).sum()
+            )
             self._warn_if_zero(metric_def.name, metric_def.denominator_field, denom_value)
 
         ctx = self._log_metric(metric_def.name, val)
         return val, ctx
 
+    def _column_sums(
+        self, columns: List[str], non_negative: List[str]
+    ) -> Dict[str, float]:
+        """Coerce each column once and return its sum."""
+        sums: Dict[str, float] = {}
+        for col in columns:
+            values = safe_numeric(self.df[col])
+            # Same coercion and bounds check as the per-metric calculators.
+            if col in non_negative and not validate_numeric_bounds(
+                values.to_frame(col), [col]
+            )[f"{col}_non_negative"]:
+                raise ValueError(f"Negative or missing amounts detected in column: {col}")
+            sums[col] = values.sum()
+        return sums
+
+    def calculate_metrics(
+        self, metric_keys: Optional[List[str]] = None
+    ) -> Dict[str, Tuple[float, Dict[str, Any]]]:
+        """
+        Calculate several KPIs in one fused pass.
+
+        The columns needed by all requested metrics are coerced and summed once,
+        and every KPI is derived from those sums. Values match calculate_metric.
+        """
+        keys = list(metric_keys) if metric_keys is not None else list(self.METRICS)
+        unknown = [key for key in keys if key not in self.METRICS]
+        if unknown:
+            raise ValueError(f"Unknown metric: {unknown[0]}")
+
+        results: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        ready: List[MetricDefinition] = []
+        for key in keys:
+            metric_def = self.METRICS[key]
+            if metric_def.sums_calculator is None:
+                results[key] = self.calculate_metric(key)
+            elif self._ensure_columns(metric_def.name, metric_def.required_columns):
+                ready.append(metric_def)
+            else:
+                results[key] = (0.0, {"metric": metric_def.name, "status": "error", "value": 0.0})
+
+        columns: List[str] = []
+        non_negative: List[str] = []
+        for metric_def in ready:
+            columns.extend(c for c in metric_def.required_columns if c not in columns)
+            non_negative.extend(
+                c for c in metric_def.non_negative_columns if c not in non_negative
+            )
+
+        empty = self.df is None or self.df.shape[0] == 0
+        sums = {col: 0.0 for col in columns} if empty else self._column_sums(columns, non_negative)
+
+        for metric_def in ready:
+            val = float(metric_def.sums_calculator(sums))
+            if val == 0.0 and metric_def.denominator_field:
+                self._warn_if_zero(
+                    metric_def.name,
+                    metric_def.denominator_field,
+                    float(sums[metric_def.denominator_field]),
+                )
+            ctx = self._log_metric(metric_def.name, val, method="fused")
+            results[metric_def.name] = (val, ctx)
+
+        return {key: results[key] for key in keys}
+
+    def calculate_metrics_from_partitions(
+        self,
+        partitions: Mapping[str, Mapping[str, float]],
+        metric_keys: Optional[List[str]] = None,
+    ) -> Dict[str, Tuple[float, Dict[str, Any]]]:
+        """
+        Calculate KPIs from per-partition column sums, as kept for incremental runs.
+
+        The checks of calculate_metrics apply to the sums: a metric whose
+        columns are missing from any partition is recorded as an error, and a
+        negative or missing non-negative sum raises ValueError. Portfolio
+        values are derived from the totals over all partitions.
+        """
+        keys = list(metric_keys) if metric_keys is not None else list(self.METRICS)
+        unknown = [key for key in keys if key not in self.METRICS]
+        if unknown:
+            raise ValueError(f"Unknown metric: {unknown[0]}")
+        unsummable = [key for key in keys if self.METRICS[key].sums_calculator is None]
+        if unsummable:
+            raise ValueError(f"Metric {unsummable[0]} cannot be computed from sums")
+
+        results: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        for key in keys:
+            metric_def = self.METRICS[key]
+            missing = sorted(
+                {
+                    col
+                    for partition_sums in partitions.values()
+                    for col in metric_def.required_columns
+                    if col not in partition_sums
+                }
+            )
+            if missing:
+                self._record_error(
+                    metric_def.name,
+                    f"Missing required columns for {metric_def.name}: {missing}",
+                    missing=missing,
+                )
+                ctx = self._log_metric(
+                    metric_def.name, 0.0, method="incremental", status="error", missing=missing
+                )
+                results[key] = (0.0, ctx)
+                continue
+
+            for partition, partition_sums in partitions.items():
+                for col in metric_def.non_negative_columns:
+                    value = partition_sums[col]
+                    if value is None or np.isnan(value) or value < 0:
+                        raise ValueError(
+                            f"Negative or missing amounts detected in column: {col} "
+                            f"(partition {partition})"
+                        )
+
+            sums = {
+                col: float(sum(partition_sums[col] for partition_sums in partitions.values()))
+                for col in metric_def.required_columns
+            }
+            val = float(metric_def.sums_calculator(sums))
+            if val == 0.0 and metric_def.denominator_field:
+                self._warn_if_zero(
+                    metric_def.name,
+                    metric_def.denominator_field,
+                    sums[metric_def.denominator_field],
+                )
+            ctx = self._log_metric(
+                metric_def.name, val, method="incremental", partitions=len(partitions)
+            )
+            results[key] = (val, ctx)
+
+        return results
+
+    def calculate_metrics_by(
+        self,
+        portfolio_col: str,
+        metric_keys: Optional[List[str]] = None,
+        column_sums: Optional[PortfolioColumnSums] = None,
+    ) -> pd.DataFrame:
+        """
+        Calculate KPIs for every value of ``portfolio_col`` (e.g. lender or
+        facility) in one grouped pass.
+
+        Each input column is coerced once and summed per portfolio by
+        ``column_sums`` (``portfolio_column_sums`` unless given, e.g. by
+        ParallelKPIExecutor); every metric is then derived from its
+        portfolio's sums as in calculate_metrics, plus HealthScore when PAR30
+        and CollectionRate are both requested. Returns a tidy frame with one
+        row per portfolio and metric; failed metrics have status ``error``
+        and a NaN value. Audit entries, warnings and errors carry the
+        portfolio value under ``portfolio_col``.
+        """
+        if portfolio_col not in self.df.columns:
+            raise ValueError(f"Portfolio column '{portfolio_col}' not found")
+        keys = list(metric_keys) if metric_keys is not None else list(self.METRICS)
+        unknown = [key for key in keys if key not in self.METRICS]
+        if unknown:
+            raise ValueError(f"Unknown metric: {unknown[0]}")
+        unsummable = [key for key in keys if self.METRICS[key].sums_calculator is None]
+        if unsummable:
+            raise ValueError(f"Metric {unsummable[0]} cannot be computed from sums")
+
+        codes, portfolios = pd.factorize(self.df[portfolio_col], sort=True)
+        unkeyed = int((codes < 0).sum())
+        if unkeyed:
+            self._record_warning(
+                "batch",
+                f"{unkeyed} rows without {portfolio_col} skipped",
+                portfolio_col=portfolio_col,
+            )
+
+        ready: List[MetricDefinition] = []
+        missing: List[MetricDefinition] = []
+        for key in keys:
+            metric_def = self.METRICS[key]
+            if self._ensure_columns(metric_def.name, metric_def.required_columns):
+                ready.append(metric_def)
+            else:
+                missing.append(metric_def)
+
+        columns: List[str] = []
+        for metric_def in ready:
+            columns.extend(c for c in metric_def.required_columns if c not in columns)
+        non_negative = [
+            col for col in columns if any(col in m.non_negative_columns for m in ready)
+        ]
+        sums, invalid = (column_sums or portfolio_column_sums)(
+            self.df, codes, len(portfolios), columns, non_negative
+        )
+
+        rows: List[Dict[str, Any]] = []
+        for code, portfolio in enumerate(portfolios):
+            ctx = {portfolio_col: portfolio}
+            values: Dict[str, float] = {}
+            if code in invalid:
+                self._record_error(
+                    "batch",
+                    f"Negative or missing amounts detected in column: {invalid[code]}",
+                    **ctx,
+                )
+            for metric_def in missing:
+                rows.append(
+                    {**ctx, "metric": metric_def.name, "value": np.nan, "status": "error"}
+                )
+            for metric_def in ready:
+                if code in invalid:
+                    self._log_metric(
+                        metric_def.name, np.nan, method="batch", status="error", **ctx
+                    )
+                    rows.append(
+                        {**ctx, "metric": metric_def.name, "value": np.nan, "status": "error"}
+                    )
+                    continue
+                portfolio_sums = {
+                    col: float(sums[col][code]) for col in metric_def.required_columns
+                }
+                val = float(metric_def.sums_calculator(portfolio_sums))
+                if val == 0.0 and metric_def.denominator_field:
+                    self._warn_if_zero(
+                        metric_def.name,
+                        metric_def.denominator_field,
+                        portfolio_sums[metric_def.denominator_field],
+                        **ctx,
+                    )
+                self._log_metric(metric_def.name, val, method="batch", **ctx)
+                values[metric_def.name] = val
+                rows.append({**ctx, "metric": metric_def.name, "value": val, "status": "ok"})
+            if "PAR30" in values and "CollectionRate" in values:
+                health = calculate_portfolio_health(values["PAR30"], values["CollectionRate"])
+                self._log_metric("HealthScore", health, method="batch", **ctx)
+                rows.append({**ctx, "metric": "HealthScore", "value": health, "status": "ok"})
+
+        return pd.DataFrame(rows, columns=[portfolio_col, "metric", "value", "status"])
+
     def calculate_par_30(self) -> Tuple[float, Dict[str, Any]]:
         """Calculate PAR30 metric."""
         return self.calculate_metric('PAR30')
@@ -1,3 +1,5 @@
+from typing import Mapping
+
 import numpy as np
 import pandas as pd
 
@@ -9,10 +11,17 @@ def calculate_collection_rate(df: pd.DataFrame) -> np.float64:
     if df is None or df.shape[0] == 0:
         return np.float64(0.0)
 
-    cash = safe_numeric(df.get("cash_available_usd", pd.Series())).sum()
-    eligible = safe_numeric(df.get("total_eligible_usd", pd.Series())).sum()
+    sums = {
+        col: safe_numeric(df.get(col, pd.Series())).sum()
+        for col in ("cash_available_usd", "total_eligible_usd")
+    }
+    return collection_rate_from_sums(sums)
+
 
+def collection_rate_from_sums(sums: Mapping[str, float]) -> np.float64:
+    """Collection rate from pre-computed column sums (see ``calculate_collection_rate``)."""
+    eligible = sums["total_eligible_usd"]
     if eligible == 0:
         return np.float64(0.0)
 
-    return np.float64((cash / eligible) * 100.0)
+    return np.float64((sums["cash_available_usd"] / eligible) * 100.0)
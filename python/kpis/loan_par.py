@@ -0,0 +1,149 @@
+"""Portfolio-at-risk series built from loan-level monthly balance snapshots."""
+
+from pathlib import Path
+from typing import Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from python.validation import safe_numeric
+
+# Lower DPD bound of each bucket after the first; PAR_k balances are dpd >= k.
+PAR_THRESHOLDS = (7, 30, 60, 90)
+DPD_BUCKET_COLUMNS: List[str] = [
+    "dpd_0_7_usd",
+    "dpd_7_30_usd",
+    "dpd_30_60_usd",
+    "dpd_60_90_usd",
+    "dpd_90_plus_usd",
+]
+PAR_BALANCE_COLUMNS: List[str] = [f"par_{k}_balance_usd" for k in PAR_THRESHOLDS]
+PAR_PCT_COLUMNS: List[str] = [f"par{k}_pct" for k in PAR_THRESHOLDS]
+SNAPSHOT_COLUMNS: List[str] = [
+    "reporting_date",
+    "dpd",
+    "is_writeoff",
+    "outstanding_balance_usd",
+    "writeoff_outstanding_balance_usd",
+]
+# Additive per-date columns; everything else is derived from these.
+SUM_COLUMNS: List[str] = [
+    "loans_count",
+    "active_loans",
+    "writeoff_count",
+    "total_receivable_usd",
+    *DPD_BUCKET_COLUMNS,
+    "writeoff_balance_usd",
+]
+
+
+def _writeoff_flags(values: pd.Series) -> np.ndarray:
+    if pd.api.types.is_bool_dtype(values):
+        return values.to_numpy(dtype=bool)
+    return values.astype(str).str.strip().str.lower().isin({"true", "1", "yes"}).to_numpy()
+
+
+def par_balance_sums(snapshots: pd.DataFrame) -> pd.DataFrame:
+    """
+    Additive PAR sums per reporting_date (index ``measurement_date``).
+
+    Each loan-month lands in one DPD bucket by ``np.searchsorted`` and all
+    per-date totals come from ``np.bincount`` over (date, bucket) codes, so
+    the cost is linear in the number of snapshots with no Python loops.
+    """
+    missing = [col for col in SNAPSHOT_COLUMNS if col not in snapshots.columns]
+    if missing:
+        raise ValueError(f"Missing required columns for PAR series: {', '.join(missing)}")
+
+    dates = pd.to_datetime(snapshots["reporting_date"], errors="coerce")
+    date_codes, date_index = pd.factorize(dates, sort=True)
+    valid = date_codes >= 0
+    date_codes = date_codes[valid]
+    n_dates = len(date_index)
+
+    dpd = safe_numeric(snapshots["dpd"]).fillna(0).to_numpy(dtype="float64")[valid]
+    balance = (
+        safe_numeric(snapshots["outstanding_balance_usd"])
+        .fillna(0)
+        .to_numpy(dtype="float64")[valid]
+    )
+    writeoff_balance = (
+        safe_numeric(snapshots["writeoff_outstanding_balance_usd"])
+        .fillna(0)
+        .to_numpy(dtype="float64")[valid]
+    )
+    writeoff = _writeoff_flags(snapshots["is_writeoff"])[valid]
+
+    n_buckets = len(DPD_BUCKET_COLUMNS)
+    buckets = np.searchsorted(PAR_THRESHOLDS, dpd, side="right")
+    bucket_sums = np.bincount(
+        date_codes * n_buckets + buckets, weights=balance, minlength=n_dates * n_buckets
+    ).reshape(n_dates, n_buckets)
+
+    sums = pd.DataFrame(bucket_sums, columns=DPD_BUCKET_COLUMNS)
+    sums.insert(0, "total_receivable_usd", bucket_sums.sum(axis=1))
+    sums.insert(0, "writeoff_count", np.bincount(date_codes, weights=writeoff, minlength=n_dates))
+    sums.insert(0, "active_loans", np.bincount(date_codes, weights=balance > 0, minlength=n_dates))
+    sums.insert(0, "loans_count", np.bincount(date_codes, minlength=n_dates))
+    sums["writeoff_balance_usd"] = np.bincount(
+        date_codes, weights=writeoff_balance, minlength=n_dates
+    )
+    sums.index = pd.Index(date_index.strftime("%Y-%m-%d"), name="measurement_date")
+    return sums[SUM_COLUMNS]
+
+
+def finalize_par_series(sums: pd.DataFrame) -> pd.DataFrame:
+    """Derive PAR balances and percentages from ``par_balance_sums`` output."""
+    series = sums.sort_index().copy()
+    for col in ("loans_count", "active_loans", "writeoff_count"):
+        series[col] = series[col].astype("int64")
+
+    buckets = series[DPD_BUCKET_COLUMNS].to_numpy()
+    # PAR_k is every bucket at or above threshold k: reverse cumulative sums.
+    at_or_above = np.cumsum(buckets[:, ::-1], axis=1)[:, ::-1]
+    total = series["total_receivable_usd"].to_numpy()
+    for offset, (balance_col, pct_col) in enumerate(zip(PAR_BALANCE_COLUMNS, PAR_PCT_COLUMNS)):
+        balance = at_or_above[:, offset + 1]
+        series[balance_col] = balance
+        with np.errstate(divide="ignore", invalid="ignore"):
+            series[pct_col] = np.where(total > 0, balance / total * 100.0, 0.0)
+
+    series = series.reset_index()
+    series.insert(
+        0,
+        "period",
+        pd.PeriodIndex(pd.to_datetime(series["measurement_date"]), freq="Q").astype(str),
+    )
+    return series
+
+
+def build_par_series(snapshots: pd.DataFrame) -> pd.DataFrame:
+    """
+    Build the per-reporting_date PAR7/30/60/90, write-off and balance series.
+
+    The output carries the ``dpd_*_usd`` and ``total_receivable_usd`` columns
+    that ``KPIEngine`` sums for PAR30/PAR90, one row per measurement_date.
+    """
+    return finalize_par_series(par_balance_sums(snapshots))
+
+
+def combine_par_sums(partials: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    """Add up ``par_balance_sums`` results computed over separate chunks."""
+    frames = [frame for frame in partials if not frame.empty]
+    if not frames:
+        return pd.DataFrame(columns=SUM_COLUMNS, index=pd.Index([], name="measurement_date"))
+    return pd.concat(frames).groupby(level=0).sum()
+
+
+def load_par_series(path: Union[str, Path], chunksize: Optional[int] = None) -> pd.DataFrame:
+    """
+    Read a loan_par_balances CSV and return its PAR series.
+
+    Only the snapshot columns are parsed. With ``chunksize``, the file is
+    reduced chunk by chunk so memory stays bounded on very large books.
+    """
+    read_kwargs = {"usecols": SNAPSHOT_COLUMNS, "dtype": {"dpd": "float64"}}
+    if chunksize is None:
+        return build_par_series(pd.read_csv(path, **read_kwargs))
+    chunks = pd.read_csv(path, chunksize=chunksize, **read_kwargs)
+    return finalize_par_series(combine_par_sums(par_balance_sums(chunk) for chunk in chunks))
@@ -1,3 +1,5 @@
+from typing import Mapping
+
 import numpy as np
 import pandas as pd
 
@@ -12,10 +14,17 @@ def calculate_par_90(df: pd.DataFrame) -> np.float64:
     if df is None or df.shape[0] == 0:
         return np.float64(0.0)
 
-    dpd = safe_numeric(df.get("dpd_90_plus_usd", pd.Series())).sum()
-    total_receivable = safe_numeric(df.get("total_receivable_usd", pd.Series())).sum()
+    sums = {
+        col: safe_numeric(df.get(col, pd.Series())).sum()
+        for col in ("dpd_90_plus_usd", "total_receivable_usd")
+    }
+    return par_90_from_sums(sums)
+
 
+def par_90_from_sums(sums: Mapping[str, float]) -> np.float64:
+    """PAR 90 from pre-computed column sums (see ``calculate_par_90``)."""
+    total_receivable = sums["total_receivable_usd"]
     if total_receivable == 0:
         return np.float64(0.0)
 
-    return np.float64((dpd / total_receivable) * 100.0)
+    return np.float64((sums["dpd_90_plus_usd"] / total_receivable) * 100.0)
@@ -0,0 +1,235 @@
+"""Month-over-month DPD roll rates from loan-level balance snapshots."""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from python.financial_analysis import DPD_BUCKET_EDGES, DPD_BUCKET_LABELS, bin_series
+from python.validation import safe_numeric
+
+WRITE_OFF_STATE = "Write-off"
+EXITED_STATE = "Exited"
+ROLL_STATES: List[str] = [*DPD_BUCKET_LABELS, WRITE_OFF_STATE]
+# Destination states also include loans missing from the next snapshot.
+ROLL_TARGETS: List[str] = [*ROLL_STATES, EXITED_STATE]
+WEIGHTS = ("count", "balance")
+
+
+def snapshot_states(
+    snapshots: pd.DataFrame,
+    dpd_col: str = "dpd",
+    writeoff_col: str = "is_writeoff",
+) -> np.ndarray:
+    """
+    State code per row: the ``Classification.dpd_bucket_rules`` bucket, or
+    ``WRITE_OFF_STATE`` for written-off loans.
+    """
+    dpd = safe_numeric(snapshots[dpd_col]).fillna(0)
+    codes = bin_series(dpd, DPD_BUCKET_EDGES, DPD_BUCKET_LABELS).cat.codes.to_numpy()
+    if writeoff_col in snapshots.columns:
+        flags = snapshots[writeoff_col]
+        if not pd.api.types.is_bool_dtype(flags):
+            flags = flags.astype(str).str.strip().str.lower().isin({"true", "1", "yes"})
+        codes = np.where(flags.to_numpy(dtype=bool), ROLL_STATES.index(WRITE_OFF_STATE), codes)
+    return codes.astype(np.int64)
+
+
+def snapshot_balances(snapshots: pd.DataFrame) -> np.ndarray:
+    """Exposure per row: outstanding plus written-off balance (USD)."""
+    balance = safe_numeric(snapshots["outstanding_balance_usd"]).fillna(0)
+    if "writeoff_outstanding_balance_usd" in snapshots.columns:
+        balance = balance + safe_numeric(snapshots["writeoff_outstanding_balance_usd"]).fillna(0)
+    return balance.to_numpy(dtype="float64")
+
+
+class RollRateMatrix:
+    """
+    Transition counts and balances between DPD states for each pair of
+    consecutive reporting dates.
+
+    ``counts[t, i, j]`` (and ``balances``) hold loans in state ``ROLL_STATES[i]``
+    on ``dates[t]`` that are in ``ROLL_TARGETS[j]`` on ``dates[t + 1]``; the
+    balance weight is the exposure on ``dates[t]``.
+    """
+
+    def __init__(self) -> None:
+        self.dates: List[str] = []
+        self.counts = np.zeros((0, len(ROLL_STATES), len(ROLL_TARGETS)))
+        self.balances = np.zeros_like(self.counts)
+        # Sorted loan ids with their state and exposure on the latest date.
+        self._last: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+
+    @classmethod
+    def from_snapshots(
+        cls,
+        snapshots: pd.DataFrame,
+        loan_col: str = "loan_id_raw",
+        date_col: str = "reporting_date",
+    ) -> "RollRateMatrix":
+        """
+        Build the matrix from a full snapshot history.
+
+        Rows are ordered by (loan, date) with ``np.lexsort``; each row is paired
+        with the next one for the same loan on the next reporting date, and
+        transitions are accumulated with ``np.bincount`` instead of a merge.
+        """
+        matrix = cls()
+        if snapshots.empty:
+            return matrix
+
+        dates = pd.to_datetime(snapshots[date_col])
+        date_codes, date_index = pd.factorize(dates, sort=True)
+        loan_codes, loan_index = pd.factorize(snapshots[loan_col], sort=True)
+        states = snapshot_states(snapshots)
+        balances = snapshot_balances(snapshots)
+
+        order = np.lexsort((date_codes, loan_codes))
+        loan_sorted = loan_codes[order]
+        date_sorted = date_codes[order]
+        state_sorted = states[order]
+
+        n_dates = len(date_index)
+        targets = np.full(len(order), ROLL_TARGETS.index(EXITED_STATE), dtype=np.int64)
+        follows = (loan_sorted[1:] == loan_sorted[:-1]) & (date_sorted[1:] == date_sorted[:-1] + 1)
+        targets[:-1][follows] = state_sorted[1:][follows]
+        # The latest date has no next snapshot to roll into.
+        has_next = date_sorted < n_dates - 1
+
+        matrix.dates = list(date_index.strftime("%Y-%m-%d"))
+        matrix.counts, matrix.balances = _accumulate(
+            date_sorted[has_next],
+            state_sorted[has_next],
+            targets[has_next],
+            balances[order][has_next],
+            n_dates - 1,
+        )
+
+        latest = date_sorted == n_dates - 1
+        matrix._last = (
+            np.asarray(loan_index)[loan_sorted[latest]],
+            state_sorted[latest],
+            balances[order][latest],
+        )
+        return matrix
+
+    def update(
+        self,
+        snapshots: pd.DataFrame,
+        loan_col: str = "loan_id_raw",
+        date_col: str = "reporting_date",
+    ) -> None:
+        """
+        Append transitions for reporting dates newer than the latest one seen.
+
+        Only the previous month's loan states are kept, so a new month costs
+        one sort and ``np.searchsorted`` over that month's loans.
+        """
+        dates = pd.to_datetime(snapshots[date_col])
+        for date in sorted(dates.unique()):
+            label = pd.Timestamp(date).strftime("%Y-%m-%d")
+            if self.dates and label <= self.dates[-1]:
+                raise ValueError(f"Reporting date {label} is not after {self.dates[-1]}")
+            month = snapshots.loc[(dates == date).to_numpy()]
+            self._append_month(
+                label,
+                month[loan_col].to_numpy(),
+                snapshot_states(month),
+                snapshot_balances(month),
+            )
+
+    def _append_month(
+        self, label: str, loan_ids: np.ndarray, states: np.ndarray, balances: np.ndarray
+    ) -> None:
+        order = np.argsort(loan_ids, kind="stable")
+        loan_ids, states, balances = loan_ids[order], states[order], balances[order]
+
+        if self._last is not None:
+            prev_ids, prev_states, prev_balances = self._last
+            targets = np.full(len(prev_ids), ROLL_TARGETS.index(EXITED_STATE), dtype=np.int64)
+            if len(loan_ids):
+                pos = np.searchsorted(loan_ids, prev_ids).clip(max=len(loan_ids) - 1)
+                matched = loan_ids[pos] == prev_ids
+                targets[matched] = states[pos[matched]]
+            counts, balance_sums = _accumulate(
+                np.zeros(len(prev_ids), dtype=np.int64), prev_states, targets, prev_balances, 1
+            )
+            self.counts = np.concatenate([self.counts, counts])
+            self.balances = np.concatenate([self.balances, balance_sums])
+
+        self.dates.append(label)
+        self._last = (loan_ids, states, balances)
+
+    def matrix(
+        self,
+        weight: str = "count",
+        normalize: bool = True,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Transition matrix summed over from-dates in ``[start, end]``.
+
+        With ``normalize`` each row is divided by its total, giving roll rates.
+        """
+        if weight not in WEIGHTS:
+            raise ValueError(f"weight must be one of {WEIGHTS}")
+        values = self.counts if weight == "count" else self.balances
+        from_dates = np.asarray(self.dates[:-1])
+        mask = np.ones(len(from_dates), dtype=bool)
+        if start is not None:
+            mask &= from_dates >= pd.Timestamp(start).strftime("%Y-%m-%d")
+        if end is not None:
+            mask &= from_dates <= pd.Timestamp(end).strftime("%Y-%m-%d")
+
+        totals = values[mask].sum(axis=0)
+        if normalize:
+            row_sums = totals.sum(axis=1, keepdims=True)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                totals = np.where(row_sums > 0, totals / row_sums, 0.0)
+        return pd.DataFrame(
+            totals,
+            index=pd.Index(ROLL_STATES, name="from_state"),
+            columns=pd.Index(ROLL_TARGETS, name="to_state"),
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        """Non-zero transitions in long form, one row per (from_date, from, to)."""
+        t, i, j = np.nonzero(self.counts)
+        return pd.DataFrame(
+            {
+                "from_date": np.asarray(self.dates)[t] if len(t) else [],
+                "to_date": np.asarray(self.dates)[t + 1] if len(t) else [],
+                "from_state": np.asarray(ROLL_STATES)[i],
+                "to_state": np.asarray(ROLL_TARGETS)[j],
+                "count": self.counts[t, i, j].astype(np.int64),
+                "balance_usd": self.balances[t, i, j],
+            }
+        )
+
+
+def _accumulate(
+    periods: np.ndarray,
+    from_states: np.ndarray,
+    to_states: np.ndarray,
+    weights: np.ndarray,
+    n_periods: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Count and balance cubes of shape (n_periods, states, targets)."""
+    n_from, n_to = len(ROLL_STATES), len(ROLL_TARGETS)
+    cells = (periods * n_from + from_states) * n_to + to_states
+    size = n_periods * n_from * n_to
+    shape = (n_periods, n_from, n_to)
+    counts = np.bincount(cells, minlength=size).astype("float64").reshape(shape)
+    balances = np.bincount(cells, weights=weights, minlength=size).reshape(shape)
+    return counts, balances
+
+
+def roll_rates(
+    snapshots: pd.DataFrame,
+    weight: str = "count",
+    loan_col: str = "loan_id_raw",
+    date_col: str = "reporting_date",
+) -> pd.DataFrame:
+    """Portfolio roll-rate matrix across every pair of consecutive reporting dates."""
+    return RollRateMatrix.from_snapshots(snapshots, loan_col, date_col).matrix(weight)
@@ -0,0 +1,279 @@
+"""Vintage curves by months-on-book from loan disbursements and balance snapshots."""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from python.validation import safe_numeric
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DPD = 90
+PAR30_DPD = 30
+# Additive per-cohort arrays indexed by months-on-book.
+CURVE_SERIES = ("default_principal_usd", "writeoff_usd", "par30_usd", "outstanding_usd")
+MANIFEST_FILE = "_manifest.json"
+
+
+def _flags(values: pd.Series) -> np.ndarray:
+    if pd.api.types.is_bool_dtype(values):
+        return values.to_numpy(dtype=bool)
+    return values.astype(str).str.strip().str.lower().isin({"true", "1", "yes"}).to_numpy()
+
+
+def _month_ordinals(values: pd.Series) -> np.ndarray:
+    return pd.to_datetime(values).dt.to_period("M").array.asi8
+
+
+class VintageCurves:
+    """Dense cohort x months-on-book curves."""
+
+    def __init__(
+        self,
+        cohorts: Dict[str, Dict[str, Any]],
+        loans: pd.DataFrame,
+        last_reporting_date: Optional[str],
+    ):
+        by_cohort = loans.groupby("cohort")["disburse_principal"].agg(["sum", "size"])
+        names = sorted(set(by_cohort.index) | set(cohorts))
+        max_mob = max((len(state["outstanding_usd"]) for state in cohorts.values()), default=0)
+        shape = (len(names), max_mob)
+        dense = {name: np.zeros(shape) for name in CURVE_SERIES}
+        for row, cohort in enumerate(names):
+            for name in CURVE_SERIES:
+                values = cohorts.get(cohort, {}).get(name, [])
+                dense[name][row, : len(values)] = values
+
+        principal = by_cohort["sum"].reindex(names, fill_value=0.0).to_numpy(dtype="float64")
+        # Months each cohort has been observable as of the latest snapshot.
+        if last_reporting_date is None:
+            age = np.full(len(names), -1)
+        else:
+            latest = pd.Period(last_reporting_date, freq="M").ordinal
+            age = latest - pd.PeriodIndex(names, freq="M").asi8
+        unobserved = np.arange(max_mob)[None, :] > age[:, None]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            denom = principal[:, None]
+            default_rate = np.where(
+                denom > 0, np.cumsum(dense["default_principal_usd"], 1) / denom, 0.0
+            )
+            writeoff_rate = np.where(denom > 0, np.cumsum(dense["writeoff_usd"], 1) / denom, 0.0)
+            outstanding = dense["outstanding_usd"]
+            par30 = np.where(outstanding > 0, dense["par30_usd"] / outstanding, 0.0)
+
+        def frame(values: np.ndarray) -> pd.DataFrame:
+            return pd.DataFrame(
+                np.where(unobserved, np.nan, values),
+                index=pd.Index(names, name="cohort"),
+                columns=pd.RangeIndex(max_mob, name="mob"),
+            )
+
+        self.cohort_principal = pd.Series(principal, index=pd.Index(names, name="cohort"))
+        self.cohort_loans = by_cohort["size"].reindex(names, fill_value=0)
+        self.cumulative_default_rate = frame(default_rate)
+        self.cumulative_writeoff_rate = frame(writeoff_rate)
+        self.par30 = frame(par30)
+        self.last_reporting_date = last_reporting_date
+
+    def to_frame(self) -> pd.DataFrame:
+        """Long form: one row per observed (cohort, mob)."""
+        long = pd.concat(
+            {
+                "cumulative_default_rate": self.cumulative_default_rate.stack(),
+                "cumulative_writeoff_rate": self.cumulative_writeoff_rate.stack(),
+                "par30": self.par30.stack(),
+            },
+            axis=1,
+        )
+        return long.reset_index()
+
+
+class VintageCache:
+    """Per-cohort JSON cache of additive curve arrays and defaulted loan ids."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+
+    def _cohort_file(self, cohort: str) -> Path:
+        return self.path / f"cohort={cohort}.json"
+
+    def load(self) -> Dict[str, Any]:
+        manifest = self.path / MANIFEST_FILE
+        if not manifest.exists():
+            return {"last_reporting_date": None, "cohorts": {}}
+        with manifest.open("r", encoding="utf-8") as handle:
+            state = json.load(handle)
+        cohorts = {}
+        for cohort in state.get("cohorts", []):
+            with self._cohort_file(cohort).open("r", encoding="utf-8") as handle:
+                cohorts[cohort] = json.load(handle)
+        return {"last_reporting_date": state.get("last_reporting_date"), "cohorts": cohorts}
+
+    def save(
+        self,
+        cohorts: Dict[str, Dict[str, Any]],
+        touched: List[str],
+        last_reporting_date: Optional[str],
+    ) -> None:
+        """Rewrite only the touched cohort files, then the manifest."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        for cohort in touched:
+            _write_json(self._cohort_file(cohort), cohorts[cohort])
+        _write_json(
+            self.path / MANIFEST_FILE,
+            {"last_reporting_date": last_reporting_date, "cohorts": sorted(cohorts)},
+        )
+        logger.info("Saved vintage cache %s (%d cohorts updated)", self.path, len(touched))
+
+
+def _write_json(path: Path, payload: Dict[str, Any]) -> None:
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as handle:
+        json.dump(payload, handle)
+    tmp_path.replace(path)
+
+
+def prepare_loans(loans: pd.DataFrame) -> pd.DataFrame:
+    """Loan id, disbursement cohort (YYYY-MM) and disbursed principal."""
+    missing = [
+        col
+        for col in ("loan_id", "disburse_date", "disburse_principal")
+        if col not in loans.columns
+    ]
+    if missing:
+        raise ValueError(f"Missing required loan columns: {', '.join(missing)}")
+    disbursed = pd.to_datetime(loans["disburse_date"], errors="coerce")
+    valid = disbursed.notna().to_numpy()
+    ordinals = disbursed[valid].dt.to_period("M").array.asi8
+    # Format each distinct month once rather than every loan's date.
+    codes, months = pd.factorize(ordinals)
+    labels = pd.PeriodIndex.from_ordinals(months, freq="M").strftime("%Y-%m").to_numpy()
+    return pd.DataFrame(
+        {
+            "loan_id": loans["loan_id"].to_numpy()[valid],
+            "cohort": labels[codes],
+            "cohort_ordinal": ordinals,
+            "disburse_principal": safe_numeric(loans["disburse_principal"])
+            .fillna(0)
+            .to_numpy()[valid],
+        }
+    )
+
+
+def _cohort_increments(
+    loans: pd.DataFrame,
+    snapshots: pd.DataFrame,
+    cohorts: Dict[str, Dict[str, Any]],
+    loan_col: str,
+) -> List[str]:
+    """Fold ``snapshots`` into ``cohorts`` in place; return the cohorts touched."""
+    if snapshots.empty:
+        return []
+
+    positions = pd.Index(loans["loan_id"]).get_indexer(snapshots[loan_col])
+    mob = (
+        _month_ordinals(snapshots["reporting_date"]) - loans["cohort_ordinal"].to_numpy()[positions]
+    )
+    keep = (positions >= 0) & (mob >= 0)
+    positions, mob = positions[keep], mob[keep]
+    rows = snapshots.loc[keep]
+
+    cohort_codes, cohort_names = pd.factorize(loans["cohort"].to_numpy()[positions], sort=True)
+    n_mob = int(mob.max()) + 1 if len(mob) else 0
+    cells = cohort_codes * n_mob + mob
+    size = len(cohort_names) * n_mob
+
+    dpd = safe_numeric(rows["dpd"]).fillna(0).to_numpy(dtype="float64")
+    writeoff = _flags(rows["is_writeoff"])
+    outstanding = safe_numeric(rows["outstanding_balance_usd"]).fillna(0).to_numpy(dtype="float64")
+    loan_ids = loans["loan_id"].to_numpy()[positions]
+    order = np.argsort(mob, kind="stable")
+
+    def first_events(mask: np.ndarray, seen_key: str) -> np.ndarray:
+        """Rows holding each loan's first event, skipping loans already cached."""
+        candidates = order[mask[order]]
+        _, first = np.unique(loan_ids[candidates], return_index=True)
+        rows_first = candidates[first]
+        seen = set()
+        for cohort in cohort_names:
+            seen.update(cohorts.get(cohort, {}).get(seen_key, []))
+        if seen:
+            rows_first = rows_first[~np.isin(loan_ids[rows_first], list(seen))]
+        return rows_first
+
+    defaults = first_events((dpd >= DEFAULT_DPD) | writeoff, "defaulted")
+    writeoffs = first_events(writeoff, "written_off")
+    writeoff_amount = (
+        safe_numeric(rows["writeoff_outstanding_balance_usd"]).fillna(0).to_numpy(dtype="float64")
+        if "writeoff_outstanding_balance_usd" in rows.columns
+        else np.zeros(len(rows))
+    )
+    principal = loans["disburse_principal"].to_numpy(dtype="float64")[positions]
+
+    increments = {
+        "default_principal_usd": np.bincount(
+            cells[defaults], weights=principal[defaults], minlength=size
+        ),
+        "writeoff_usd": np.bincount(
+            cells[writeoffs], weights=writeoff_amount[writeoffs], minlength=size
+        ),
+        "par30_usd": np.bincount(
+            cells, weights=np.where(dpd >= PAR30_DPD, outstanding, 0.0), minlength=size
+        ),
+        "outstanding_usd": np.bincount(cells, weights=outstanding, minlength=size),
+    }
+    increments = {
+        name: values.reshape(len(cohort_names), n_mob) for name, values in increments.items()
+    }
+
+    for code, cohort in enumerate(cohort_names):
+        state = cohorts.setdefault(
+            cohort, {**{name: [] for name in CURVE_SERIES}, "defaulted": [], "written_off": []}
+        )
+        for name in CURVE_SERIES:
+            current = np.zeros(max(len(state[name]), n_mob))
+            current[: len(state[name])] = state[name]
+            current[:n_mob] += increments[name][code]
+            state[name] = current.tolist()
+        state["defaulted"] += loan_ids[defaults[cohort_codes[defaults] == code]].tolist()
+        state["written_off"] += loan_ids[writeoffs[cohort_codes[writeoffs] == code]].tolist()
+    return list(cohort_names)
+
+
+def build_vintage_curves(
+    loans: pd.DataFrame,
+    snapshots: pd.DataFrame,
+    cache_dir: Optional[Union[str, Path]] = None,
+    loan_col: str = "loan_id_raw",
+) -> VintageCurves:
+    """
+    Build cumulative default, cumulative write-off and PAR30 curves by
+    months-on-book for each disbursement-month cohort.
+
+    Snapshots are joined to ``loans`` by id with a hash index lookup, and
+    every cohort x MOB cell is accumulated with ``np.bincount``. With
+    ``cache_dir``, per-cohort sums are kept on disk and only snapshots newer
+    than the cached reporting date are processed. A loan defaults the first
+    month it is ``DEFAULT_DPD``+ days past due or written off.
+    """
+    prepared = prepare_loans(loans)
+    cache = VintageCache(cache_dir) if cache_dir is not None else None
+    state = cache.load() if cache else {"last_reporting_date": None, "cohorts": {}}
+
+    reporting = pd.to_datetime(snapshots["reporting_date"])
+    last_date = state["last_reporting_date"]
+    if last_date is not None:
+        fresh = (reporting > pd.Timestamp(last_date)).to_numpy()
+        snapshots, reporting = snapshots.loc[fresh], reporting[fresh]
+
+    touched = _cohort_increments(prepared, snapshots, state["cohorts"], loan_col)
+    if len(reporting):
+        last_date = reporting.max().strftime("%Y-%m-%d")
+    if cache is not None:
+        cache.save(state["cohorts"], touched, last_date)
+    return VintageCurves(state["cohorts"], prepared, last_date)
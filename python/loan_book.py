@@ -0,0 +1,283 @@
+"""Compact, typed in-memory store for the loan-level tables with join indexes."""
+
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+TABLE_FILES: Dict[str, str] = {
+    "loans": "loans.csv",
+    "customers": "customers.csv",
+    "schedules": "schedules.csv",
+    "transactions": "transactions.csv",
+    "loan_par_balances": "loan_par_balances.csv",
+}
+# Source id column -> surrogate key column, per key space.
+LOAN_ID_COLUMNS = ("loan_id", "loan_id_raw")
+CUSTOMER_ID_COLUMNS = ("customer_id",)
+LOAN_KEY = "loan_key"
+CUSTOMER_KEY = "customer_key"
+
+# Explicit column types per table; unlisted columns are inferred and compacted.
+TABLE_SCHEMAS: Dict[str, Dict[str, str]] = {
+    "loans": {
+        "maturity_date": "date",
+        "application_date": "date",
+        "disburse_date": "date",
+        "pledge_date": "date",
+        "product_type": "category",
+        "loan_grade": "category",
+        "lender": "category",
+        "facility": "category",
+        "frequency": "category",
+        "currency": "category",
+        "loan_status": "category",
+        "amount_buckets": "category",
+        "company": "category",
+        "term_buckets": "category",
+        "location_state_province": "category",
+        "term": "integer",
+        "dpd": "integer",
+        "loan_counts": "integer",
+    },
+    "customers": {
+        "customer_type": "category",
+        "currency": "category",
+        "gender": "category",
+        "birth_date": "date",
+        "channel_type": "category",
+        "dependents": "integer",
+        "geography_city": "category",
+        "geography_state": "category",
+        "geography_country": "category",
+    },
+    "schedules": {"date_due": "date", "currency": "category"},
+    "transactions": {
+        "transaction_type": "category",
+        "date_paid": "date",
+        "currency": "category",
+    },
+    "loan_par_balances": {
+        "reporting_date": "date",
+        "dpd_date": "date",
+        "dpd": "integer",
+        "is_writeoff": "bool",
+        "writeoff_type": "category",
+        "loan_ccy": "category",
+    },
+}
+# Largest float32 rounding error accepted for a column (amounts are in cents).
+FLOAT32_TOLERANCE = 0.005
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+
+def _dates_from_category(values: pd.Series) -> pd.Series:
+    """Parse each distinct date string once and broadcast by category code."""
+    categorical = values.astype("category")
+    parsed = pd.to_datetime(categorical.cat.categories, errors="coerce", format="ISO8601")
+    dates = parsed.take(categorical.cat.codes.to_numpy(), allow_fill=True, fill_value=pd.NaT)
+    return pd.Series(dates.as_unit("ns"), index=values.index, name=values.name)
+
+
+def compact_float(values: pd.Series, tolerance: float = FLOAT32_TOLERANCE) -> pd.Series:
+    """float32 when every value round-trips within ``tolerance``, else float64."""
+    as64 = pd.to_numeric(values, errors="coerce").astype("float64")
+    as32 = as64.astype("float32")
+    error = np.abs(as32.to_numpy(dtype="float64") - as64.to_numpy())
+    if np.nanmax(error, initial=0.0) <= tolerance:
+        return as32
+    return as64
+
+
+def compact_column(values: pd.Series, kind: Optional[str] = None) -> pd.Series:
+    """Convert one column to its compact dtype."""
+    if kind == "date":
+        return _dates_from_category(values)
+    if kind == "category":
+        return values.astype("category")
+    if kind == "bool":
+        if pd.api.types.is_bool_dtype(values):
+            return values
+        return values.astype(str).str.strip().str.lower().isin({"true", "1", "yes"})
+    if kind == "integer":
+        numeric = pd.to_numeric(values, errors="coerce")
+        if numeric.isna().any():
+            return compact_float(numeric)
+        return pd.to_numeric(numeric, downcast="integer")
+    if pd.api.types.is_float_dtype(values):
+        return compact_float(values)
+    if pd.api.types.is_integer_dtype(values):
+        return pd.to_numeric(values, downcast="integer")
+    if values.dtype == object and len(values):
+        if values.nunique(dropna=True) / len(values) <= CATEGORY_MAX_UNIQUE_RATIO:
+            return values.astype("category")
+    return values
+
+
+def _surrogate_keys(values: pd.Series, dictionary: pd.Index) -> Tuple[np.ndarray, pd.Index]:
+    """Integer keys for ``values``, extending ``dictionary`` with unseen ids."""
+    keys = dictionary.get_indexer(values)
+    unseen = keys < 0
+    if unseen.any():
+        extra = pd.Index(pd.unique(values[unseen].dropna()))
+        dictionary = dictionary.append(extra)
+        keys[unseen] = dictionary.get_indexer(values[unseen])
+    return keys.astype(np.int32), dictionary
+
+
+class JoinIndex:
+    """
+    CSR-style index from surrogate key to the row positions of a table.
+
+    Rows are grouped by key once (stable argsort + bincount offsets), so the
+    rows of any set of keys are gathered without hashing or merging.
+    """
+
+    def __init__(self, keys: np.ndarray, n_keys: int):
+        valid = keys >= 0
+        self.order = np.flatnonzero(valid)[np.argsort(keys[valid], kind="stable")]
+        counts = np.bincount(keys[valid], minlength=n_keys)
+        self.offsets = np.concatenate([[0], np.cumsum(counts)])
+
+    def positions(self, keys: Iterable[int]) -> np.ndarray:
+        """Row positions for ``keys``, grouped by key in the order given."""
+        keys = np.asarray(keys, dtype=np.int64)
+        starts, ends = self.offsets[keys], self.offsets[keys + 1]
+        lengths = ends - starts
+        base = np.repeat(starts - np.concatenate([[0], np.cumsum(lengths)[:-1]]), lengths)
+        return self.order[base + np.arange(lengths.sum())]
+
+    def counts(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+
+class LoanBook:
+    """
+    Loan-level tables with integer surrogate keys instead of id strings,
+    categorical text, compact numerics, and per-table join indexes.
+
+    ``loan_key`` is the row position in ``loans`` for loans present there
+    (likewise ``customer_key`` for ``customers``), so loan or customer
+    attributes are attached to any table with a positional take.
+    """
+
+    def __init__(self, tables: Dict[str, pd.DataFrame], loan_ids: pd.Index, customer_ids: pd.Index):
+        self.tables = tables
+        self.loan_ids = loan_ids
+        self.customer_ids = customer_ids
+        self._join_indexes: Dict[Tuple[str, str], JoinIndex] = {}
+
+    @classmethod
+    def load(
+        cls, data_dir: Union[str, Path] = ".", tables: Optional[Iterable[str]] = None
+    ) -> "LoanBook":
+        """Read the loan-level CSVs from ``data_dir`` with compact dtypes."""
+        data_dir = Path(data_dir)
+        frames = {}
+        for name in tables or TABLE_FILES:
+            path = data_dir / TABLE_FILES[name]
+            if not path.exists():
+                logger.warning("Loan book table %s not found at %s", name, path)
+                continue
+            schema = TABLE_SCHEMAS.get(name, {})
+            header = pd.read_csv(path, nrows=0).columns
+            # Text columns are parsed straight into categoricals.
+            dtypes = {
+                col: "category"
+                for col in header
+                if schema.get(col) in ("category", "date")
+                or col in LOAN_ID_COLUMNS + CUSTOMER_ID_COLUMNS
+            }
+            frames[name] = pd.read_csv(path, dtype=dtypes)
+        return cls.from_frames(frames)
+
+    @classmethod
+    def from_frames(cls, frames: Dict[str, pd.DataFrame]) -> "LoanBook":
+        """Build the store from already-loaded frames."""
+        loan_ids = pd.Index([], dtype=object)
+        customer_ids = pd.Index([], dtype=object)
+        if "loans" in frames:
+            loan_ids = pd.Index(pd.unique(frames["loans"]["loan_id"].astype(object)))
+        if "customers" in frames:
+            customer_ids = pd.Index(pd.unique(frames["customers"]["customer_id"].astype(object)))
+
+        tables = {}
+        for name, frame in frames.items():
+            schema = TABLE_SCHEMAS.get(name, {})
+            columns: Dict[str, pd.Series] = {}
+            for col in frame.columns:
+                values = frame[col]
+                if col in LOAN_ID_COLUMNS and LOAN_KEY not in columns:
+                    keys, loan_ids = _surrogate_keys(values.astype(object), loan_ids)
+                    columns[LOAN_KEY] = pd.Series(keys, index=frame.index)
+                elif col in CUSTOMER_ID_COLUMNS:
+                    keys, customer_ids = _surrogate_keys(values.astype(object), customer_ids)
+                    columns[CUSTOMER_KEY] = pd.Series(keys, index=frame.index)
+                else:
+                    columns[col] = compact_column(values, schema.get(col))
+            tables[name] = pd.DataFrame(columns).reset_index(drop=True)
+        return cls(tables, loan_ids, customer_ids)
+
+    def __getitem__(self, name: str) -> pd.DataFrame:
+        return self.tables[name]
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Deep memory per table in bytes, including the id dictionaries."""
+        usage = {
+            name: int(frame.memory_usage(deep=True).sum()) for name, frame in self.tables.items()
+        }
+        usage["_dictionaries"] = int(
+            self.loan_ids.memory_usage(deep=True) + self.customer_ids.memory_usage(deep=True)
+        )
+        return usage
+
+    def join_index(self, table: str, key: str = LOAN_KEY) -> JoinIndex:
+        """Cached key -> rows index for ``table``."""
+        if (table, key) not in self._join_indexes:
+            n_keys = len(self.loan_ids) if key == LOAN_KEY else len(self.customer_ids)
+            keys = self.tables[table][key].to_numpy(dtype=np.int64)
+            self._join_indexes[(table, key)] = JoinIndex(keys, n_keys)
+        return self._join_indexes[(table, key)]
+
+    def loan_keys(self, loan_ids: Iterable) -> np.ndarray:
+        """Surrogate keys for loan ids (-1 when unknown)."""
+        return self.loan_ids.get_indexer(list(loan_ids))
+
+    def rows_for_loans(self, table: str, loan_ids: Iterable) -> pd.DataFrame:
+        """All rows of ``table`` for the given loan ids."""
+        keys = self.loan_keys(loan_ids)
+        positions = self.join_index(table).positions(keys[keys >= 0])
+        return self.tables[table].iloc[positions]
+
+    def attach(
+        self, table: str, columns: List[str], source: str = "loans", key: str = LOAN_KEY
+    ) -> pd.DataFrame:
+        """
+        ``table`` with ``columns`` from ``source`` (loans or customers)
+        attached by positional take on the surrogate key.
+        """
+        target = self.tables[table]
+        source_frame = self.tables[source]
+        # First source row per key; keys are row positions unless ids repeat.
+        source_keys = source_frame[key].to_numpy()
+        source_rows = np.full(len(self.loan_ids if key == LOAN_KEY else self.customer_ids), -1)
+        source_rows[source_keys[::-1]] = np.arange(len(source_keys))[::-1]
+
+        keys = target[key].to_numpy()
+        rows = np.where(keys >= 0, source_rows[keys.clip(min=0)], -1)
+        found = rows >= 0
+        attached = {}
+        for col in columns:
+            values = source_frame[col].take(np.where(found, rows, 0)).reset_index(drop=True)
+            attached[col] = values if found.all() else values.where(found)
+        return pd.concat([target, pd.DataFrame(attached, index=target.index)], axis=1)
+
+    def decode_loan_ids(self, keys: Iterable[int]) -> np.ndarray:
+        return self.loan_ids.to_numpy()[np.asarray(keys)]
+
+    def decode_customer_ids(self, keys: Iterable[int]) -> np.ndarray:
+        return self.customer_ids.to_numpy()[np.asarray(keys)]
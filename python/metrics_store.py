@@ -0,0 +1,340 @@
+"""Partitioned Parquet dataset of KPI rows across pipeline runs."""
+
+import fcntl
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+import pandas as pd
+
+from python.ingestion import MEASUREMENT_DATE_COLUMN
+
+logger = logging.getLogger(__name__)
+
+RUN_ID_COLUMN = "run_id"
+NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+COMPACTED_PREFIX = "compacted-"
+# Parquet schema metadata key listing the file versions a compacted file replaces.
+COMPACTED_FROM_KEY = b"compacted_from"
+LOCK_NAME = ".compact.lock"
+
+# (file name, size, mtime_ns): identifies one version of a partition file.
+FileVersion = Tuple[str, int, int]
+
+
+def _file_version(path: Path) -> Optional[FileVersion]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return (path.name, stat.st_size, stat.st_mtime_ns)
+
+
+def _compacted_from(path: Path) -> Set[FileVersion]:
+    import pyarrow.parquet as pq
+
+    try:
+        metadata = pq.read_schema(path).metadata or {}
+    except FileNotFoundError:
+        return set()
+    return {tuple(version) for version in json.loads(metadata.get(COMPACTED_FROM_KEY, b"[]"))}
+
+
+def _visible_files(part: Path) -> Tuple[List[Path], List[Tuple[Path, FileVersion]]]:
+    """
+    Split a partition's files into those readers see and leftovers already
+    merged into a compacted file, each with the version that was merged.
+    """
+    paths = sorted(part.glob("*.parquet"))
+    merged: Set[FileVersion] = set()
+    for path in paths:
+        if path.name.startswith(COMPACTED_PREFIX):
+            merged |= _compacted_from(path)
+    visible: List[Path] = []
+    leftovers: List[Tuple[Path, FileVersion]] = []
+    for path in paths:
+        version = _file_version(path)
+        if version is None:
+            continue
+        if version in merged:
+            leftovers.append((path, version))
+        else:
+            visible.append(path)
+    return visible, leftovers
+
+
+def _unlink_if_unchanged(path: Path, version: FileVersion) -> bool:
+    """Remove ``path`` unless it was rewritten since ``version`` was taken."""
+    if _file_version(path) != version:
+        return False
+    path.unlink()
+    return True
+
+
+class _PartitionLock:
+    """Non-blocking exclusive lock on a partition; released when the process exits."""
+
+    def __init__(self, part: Path):
+        self.path = part / LOCK_NAME
+        self._fd: Optional[int] = None
+
+    def acquire(self) -> bool:
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        self._fd = fd
+        return True
+
+    def release(self) -> None:
+        if self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+
+
+def _partition_values(df: pd.DataFrame) -> pd.Series:
+    """ISO measurement_date per row; rows without a valid date share the null partition."""
+    if MEASUREMENT_DATE_COLUMN not in df.columns:
+        return pd.Series(NULL_PARTITION, index=df.index)
+    dates = pd.to_datetime(df[MEASUREMENT_DATE_COLUMN], errors="coerce")
+    return dates.dt.strftime("%Y-%m-%d").fillna(NULL_PARTITION)
+
+
+def _to_table(df: pd.DataFrame) -> Any:
+    """Arrow table with every string column dictionary-encoded with int32 indices."""
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    dictionary = pa.dictionary(pa.int32(), pa.string())
+    for index, field in enumerate(table.schema):
+        if pa.types.is_string(field.type) or pa.types.is_large_string(field.type):
+            table = table.set_column(
+                index, field.name, table.column(index).cast(pa.string()).cast(dictionary)
+            )
+        elif pa.types.is_dictionary(field.type) and pa.types.is_string(field.type.value_type):
+            table = table.set_column(index, field.name, table.column(index).cast(dictionary))
+    return table
+
+
+def _write_table(table: Any, path: Path) -> None:
+    import pyarrow.parquet as pq
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    pq.write_table(table, tmp_path)
+    tmp_path.replace(path)
+
+
+class MetricsStore:
+    """
+    KPI rows of every run in one Parquet dataset under ``root``.
+
+    Rows are partitioned hive-style by measurement date
+    (``measurement_date=YYYY-MM-DD/``) and each run writes one file per
+    date named after the run, with the run id kept as a column so
+    ``compact`` can merge runs without losing it. String columns are
+    dictionary-encoded. Pipeline run ids are unique; appending an existing
+    run id again overwrites its file in each date it writes. That file also
+    wins over the run's previously compacted rows in the same date: ``read``
+    hides those rows and ``compact`` drops them.
+
+    A compacted file records the version (name, size, mtime) of every file
+    it merged, and readers skip those versions. Rows therefore never appear
+    twice while ``compact`` is removing the merged files or after it
+    crashed part way. A run file rewritten during compaction no longer
+    matches and is kept. ``compact`` holds a ``flock`` per partition, so
+    concurrent compactions skip partitions another process is merging;
+    appends and reads need no lock.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def _partition_dirs(self) -> List[Path]:
+        if not self.root.exists():
+            return []
+        return sorted(
+            path
+            for path in self.root.iterdir()
+            if path.is_dir() and path.name.startswith(f"{MEASUREMENT_DATE_COLUMN}=")
+        )
+
+    def files(self) -> List[Path]:
+        """Files readers see: every partition file not merged into a compacted file."""
+        return [path for part in self._partition_dirs() for path in _visible_files(part)[0]]
+
+    def append(self, df: pd.DataFrame, run_id: str) -> Dict[str, Path]:
+        """Write ``df`` as run ``run_id``; return ``partition -> file`` for each date."""
+        keys = _partition_values(df)
+        frame = df.drop(columns=[MEASUREMENT_DATE_COLUMN], errors="ignore")
+        frame = frame.assign(**{RUN_ID_COLUMN: run_id})
+        written: Dict[str, Path] = {}
+        for key, positions in keys.groupby(keys.to_numpy(), sort=True).indices.items():
+            partition = f"{MEASUREMENT_DATE_COLUMN}={key}"
+            path = self.root / partition / f"{run_id}.parquet"
+            _write_table(_to_table(frame.iloc[positions]), path)
+            written[partition] = path
+        logger.info(
+            "Appended %d KPI rows for run %s in %d partitions", len(df), run_id, len(written)
+        )
+        return written
+
+    def _dataset(self, paths: List[Path]) -> Any:
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+
+        partitioning = ds.HivePartitioning(
+            pa.schema([(MEASUREMENT_DATE_COLUMN, pa.string())]), null_fallback=NULL_PARTITION
+        )
+        return ds.dataset(
+            [str(path) for path in paths],
+            format="parquet",
+            partitioning=partitioning,
+            partition_base_dir=str(self.root),
+        )
+
+    def _read_files(
+        self, paths: List[Path], predicate: Any, columns: Optional[Sequence[str]]
+    ) -> Any:
+        dataset = self._dataset(paths)
+        projection = None
+        if columns is not None:
+            wanted = [MEASUREMENT_DATE_COLUMN, RUN_ID_COLUMN, *columns]
+            projection = [col for col in dict.fromkeys(wanted) if col in dataset.schema.names]
+        return dataset.to_table(columns=projection, filter=predicate)
+
+    def _superseded_filter(self, compacted: Dict[str, List[Path]], runs: List[Path]) -> Any:
+        """
+        Filter keeping compacted rows unless their run has its own file in
+        the same date partition; ``None`` when no such run exists.
+        """
+        import pyarrow.dataset as ds
+
+        keep = None
+        for part in compacted:
+            run_ids = [path.stem for path in runs if path.parent.name == part]
+            if not run_ids:
+                continue
+            value = part.split("=", 1)[1]
+            field = ds.field(MEASUREMENT_DATE_COLUMN)
+            in_part = field.is_null() if value == NULL_PARTITION else field == value
+            hidden = ~(in_part & ds.field(RUN_ID_COLUMN).isin(run_ids))
+            keep = hidden if keep is None else keep & hidden
+        return keep
+
+    def read(
+        self,
+        start_date: Optional[Any] = None,
+        end_date: Optional[Any] = None,
+        run_ids: Optional[Sequence[str]] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        KPI history for an inclusive measurement_date range.
+
+        The date range prunes partition directories and the run filter is
+        checked against row-group statistics, so unrelated files are not
+        read. Compacted rows of a run that has since been appended again in
+        the same date are left out. ``columns`` projects the result; the
+        date and run id columns are always included.
+        """
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+
+        paths = self.files()
+        if not paths:
+            return pd.DataFrame(columns=list(columns or []))
+        runs = [path for path in paths if not path.name.startswith(COMPACTED_PREFIX)]
+        compacted: Dict[str, List[Path]] = {}
+        for path in paths:
+            if path.name.startswith(COMPACTED_PREFIX):
+                compacted.setdefault(path.parent.name, []).append(path)
+
+        predicate = None
+        field = ds.field(MEASUREMENT_DATE_COLUMN)
+        if start_date is not None:
+            predicate = field >= pd.Timestamp(start_date).strftime("%Y-%m-%d")
+        if end_date is not None:
+            upper = field <= pd.Timestamp(end_date).strftime("%Y-%m-%d")
+            predicate = upper if predicate is None else predicate & upper
+        if run_ids is not None:
+            selected = ds.field(RUN_ID_COLUMN).isin(list(run_ids))
+            predicate = selected if predicate is None else predicate & selected
+
+        tables = [self._read_files(runs, predicate, columns)] if runs else []
+        if compacted:
+            keep = self._superseded_filter(compacted, runs)
+            if keep is not None:
+                predicate = keep if predicate is None else predicate & keep
+            merged = [path for part in compacted.values() for path in part]
+            tables.append(self._read_files(merged, predicate, columns))
+        return pa.concat_tables(tables, promote_options="permissive").to_pandas()
+
+    def compact(self, min_files: int = 2) -> Dict[str, int]:
+        """
+        Merge the files of each date partition holding at least ``min_files``
+        into one file sorted by run id; return ``partition -> files merged``.
+
+        Rows of a run that also has its own file come from that file. Files
+        left behind by an interrupted compaction are removed; partitions
+        locked by another compaction are skipped.
+        """
+        merged: Dict[str, int] = {}
+        for part in self._partition_dirs():
+            lock = _PartitionLock(part)
+            if not lock.acquire():
+                logger.info("Skipping %s: compaction in progress elsewhere", part.name)
+                continue
+            try:
+                count = self._compact_partition(part, min_files)
+            finally:
+                lock.release()
+            if count:
+                merged[part.name] = count
+        logger.info("Compacted %d KPI partitions", len(merged))
+        return merged
+
+    def _compact_partition(self, part: Path, min_files: int) -> int:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.parquet as pq
+
+        paths, leftovers = _visible_files(part)
+        for path, version in leftovers:
+            _unlink_if_unchanged(path, version)
+        if len(paths) < max(min_files, 2):
+            return 0
+
+        # Take each version before reading it: a file rewritten after this is
+        # newer than what is merged, so it stays visible and is not removed.
+        versions = {path: _file_version(path) for path in paths}
+        paths = [path for path in paths if versions[path] is not None]
+        if len(paths) < 2:
+            return 0
+        compacted = [path for path in paths if path.name.startswith(COMPACTED_PREFIX)]
+        runs = [path for path in paths if path not in compacted]
+        tables = [pq.read_table(path, partitioning=None) for path in runs]
+        run_ids = [path.stem for path in runs]
+        for path in compacted:
+            table = pq.read_table(path, partitioning=None)
+            keep = pc.invert(pc.is_in(table[RUN_ID_COLUMN].cast(pa.string()), pa.array(run_ids)))
+            tables.append(table.filter(keep))
+        table = pa.concat_tables(tables, promote_options="permissive")
+        table = table.take(pc.sort_indices(table[RUN_ID_COLUMN].cast(pa.string())))
+
+        sources = sorted(versions[path] for path in paths)
+        table = table.replace_schema_metadata(
+            {**(table.schema.metadata or {}), COMPACTED_FROM_KEY: json.dumps(sources).encode()}
+        )
+        digest = hashlib.sha256(json.dumps(sources).encode()).hexdigest()
+        _write_table(table, part / f"{COMPACTED_PREFIX}{digest[:16]}.parquet")
+        # Readers stop seeing the sources once the compacted file exists.
+        for path in paths:
+            _unlink_if_unchanged(path, versions[path])
+        return len(paths)
@@ -0,0 +1,304 @@
+"""Process-pool KPI execution over prepared columns held in shared memory."""
+
+import gc
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from python.kpi_engine import KPIEngine, portfolio_column_sums
+from python.validation import safe_numeric
+
+logger = logging.getLogger(__name__)
+
+# Prepared engine columns read by LoanAnalyticsEngine._sufficient_statistics.
+ENGINE_COLUMNS = (
+    "principal",
+    "interest_rate",
+    "write_off_amount",
+    "payments_made",
+    "balance",
+    "status",
+    "arrears_flag",
+    "currency",
+)
+_ALIGNMENT = 8
+# Portfolio code of each row in the frame shared by portfolio jobs.
+_CODE_COLUMN = "__portfolio_code"
+
+
+@dataclass(frozen=True)
+class SharedColumn:
+    name: str
+    dtype: str
+    offset: int
+    # Set for columns stored as integer codes.
+    categories: Optional[pd.Index] = None
+    ordered: bool = False
+    # Decode to plain values in results instead of keeping a categorical.
+    factorized: bool = False
+
+
+@dataclass(frozen=True)
+class SharedFrameSpec:
+    """Picklable description of a frame laid out in one shared-memory block."""
+
+    block: str
+    n_rows: int
+    columns: Tuple[SharedColumn, ...]
+
+
+class SharedFrame:
+    """
+    Copy columns of ``frame`` once into a single shared-memory block.
+
+    Numeric and boolean columns are stored as-is, categoricals as their
+    codes, and any other column is factorized to codes. Workers rebuild
+    zero-copy numpy views from ``spec``; only the spec is pickled.
+    """
+
+    def __init__(self, frame: pd.DataFrame, columns: Optional[Sequence[str]] = None):
+        arrays: List[np.ndarray] = []
+        layout: List[SharedColumn] = []
+        offset = 0
+        for name in columns if columns is not None else frame.columns:
+            values = frame[name]
+            categories, ordered, factorized = None, False, False
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                array = values.cat.codes.to_numpy()
+                categories, ordered = values.cat.categories, values.cat.ordered
+            elif pd.api.types.is_numeric_dtype(values) or pd.api.types.is_bool_dtype(values):
+                array = values.to_numpy()
+            else:
+                array, categories = pd.factorize(values, sort=True)
+                factorized = True
+            array = np.ascontiguousarray(array)
+            layout.append(
+                SharedColumn(name, array.dtype.str, offset, categories, ordered, factorized)
+            )
+            arrays.append(array)
+            offset += -(-array.nbytes // _ALIGNMENT) * _ALIGNMENT
+
+        self._block = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        for column, array in zip(layout, arrays):
+            np.ndarray(array.shape, array.dtype, self._block.buf, column.offset)[:] = array
+        self.spec = SharedFrameSpec(self._block.name, len(frame), tuple(layout))
+
+    def close(self) -> None:
+        self._block.close()
+        self._block.unlink()
+
+    def __enter__(self) -> "SharedFrame":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def frame_from_buffer(spec: SharedFrameSpec, buffer: memoryview) -> pd.DataFrame:
+    """DataFrame of views into ``buffer`` laid out as ``spec``."""
+    columns = {}
+    for column in spec.columns:
+        array = np.ndarray(spec.n_rows, np.dtype(column.dtype), buffer, column.offset)
+        if column.categories is not None:
+            array = pd.Categorical.from_codes(
+                array, categories=column.categories, ordered=column.ordered
+            )
+        columns[column.name] = array
+    return pd.DataFrame(columns, copy=False)
+
+
+def run_attached(spec: SharedFrameSpec, func: Callable[..., Any], *args: Any) -> Any:
+    """Call ``func(frame, *args)`` on the shared frame described by ``spec``."""
+    block = shared_memory.SharedMemory(name=spec.block)
+    try:
+        return func(frame_from_buffer(spec, block.buf), *args)
+    finally:
+        try:
+            block.close()
+        except BufferError:
+            # A reference cycle still holds a view; collect it and retry.
+            gc.collect()
+            block.close()
+
+
+def _segment_job(
+    frame: pd.DataFrame,
+    engine_cls: Any,
+    config: Any,
+    statistics: pd.DataFrame,
+    segment: Union[str, Sequence[str]],
+    rollup: bool,
+    cube: bool,
+) -> pd.DataFrame:
+    engine = engine_cls.from_prepared(frame, config, statistics)
+    return engine.segment_kpis(segment, rollup=rollup, cube=cube)
+
+
+def _coerced(values: pd.Series) -> np.ndarray:
+    """Float values of a shared column; categories are coerced once each."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        categories = safe_numeric(pd.Series(values.cat.categories)).to_numpy(dtype="float64")
+        # Code -1 (missing) picks the trailing NaN.
+        return np.append(categories, np.nan)[values.cat.codes.to_numpy()]
+    return safe_numeric(values).to_numpy(dtype="float64")
+
+
+def _portfolio_sums_job(
+    frame: pd.DataFrame,
+    start: int,
+    stop: int,
+    size: int,
+    columns: List[str],
+    non_negative: List[str],
+) -> Tuple[Dict[str, np.ndarray], Dict[int, str]]:
+    rows = frame.iloc[start:stop]
+    numeric = pd.DataFrame({col: _coerced(rows[col]) for col in columns})
+    codes = rows[_CODE_COLUMN].to_numpy()
+    return portfolio_column_sums(numeric, codes, size, columns, non_negative)
+
+
+class ParallelKPIExecutor:
+    """
+    Fan segment and portfolio KPI jobs out over a process pool.
+
+    Each call copies the needed columns once into shared memory; jobs carry
+    only the block spec and row bounds, never a pickled frame. Results and
+    audit entries are merged in job order, so output is identical for any
+    number of workers. ``max_workers=0`` runs the jobs in-process.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = (os.cpu_count() or 1) if max_workers is None else max_workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self.audit_trail: List[Dict[str, Any]] = []
+        self.errors: List[Dict[str, Any]] = []
+        self.warnings: List[Dict[str, Any]] = []
+
+    def __enter__(self) -> "ParallelKPIExecutor":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _map(self, func: Callable[..., Any], spec: SharedFrameSpec, jobs: List[tuple]) -> List:
+        if self.max_workers == 0 or len(jobs) <= 1:
+            return [run_attached(spec, func, *job) for job in jobs]
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        futures = [self._pool.submit(run_attached, spec, func, *job) for job in jobs]
+        return [future.result() for future in futures]
+
+    def segment_kpis(
+        self,
+        engine: Any,
+        segments: Sequence[Union[str, Sequence[str]]],
+        rollup: bool = False,
+        cube: bool = False,
+    ) -> Dict[Union[str, Tuple[str, ...]], pd.DataFrame]:
+        """
+        ``engine.segment_kpis`` for each entry of ``segments``, one job each.
+
+        ``engine`` is a ``LoanAnalyticsEngine``; workers rebuild one of the
+        same class with ``from_prepared`` over the shared columns.
+        """
+        keys = [segment if isinstance(segment, str) else tuple(segment) for segment in segments]
+        needed = list(ENGINE_COLUMNS)
+        for key in keys:
+            for col in [key] if isinstance(key, str) else key:
+                if col not in engine.data.columns:
+                    raise ValueError(f"Segment column '{col}' not found")
+                if col not in needed:
+                    needed.append(col)
+
+        with SharedFrame(engine.data, needed) as shared:
+            factorized = [column.name for column in shared.spec.columns if column.factorized]
+            jobs = [
+                (type(engine), engine.config, engine.statistics, key, rollup, cube) for key in keys
+            ]
+            results = self._map(_segment_job, shared.spec, jobs)
+
+        for result in results:
+            for col in factorized:
+                if col in result.columns:
+                    result[col] = result[col].astype(object)
+        return dict(zip(keys, results))
+
+    def portfolio_metrics(
+        self,
+        df: pd.DataFrame,
+        portfolio_col: str,
+        metric_keys: Optional[List[str]] = None,
+        actor: str = "system",
+        action: str = "kpi",
+    ) -> pd.DataFrame:
+        """
+        ``KPIEngine.calculate_metrics_by`` with the per-portfolio column sums
+        split over the pool; returns the same tidy frame.
+
+        Audit entries, errors and warnings are appended to this executor's
+        lists, tagged with the portfolio value.
+        """
+        engine = KPIEngine(df, actor=actor, action=action)
+        result = engine.calculate_metrics_by(
+            portfolio_col, metric_keys, column_sums=self._portfolio_column_sums
+        )
+        for name in ("audit_trail", "errors", "warnings"):
+            getattr(self, name).extend(getattr(engine, name))
+        logger.info(
+            "Computed KPIs for %d portfolios with %d workers",
+            result[portfolio_col].nunique(),
+            self.max_workers,
+        )
+        return result
+
+    def _portfolio_column_sums(
+        self,
+        df: pd.DataFrame,
+        codes: np.ndarray,
+        size: int,
+        columns: List[str],
+        non_negative: List[str],
+    ) -> Tuple[Dict[str, np.ndarray], Dict[int, str]]:
+        """
+        ``portfolio_column_sums`` over contiguous row ranges, one job each.
+
+        The raw columns go to shared memory as they are; each job coerces
+        its own rows and returns partial sums per portfolio, added up here.
+        """
+        frame = pd.DataFrame({**{col: df[col] for col in columns}, _CODE_COLUMN: codes}, copy=False)
+        bounds = np.linspace(0, len(frame), max(self.max_workers, 1) + 1).astype(int)
+        with SharedFrame(frame) as shared:
+            jobs = [
+                (int(start), int(stop), size, columns, non_negative)
+                for start, stop in zip(bounds[:-1], bounds[1:])
+                if stop > start
+            ]
+            outputs = self._map(_portfolio_sums_job, shared.spec, jobs)
+
+        sums = {
+            col: sum((chunk_sums[col] for chunk_sums, _ in outputs), np.zeros(size))
+            for col in columns
+        }
+        # Keep the first failing column in ``columns`` order, as the serial pass does.
+        position = {col: i for i, col in enumerate(columns)}
+        invalid: Dict[int, str] = {}
+        for _, chunk_invalid in outputs:
+            for code, col in chunk_invalid.items():
+                if code not in invalid or position[col] < position[invalid[code]]:
+                    invalid[code] = col
+        return sums, invalid
+
+    def get_audit_trail(self) -> pd.DataFrame:
+        """Return the merged audit trail as DataFrame."""
+        return pd.DataFrame(self.audit_trail)
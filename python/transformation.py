@@ -1,4 +1,5 @@
 import logging
+import tracemalloc
 import uuid
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
@@ -23,6 +24,11 @@ class ColumnDefinition:
         "dpd_0_7_usd", "dpd_7_30_usd", "dpd_30_60_usd",
         "dpd_60_90_usd", "dpd_90_plus_usd"
     ]
+    ALIAS_SOURCES = {
+        "receivable_amount": "total_receivable_usd",
+        "eligible_amount": "total_eligible_usd",
+        "discounted_amount": "discounted_balance_usd",
+    }
     ALIAS_MAPPINGS = {
         "loan_amount": ["receivable_amount"],
         "principal_balance": ["discounted_amount"],
@@ -148,11 +154,15 @@ class DataTransformation:
     def _create_column_aliases(self, df: pd.DataFrame) -> pd.DataFrame:
         """Create convenience column aliases."""
         result = df.copy()
-        result["receivable_amount"] = result["total_receivable_usd"]
-        result["eligible_amount"] = result["total_eligible_usd"]
-        result["discounted_amount"] = result["discounted_balance_usd"]
+        self._assign_column_aliases(result)
         return result
 
+    @staticmethod
+    def _assign_column_aliases(result: pd.DataFrame) -> None:
+        """Add alias columns to ``result`` in place."""
+        for alias, source in ColumnDefinition.ALIAS_SOURCES.items():
+            result[alias] = result[source]
+
     def _add_dpd_percentages(self, df: pd.DataFrame) -> pd.DataFrame:
         """Add DPD columns as percentages of total receivable."""
         result = df.copy()
@@ -164,10 +174,24 @@ class DataTransformation:
 
         return result
 
+    @staticmethod
+    def _dpd_percentage_block(df: pd.DataFrame) -> pd.DataFrame:
+        """Compute every DPD percentage column in one vectorized block."""
+        dpd_cols = [col for col in ColumnDefinition.DPD_COLUMNS if col in df.columns]
+        receivable = df["receivable_amount"].replace(0, np.nan).to_numpy(dtype="float64")
+        pct = df[dpd_cols].to_numpy(dtype="float64") / receivable[:, None]
+        np.nan_to_num(pct, copy=False, nan=0.0, posinf=np.inf, neginf=-np.inf)
+        pct *= 100
+        return pd.DataFrame(pct, index=df.index, columns=[f"{col}_pct" for col in dpd_cols])
+
     def _add_analytics_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         """Fill missing analytics columns from mappings or defaults."""
         result = df.copy()
+        self._fill_analytics_columns(result)
+        return result
 
+    def _fill_analytics_columns(self, result: pd.DataFrame) -> None:
+        """Fill missing analytics columns on ``result`` in place."""
         for col in self.REQUIRED_ANALYTICS_COLUMNS:
             if col not in result.columns:
                 candidates = ColumnDefinition.ALIAS_MAPPINGS.get(col, [])
@@ -180,8 +204,6 @@ class DataTransformation:
                 else:
                     result[col] = float("nan")
 
-        return result
-
     def _validate_schema(self, df: pd.DataFrame, schema_type: str, stage: str) -> None:
         """Validate DataFrame schema."""
         try:
@@ -202,27 +224,36 @@ class DataTransformation:
         except AssertionError as e:
             raise ValueError(f"{stage} schema validation failed: {e}") from e
 
-    def transform_to_kpi_dataset(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Transform raw loan data into KPI-ready dataset."""
-        self._log_and_record(
-            "transform_to_kpi_dataset",
-            "Starting transformation",
-            list(df.columns),
-            [],
-            {"rows": len(df)},
-            rows=len(df)
-        )
-
-        missing = [c for c in self.REQUIRED_INPUT_COLUMNS if c not in df.columns]
-        if missing:
-            raise ValueError(f"Missing required columns: {missing}")
-
+    def _build_kpi_dataset(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Standard transform: each step works on its own copy."""
         self._validate_schema(df, "input", "transformation_input")
 
         kpi_df = self._create_column_aliases(df)
         kpi_df = self._add_dpd_percentages(kpi_df)
         kpi_df = self._add_analytics_columns(kpi_df)
+        self._stamp_and_validate_output(kpi_df)
+        return kpi_df
 
+    def _build_kpi_dataset_low_memory(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Low-memory transform: one copy of the input, every later step in place.
+
+        ``assign`` copies the input once and gives each alias column its own
+        copy of the source values, so writing to one column of the result
+        never changes another. The DPD percentages are written into that
+        same frame rather than concatenated into a new one.
+        """
+        self._validate_schema(df, "input", "transformation_input")
+        kpi_df = df.assign(
+            **{alias: df[source] for alias, source in ColumnDefinition.ALIAS_SOURCES.items()}
+        )
+        dpd_pct = self._dpd_percentage_block(kpi_df)
+        kpi_df[dpd_pct.columns] = dpd_pct
+        self._fill_analytics_columns(kpi_df)
+        self._stamp_and_validate_output(kpi_df)
+        return kpi_df
+
+    def _stamp_and_validate_output(self, kpi_df: pd.DataFrame) -> None:
         transform_ts = datetime.now(timezone.utc).isoformat()
         self.timestamp = transform_ts
         kpi_df["_transform_run_id"] = self.run_id
@@ -230,6 +261,49 @@ class DataTransformation:
 
         self._validate_schema(kpi_df, "output", "transformation_output")
 
+    def transform_to_kpi_dataset(
+        self, df: pd.DataFrame, low_memory: bool = False, measure_peak: bool = False
+    ) -> pd.DataFrame:
+        """
+        Transform raw loan data into KPI-ready dataset.
+
+        With ``low_memory=True`` the input is copied once and every later step
+        works in place. With ``measure_peak=True`` the traced peak above the
+        starting level is recorded in the lineage entry. ``tracemalloc`` is
+        started for the call and stopped afterwards unless it is already
+        tracing, in which case the caller's tracer and peak are left alone.
+        """
+        self._log_and_record(
+            "transform_to_kpi_dataset",
+            "Starting transformation",
+            list(df.columns),
+            [],
+            {"rows": len(df), "low_memory": low_memory},
+            rows=len(df)
+        )
+
+        missing = [c for c in self.REQUIRED_INPUT_COLUMNS if c not in df.columns]
+        if missing:
+            raise ValueError(f"Missing required columns: {missing}")
+
+        details: Dict[str, Any] = {}
+        started_tracing = measure_peak and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        try:
+            if measure_peak:
+                baseline, _ = tracemalloc.get_traced_memory()
+            if low_memory:
+                kpi_df = self._build_kpi_dataset_low_memory(df)
+            else:
+                kpi_df = self._build_kpi_dataset(df)
+            if measure_peak:
+                _, peak = tracemalloc.get_traced_memory()
+                details["peak_memory_bytes"] = max(peak - baseline, 0)
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+
         self._log_and_record(
             "transform_to_kpi_dataset",
             "Transformation complete",
@@ -238,8 +312,11 @@ class DataTransformation:
             {
                 "rows": len(kpi_df),
                 "output_columns": len(kpi_df.columns),
+                "low_memory": low_memory,
+                **details,
             },
-            rows=len(kpi_df)
+            rows=len(kpi_df),
+            **details,
         )
 
         self.transformations_count += 1
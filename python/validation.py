@@ -2,8 +2,10 @@
 
 import re
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 
 REQUIRED_ANALYTICS_COLUMNS: List[str] = [
@@ -42,6 +44,10 @@ ISO8601_REGEX = re.compile(
 )
 
 
+# infer_dtype results that may hide a string among other value types
+_MIXED_INFERRED_TYPES = frozenset({"mixed", "mixed-integer", "unknown-array"})
+
+
 class ColumnValidator:
     """Validate columns with specific type/format constraints."""
 
@@ -59,54 +65,132 @@ class ColumnValidator:
             return True
         return isinstance(val, str) and ISO8601_REGEX.fullmatch(val) is not None
 
+    @staticmethod
+    def iso8601_mask(series: pd.Series) -> pd.Series:
+        """Vectorized ``is_iso8601`` over a Series; returns a boolean mask of valid values."""
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return pd.Series(True, index=series.index)
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            series = series.astype(object)
+        if not (pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)):
+            return series.isna()
+
+        inferred = pd.api.types.infer_dtype(series, skipna=True)
+        if inferred in ("empty", "datetime"):
+            return pd.Series(True, index=series.index)
+        if inferred == "string":
+            # Dates repeat heavily across loan rows, so match each distinct value once.
+            codes, uniques = pd.factorize(series)
+            matched = pd.Series(uniques).str.fullmatch(ISO8601_REGEX.pattern, na=False)
+            valid = np.append(matched.to_numpy(dtype=bool), True)
+            return pd.Series(valid[codes], index=series.index)
+        # Mixed object columns are rare; fall back to the scalar check.
+        return series.map(ColumnValidator.is_iso8601).astype(bool)
+
+    @staticmethod
+    def contains_strings(series: pd.Series) -> bool:
+        """Return True if any value of an object column is a Python string."""
+        if not pd.api.types.is_object_dtype(series):
+            return False
+        inferred = pd.api.types.infer_dtype(series, skipna=True)
+        if inferred == "string":
+            return True
+        if inferred not in _MIXED_INFERRED_TYPES:
+            return False
+        return bool(series.map(type).eq(str).any())
+
     @staticmethod
     def coerce_numeric(df: pd.DataFrame, col: str) -> None:
         """Coerce column to numeric, filling errors with NaN."""
         df[col] = pd.to_numeric(df[col], errors="coerce")
 
 
+COLUMN_INDEX_CACHE_SIZE = 256
+
+
+class ColumnIndex:
+    """
+    Alias index over one column layout: exact, case-insensitive and substring.
+
+    Built once per distinct column tuple (see ``column_index``); lookups are
+    memoized per candidate list.
+    """
+
+    def __init__(self, columns: Tuple[Any, ...]):
+        self.columns = columns
+        self.column_set = frozenset(columns)
+        self.lowered = [(str(col).lower(), col) for col in columns]
+        self.columns_lower = {lower: col for lower, col in self.lowered}
+        self._substring_cache: Dict[str, Optional[Any]] = {}
+        self._resolved: Dict[Tuple[str, ...], Optional[str]] = {}
+
+    def find(self, candidates: Sequence[str]) -> Optional[str]:
+        """Find matching column from candidates."""
+        key = tuple(candidates)
+        if key not in self._resolved:
+            self._resolved[key] = self._find_uncached(key)
+        return self._resolved[key]
+
+    def _find_uncached(self, candidates: Tuple[str, ...]) -> Optional[str]:
+        for candidate in candidates:
+            if candidate in self.column_set:
+                return candidate
+        for candidate in candidates:
+            match = self.columns_lower.get(candidate.lower())
+            if match is not None:
+                return match
+        for candidate in candidates:
+            match = self._substring(candidate.lower())
+            if match is not None:
+                return match
+        return None
+
+    def _substring(self, lower_candidate: str) -> Optional[Any]:
+        if lower_candidate not in self._substring_cache:
+            self._substring_cache[lower_candidate] = next(
+                (col for lower, col in self.lowered if lower_candidate in lower), None
+            )
+        return self._substring_cache[lower_candidate]
+
+    def resolve(self, fields: Mapping[str, Sequence[str]]) -> Dict[str, Optional[str]]:
+        """Resolve every logical field to a column (or None) in one pass."""
+        return {field: self.find(candidates) for field, candidates in fields.items()}
+
+
+@lru_cache(maxsize=COLUMN_INDEX_CACHE_SIZE)
+def _cached_column_index(columns: Tuple[Any, ...]) -> ColumnIndex:
+    return ColumnIndex(columns)
+
+
+def column_index(df: pd.DataFrame) -> ColumnIndex:
+    """Return the shared ColumnIndex for ``df``'s current column layout."""
+    return _cached_column_index(tuple(df.columns))
+
+
 class ColumnFinder:
     """Find columns by exact match, case-insensitive, or substring."""
 
     def __init__(self, df: pd.DataFrame):
         self.df = df
-        self.columns = list(df.columns)
-        self.columns_lower = {col.lower(): col for col in self.columns}
+        self.index = column_index(df)
+        self.columns = list(self.index.columns)
+        self.columns_lower = self.index.columns_lower
 
     def find(self, candidates: List[str]) -> Optional[str]:
         """Find matching column from candidates."""
-        for col in self._exact_match(candidates):
-            return col
-        for col in self._case_insensitive_match(candidates):
-            return col
-        for col in self._substring_match(candidates):
-            return col
-        return None
-
-    def _exact_match(self, candidates: List[str]) -> List[str]:
-        """Get exact matches from candidates."""
-        return [c for c in candidates if c in self.columns]
-
-    def _case_insensitive_match(self, candidates: List[str]) -> List[str]:
-        """Get case-insensitive matches."""
-        lower_cands = [c.lower() for c in candidates]
-        return [self.columns_lower[lc] for lc in lower_cands if lc in self.columns_lower]
-
-    def _substring_match(self, candidates: List[str]) -> List[str]:
-        """Get substring matches (case-insensitive)."""
-        result = []
-        for candidate in candidates:
-            for col in self.columns:
-                if candidate.lower() in col.lower():
-                    result.append(col)
-                    break
-        return result
+        return self.index.find(candidates)
 
 
 def find_column(df: pd.DataFrame, candidates: List[str]) -> Optional[str]:
     """Find column in DataFrame matching one of the candidates."""
-    finder = ColumnFinder(df)
-    return finder.find(candidates)
+    return column_index(df).find(candidates)
+
+
+def resolve_columns(
+    df: pd.DataFrame, fields: Mapping[str, Sequence[str]]
+) -> Dict[str, Optional[str]]:
+    """Resolve several logical fields (name -> candidate columns) for ``df`` at once."""
+    return column_index(df).resolve(fields)
 
 
 def is_missing_columns(df: pd.DataFrame, required: Optional[List[str]]) -> List[str]:
@@ -134,10 +218,8 @@ def validate_dataframe(
         for col in numeric_columns:
             if col not in df.columns:
                 raise ValueError(f"Missing required numeric column: {col}")
-            if df[col].dtype == "object":
-                for x in df[col]:
-                    if isinstance(x, str):
-                        raise ValueError(f"Column '{col}' must be numeric: {col}")
+            if ColumnValidator.contains_strings(df[col]):
+                raise ValueError(f"Column '{col}' must be numeric: {col}")
             df[col] = pd.to_numeric(df[col], errors="coerce")
             if not pd.api.types.is_numeric_dtype(df[col]):
                 raise ValueError(f"Column '{col}' must be numeric: {col}")
@@ -146,7 +228,7 @@ def validate_dataframe(
         for col in date_columns:
             if col not in df.columns:
                 raise ValueError(f"Missing required date column: {col}")
-            if not all(ColumnValidator.is_iso8601(val) for val in df[col]):
+            if not ColumnValidator.iso8601_mask(df[col]).all():
                 raise ValueError(f"Column '{col}' must contain ISO 8601 dates")
 
 
@@ -178,63 +260,119 @@ def safe_numeric(series: pd.Series) -> pd.Series:
     return pd.to_numeric(series, errors="coerce")
 
 
+def _numeric_bounds_failures(
+    df: pd.DataFrame, columns: Optional[List[str]] = None
+) -> Dict[str, pd.Series]:
+    """Failure masks for the non-negative check (NaN counts as a failure)."""
+    cols_to_check = columns or NUMERIC_COLUMNS
+    return {
+        f"{col}_non_negative": df[col].isna() | (df[col] < 0)
+        for col in cols_to_check
+        if col in df.columns
+    }
+
+
+def _percentage_columns(df: pd.DataFrame) -> List[str]:
+    exempt_columns = ["collateralization_pct", "collection_rate_pct"]
+    return [
+        c
+        for c in df.columns
+        if ("percent" in c or "rate" in c or c.endswith("_pct") or c.endswith("_rate"))
+        and c not in exempt_columns
+    ]
+
+
+def _percentage_bounds_failures(
+    df: pd.DataFrame, columns: Optional[List[str]] = None
+) -> Dict[str, pd.Series]:
+    """Failure masks for the 0-100 inclusive check (NaN counts as a failure)."""
+    if columns is None:
+        columns = _percentage_columns(df)
+    return {
+        f"{col}_in_0_100": ~((df[col] >= 0) & (df[col] <= 100))
+        for col in columns
+        if col in df.columns
+    }
+
+
+def _date_columns(df: pd.DataFrame) -> List[str]:
+    return [c for c in df.columns if "date" in c.lower() or c.lower().endswith("_at")]
+
+
+def _iso8601_failures(
+    df: pd.DataFrame, columns: Optional[List[str]] = None
+) -> Dict[str, pd.Series]:
+    """Failure masks for the ISO 8601 check (nulls and datetimes pass)."""
+    if columns is None:
+        columns = _date_columns(df)
+    return {
+        f"{col}_iso8601": ~ColumnValidator.iso8601_mask(df[col])
+        for col in columns
+        if col in df.columns
+    }
+
+
+def _monotonic_columns(df: pd.DataFrame) -> List[str]:
+    return [
+        c for c in df.columns if any(x in c.lower() for x in ["count", "total", "cumulative"])
+    ]
+
+
+def _monotonic_failures(
+    df: pd.DataFrame, columns: Optional[List[str]] = None
+) -> Dict[str, pd.Series]:
+    """Failure masks flagging rows that decrease versus the previous non-null row."""
+    if columns is None:
+        columns = _monotonic_columns(df)
+    failures: Dict[str, pd.Series] = {}
+    for col in columns:
+        if col in df.columns:
+            series = df[col].dropna()
+            values = series.to_numpy()
+            mask = pd.Series(False, index=df.index)
+            if len(values) > 1:
+                try:
+                    decreasing = values[1:] < values[:-1]
+                except TypeError:
+                    # Unorderable mixed values: every row after the first is suspect.
+                    decreasing = np.ones(len(values) - 1, dtype=bool)
+                mask.loc[series.index[1:][decreasing]] = True
+            failures[f"{col}_monotonic_increasing"] = mask
+    return failures
+
+
+def _null_failures(df: pd.DataFrame, columns: Optional[List[str]] = None) -> Dict[str, pd.Series]:
+    """Failure masks for the no-nulls check."""
+    if columns is None:
+        columns = list(set(REQUIRED_ANALYTICS_COLUMNS + NUMERIC_COLUMNS))
+    return {f"{col}_no_nulls": df[col].isnull() for col in columns if col in df.columns}
+
+
 def validate_numeric_bounds(
     df: pd.DataFrame, columns: Optional[List[str]] = None
 ) -> Dict[str, bool]:
     """Check numeric columns are non-negative."""
-    cols_to_check = columns or NUMERIC_COLUMNS
-    validation: Dict[str, bool] = {}
-    for col in cols_to_check:
-        if col in df.columns:
-            has_nan = df[col].isna().any()
-            has_negative = (df[col] < 0).any()
-            validation[f"{col}_non_negative"] = not (has_nan or has_negative)
-    return validation
+    return {
+        key: not bool(mask.any())
+        for key, mask in _numeric_bounds_failures(df, columns).items()
+    }
 
 
 def validate_percentage_bounds(
     df: pd.DataFrame, columns: Optional[List[str]] = None
 ) -> Dict[str, bool]:
     """Check percentage columns are between 0 and 100 inclusive."""
-    if columns is None:
-        exempt_columns = ["collateralization_pct", "collection_rate_pct"]
-        columns = [
-            c
-            for c in df.columns
-            if ("percent" in c or "rate" in c or c.endswith("_pct") or c.endswith("_rate"))
-            and c not in exempt_columns
-        ]
-    validation: Dict[str, bool] = {}
-    for col in columns:
-        if col in df.columns:
-            valid = ((df[col] >= 0) & (df[col] <= 100)).all()
-            validation[f"{col}_in_0_100"] = valid
-    return validation
+    return {
+        key: not bool(mask.any())
+        for key, mask in _percentage_bounds_failures(df, columns).items()
+    }
 
 
 def validate_iso8601_dates(
     df: pd.DataFrame, columns: Optional[List[str]] = None
 ) -> Dict[str, bool]:
     """Check that all values are valid ISO 8601 dates (YYYY-MM-DD or full ISO format)."""
-    if columns is None:
-        columns = [c for c in df.columns if "date" in c.lower() or c.lower().endswith("_at")]
-    validation: Dict[str, bool] = {}
-    iso8601_regex = re.compile(
-        r"^\d{4}-\d{2}-\d{2}(T\d{2}:\d{2}:\d{2}(\.\d+)?(Z|[+-]\d{2}:\d{2})?)?$"
-    )
-    for col in columns:
-        if col in df.columns:
-            valid = True
-            for val in df[col]:
-                if pd.isnull(val):
-                    continue
-                if isinstance(val, datetime):
-                    continue
-                if not isinstance(val, str) or not iso8601_regex.match(val):
-                    valid = False
-                    break
-            validation[f"{col}_iso8601"] = valid
-    return validation
+    return {key: not bool(mask.any()) for key, mask in _iso8601_failures(df, columns).items()}
 
 
 def validate_monotonic_increasing(
@@ -242,9 +380,7 @@ def validate_monotonic_increasing(
 ) -> Dict[str, bool]:
     """Check that specified columns are monotonically increasing (non-decreasing)."""
     if columns is None:
-        columns = [
-            c for c in df.columns if any(x in c.lower() for x in ["count", "total", "cumulative"])
-        ]
+        columns = _monotonic_columns(df)
     validation: Dict[str, bool] = {}
     for col in columns:
         if col in df.columns:
@@ -256,10 +392,27 @@ def validate_monotonic_increasing(
 
 def validate_no_nulls(df: pd.DataFrame, columns: Optional[List[str]] = None) -> Dict[str, bool]:
     """Check that specified columns have no null values."""
-    if columns is None:
-        columns = list(set(REQUIRED_ANALYTICS_COLUMNS + NUMERIC_COLUMNS))
-    validation: Dict[str, bool] = {}
-    for col in columns:
-        if col in df.columns:
-            validation[f"{col}_no_nulls"] = not df[col].isnull().any()
-    return validation
+    return {key: not bool(mask.any()) for key, mask in _null_failures(df, columns).items()}
+
+
+def validation_failure_indices(
+    df: pd.DataFrame,
+    numeric_columns: Optional[List[str]] = None,
+    percentage_columns: Optional[List[str]] = None,
+    date_columns: Optional[List[str]] = None,
+    monotonic_columns: Optional[List[str]] = None,
+    null_columns: Optional[List[str]] = None,
+) -> Dict[str, pd.Index]:
+    """
+    Return the index labels of the rows failing each validation check.
+
+    Keys match the result dicts of the ``validate_*`` functions, and column
+    selection follows the same defaults; passing checks map to an empty Index.
+    """
+    masks: Dict[str, pd.Series] = {}
+    masks.update(_numeric_bounds_failures(df, numeric_columns))
+    masks.update(_percentage_bounds_failures(df, percentage_columns))
+    masks.update(_iso8601_failures(df, date_columns))
+    masks.update(_monotonic_failures(df, monotonic_columns))
+    masks.update(_null_failures(df, null_columns))
+    return {key: df.index[mask.to_numpy(dtype=bool)] for key, mask in masks.items()}
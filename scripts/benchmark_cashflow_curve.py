@@ -0,0 +1,102 @@
+"""
+Benchmark the vectorized LoanAnalyticsEngine.cashflow_curve against the
+per-loan date_range loop it replaced.
+
+Usage:
+    python scripts/benchmark_cashflow_curve.py --loans 10000 200000 --legacy-limit 20000
+"""
+
+import argparse
+import sys
+import time
+import warnings
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.enterprise_analytics_engine import LoanAnalyticsEngine  # noqa: E402
+
+
+def legacy_cashflow_curve(data: pd.DataFrame, freq: str = "M") -> pd.DataFrame:
+    """Row-by-row projection previously done by cashflow_curve."""
+    records = []
+    for _, row in data.iterrows():
+        monthly_payment = row["payments_made"] / max(row["term_months"], 1)
+        periods = pd.date_range(start=row["origination_date"], periods=row["term_months"], freq="M")
+        for period in periods:
+            records.append({"period": period, "cashflow": monthly_payment})
+    curve = pd.DataFrame(records)
+    agg = (
+        curve.set_index("period")
+        .groupby(pd.Grouper(freq=freq))
+        .sum(numeric_only=True)
+        .rename_axis("period")
+        .reset_index()
+    )
+    agg["cumulative_cashflow"] = agg["cashflow"].cumsum()
+    return agg
+
+
+def build_book(loans: int, seed: int = 11) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "loan_id": np.arange(loans),
+            "principal": rng.uniform(1_000, 100_000, loans),
+            "interest_rate": rng.uniform(0.05, 0.35, loans),
+            "term_months": rng.choice([12, 24, 36], loans),
+            "origination_date": pd.Timestamp("2021-01-01")
+            + pd.to_timedelta(rng.integers(0, 1_000, loans), unit="D"),
+            "status": "current",
+            "days_in_arrears": 0,
+            "balance": rng.uniform(0, 50_000, loans),
+            "payments_made": rng.uniform(0, 50_000, loans),
+            "write_off_amount": 0.0,
+        }
+    )
+
+
+def _time(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def run(loans: int, legacy_limit: int) -> Dict[str, float]:
+    engine = LoanAnalyticsEngine(build_book(loans))
+    vectorized = _time(lambda: engine.cashflow_curve())
+    amortizing = _time(lambda: engine.cashflow_curve(schedule="amortizing"))
+
+    legacy = float("nan")
+    if loans <= legacy_limit:
+        legacy = _time(lambda: legacy_cashflow_curve(engine.data))
+        pd.testing.assert_frame_equal(
+            legacy_cashflow_curve(engine.data), engine.cashflow_curve(), check_dtype=False
+        )
+
+    return {
+        "loans": loans,
+        "legacy_s": round(legacy, 4),
+        "vectorized_s": round(vectorized, 4),
+        "amortizing_s": round(amortizing, 4),
+        "speedup": round(legacy / vectorized, 1) if vectorized else float("inf"),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--loans", type=int, nargs="+", default=[10_000, 200_000])
+    parser.add_argument(
+        "--legacy-limit", type=int, default=20_000, help="Skip the legacy loop above this size"
+    )
+    args = parser.parse_args()
+    warnings.simplefilter("ignore", FutureWarning)
+    results = pd.DataFrame([run(loans, args.legacy_limit) for loans in args.loans])
+    print(results.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark LoanAnalyticsEngine construction (``_prepare_data``) against the
+row-wise preparation it replaced.
+
+Usage:
+    python scripts/benchmark_engine_construction.py --loans 100000 1000000 5000000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.enterprise_analytics_engine import LoanAnalyticsEngine  # noqa: E402
+
+STATUSES = np.array(["Current", " current", "DEFAULT", "arrears ", "prepaid", "npl"])
+
+
+def legacy_prepare_data(frame: pd.DataFrame, engine: LoanAnalyticsEngine) -> pd.DataFrame:
+    """Preparation previously done by LoanAnalyticsEngine._prepare_data."""
+    frame["origination_date"] = pd.to_datetime(frame["origination_date"], errors="raise")
+    coerced = frame[engine.NUMERIC_COLUMNS].apply(pd.to_numeric, errors="coerce")
+    frame[engine.NUMERIC_COLUMNS] = coerced
+    frame["status"] = frame["status"].astype(str).str.lower().str.strip().replace({"nan": ""})
+    frame["arrears_flag"] = frame["status"].isin({"arrears", "npl", "default"}) | (
+        frame["days_in_arrears"] >= engine.config.arrears_threshold
+    )
+    frame["origination_quarter"] = frame["origination_date"].dt.to_period("Q").astype(str)
+    frame["exposure_at_default"] = frame.apply(
+        lambda row: row["balance"] if row["status"] == "default" else 0.0, axis=1
+    )
+    return frame
+
+
+def build_book(loans: int, seed: int = 17) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    dates = pd.Timestamp("2020-01-01") + pd.to_timedelta(rng.integers(0, 2_000, loans), unit="D")
+    return pd.DataFrame(
+        {
+            "loan_id": np.arange(loans),
+            "principal": rng.uniform(1_000, 100_000, loans),
+            "interest_rate": rng.uniform(0.05, 0.35, loans),
+            "term_months": rng.choice([12, 24, 36], loans),
+            "origination_date": dates.strftime("%Y-%m-%d"),
+            "status": STATUSES[rng.integers(0, len(STATUSES), loans)],
+            "days_in_arrears": rng.integers(0, 180, loans),
+            "balance": rng.uniform(0, 50_000, loans),
+            "payments_made": rng.uniform(0, 50_000, loans),
+            "write_off_amount": 0.0,
+        }
+    )
+
+
+def _time(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def run(loans: int, legacy_limit: int) -> Dict[str, float]:
+    book = build_book(loans)
+    engine = None
+
+    def construct() -> None:
+        nonlocal engine
+        engine = LoanAnalyticsEngine(book)
+
+    vectorized = _time(construct)
+    legacy = float("nan")
+    if loans <= legacy_limit:
+        legacy = _time(lambda: legacy_prepare_data(book.copy(), engine))
+        expected = legacy_prepare_data(book.copy(), engine)
+        np.testing.assert_allclose(
+            engine.data["exposure_at_default"], expected["exposure_at_default"]
+        )
+        assert (engine.data["status"].astype(str) == expected["status"]).all()
+        assert (engine.data["origination_quarter"] == expected["origination_quarter"]).all()
+
+    return {
+        "loans": loans,
+        "legacy_s": round(legacy, 3),
+        "vectorized_s": round(vectorized, 3),
+        "speedup": round(legacy / vectorized, 1) if vectorized else float("inf"),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--loans", type=int, nargs="+", default=[100_000, 1_000_000, 5_000_000])
+    parser.add_argument(
+        "--legacy-limit",
+        type=int,
+        default=1_000_000,
+        help="Skip the row-wise legacy preparation above this size",
+    )
+    args = parser.parse_args()
+    results = pd.DataFrame([run(loans, args.legacy_limit) for loans in args.loans])
+    print(results.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark FinancialAnalyzer's vectorized bucketing against the per-loan rules.
+
+Checks that the labels match the scalar Classification rules, then times both.
+
+Usage:
+    python scripts/benchmark_financial_binning.py --rows 1000000 10000000
+"""
+
+import argparse
+import sys
+import time
+from datetime import date
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from python.financial_analysis import Classification, FinancialAnalyzer  # noqa: E402
+
+REFERENCE_DATE = date(2025, 1, 1)
+
+
+def build_book(rows: int, seed: int = 11) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    days_past_due = rng.integers(-5, 400, rows).astype("float64")
+    days_past_due[rng.random(rows) < 0.01] = np.nan
+    return pd.DataFrame(
+        {
+            "customer_id": rng.integers(0, max(rows // 4, 1), rows),
+            "days_past_due": days_past_due,
+            "outstanding_balance": rng.lognormal(8, 1.5, rows),
+            "loan_count": rng.integers(1, 6, rows),
+            "last_active_date": pd.Timestamp(REFERENCE_DATE)
+            - pd.to_timedelta(rng.integers(0, 365, rows), unit="D"),
+        }
+    )
+
+
+def legacy_labels(df: pd.DataFrame) -> Dict[str, pd.Series]:
+    days_since_active = (pd.Timestamp(REFERENCE_DATE) - df["last_active_date"]).dt.days
+    frame = df.assign(days_since_active=days_since_active)
+    return {
+        "dpd_bucket": df["days_past_due"].apply(Classification.dpd_bucket_rules),
+        "exposure_segment": df["outstanding_balance"].apply(
+            Classification.exposure_segment_rules
+        ),
+        "client_type": frame.apply(
+            lambda row: Classification.client_type_rules(
+                int(row["loan_count"]), int(row["days_since_active"])
+            ),
+            axis=1,
+        ),
+    }
+
+
+def vectorized_labels(df: pd.DataFrame) -> Dict[str, pd.Series]:
+    analyzer = FinancialAnalyzer()
+    result = analyzer.classify_dpd_buckets(df)
+    result = analyzer.segment_clients_by_exposure(result)
+    result = analyzer.classify_client_type(result, reference_date=REFERENCE_DATE)
+    return {col: result[col] for col in ("dpd_bucket", "exposure_segment", "client_type")}
+
+
+def run(rows: int) -> Dict[str, float]:
+    df = build_book(rows)
+
+    start = time.perf_counter()
+    legacy = legacy_labels(df)
+    legacy_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vectorized = vectorized_labels(df)
+    vectorized_s = time.perf_counter() - start
+
+    for col, labels in legacy.items():
+        if not labels.astype(str).equals(vectorized[col].astype(str)):
+            raise AssertionError(f"Label mismatch in {col}")
+
+    return {
+        "rows": rows,
+        "legacy_s": round(legacy_s, 3),
+        "vectorized_s": round(vectorized_s, 3),
+        "speedup": round(legacy_s / vectorized_s, 1),
+        "labels_match": True,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000_000, 10_000_000])
+    args = parser.parse_args()
+    print(pd.DataFrame([run(rows) for rows in args.rows]).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark LoanBook memory and join speed against default read_csv frames.
+
+Usage:
+    python scripts/benchmark_loan_book.py --data-dir .
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from python.loan_book import TABLE_FILES, LoanBook  # noqa: E402
+
+MB = 1024 * 1024
+
+
+def _time(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--data-dir", default=".")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    data_dir = Path(args.data_dir)
+
+    frames = {
+        name: pd.read_csv(data_dir / filename)
+        for name, filename in TABLE_FILES.items()
+        if (data_dir / filename).exists()
+    }
+    book = LoanBook.load(data_dir, list(frames))
+    usage = book.memory_usage()
+    rows = [
+        {
+            "table": name,
+            "rows": len(frame),
+            "read_csv_mb": round(frame.memory_usage(deep=True).sum() / MB, 2),
+            "loan_book_mb": round(usage[name] / MB, 2),
+        }
+        for name, frame in frames.items()
+    ]
+    rows.append(
+        {
+            "table": "_dictionaries",
+            "rows": len(book.loan_ids),
+            "loan_book_mb": round(usage["_dictionaries"] / MB, 2),
+        }
+    )
+    report = pd.DataFrame(rows).fillna(0.0)
+    print(report.to_string(index=False))
+    ratio = report["read_csv_mb"].sum() / report["loan_book_mb"].sum()
+    print(f"memory reduction: {ratio:.1f}x")
+
+    if "transactions" in frames and "loans" in frames:
+        columns = ["product_type", "loan_status"]
+        lookup = frames["loans"][["loan_id", *columns]]
+        merge = min(
+            _time(lambda: frames["transactions"].merge(lookup, on="loan_id", how="left"))
+            for _ in range(args.repeat)
+        )
+        attach = min(
+            _time(lambda: book.attach("transactions", columns)) for _ in range(args.repeat)
+        )
+        print(f"loan attributes on transactions: merge {merge:.4f}s, attach {attach:.4f}s")
+
+
+if __name__ == "__main__":
+    main()
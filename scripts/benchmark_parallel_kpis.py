@@ -0,0 +1,92 @@
+"""
+Benchmark ParallelKPIExecutor throughput against serial segment_kpis calls.
+
+Usage:
+    python scripts/benchmark_parallel_kpis.py --loans 2000000 --workers 1 2 4 8
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from python.parallel_kpis import ParallelKPIExecutor  # noqa: E402
+from src.enterprise_analytics_engine import LoanAnalyticsEngine  # noqa: E402
+
+SEGMENTS = [
+    "currency",
+    "origination_quarter",
+    "product_type",
+    "region",
+    ["region", "product_type"],
+    ["currency", "origination_quarter"],
+    ["product_type", "origination_quarter"],
+    ["region", "origination_quarter"],
+]
+
+
+def build_book(loans: int, seed: int = 23) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "loan_id": np.arange(loans),
+            "principal": rng.uniform(1_000, 100_000, loans),
+            "interest_rate": rng.uniform(0.05, 0.35, loans),
+            "term_months": rng.choice([12, 24, 36], loans),
+            "origination_date": pd.Timestamp("2020-01-01")
+            + pd.to_timedelta(rng.integers(0, 2_000, loans), unit="D"),
+            "status": rng.choice(["current", "default", "prepaid", "arrears"], loans),
+            "days_in_arrears": rng.integers(0, 180, loans),
+            "balance": rng.uniform(0, 50_000, loans),
+            "payments_made": rng.uniform(0, 50_000, loans),
+            "write_off_amount": rng.uniform(0, 1_000, loans),
+            "currency": rng.choice(["USD", "EUR", "MXN"], loans),
+            "product_type": rng.choice(["factoring", "sme", "consumer", "auto"], loans),
+            "region": rng.choice([f"R{i:02d}" for i in range(40)], loans),
+        }
+    )
+
+
+def _time(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--loans", type=int, default=2_000_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    engine = LoanAnalyticsEngine(build_book(args.loans))
+
+    def serial() -> None:
+        for segment in SEGMENTS:
+            LoanAnalyticsEngine.from_prepared(
+                engine.data, engine.config, engine.statistics
+            ).segment_kpis(segment)
+
+    baseline = _time(serial)
+    rows = [{"workers": "serial", "seconds": round(baseline, 3), "speedup": 1.0}]
+    for workers in args.workers:
+        with ParallelKPIExecutor(max_workers=workers) as executor:
+            # Warm the pool so process start-up is not timed.
+            executor.segment_kpis(engine, SEGMENTS[:1])
+            elapsed = _time(lambda: executor.segment_kpis(engine, SEGMENTS))
+        rows.append(
+            {
+                "workers": workers,
+                "seconds": round(elapsed, 3),
+                "speedup": round(baseline / elapsed, 2),
+            }
+        )
+    print(pd.DataFrame(rows).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark the vectorized validation checks against the per-value loops they replaced.
+
+Usage:
+    python scripts/benchmark_validation.py --rows 1000000 5000000
+"""
+
+import argparse
+import re
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from python.validation import (  # noqa: E402
+    NUMERIC_COLUMNS,
+    validate_dataframe,
+    validate_iso8601_dates,
+    validate_no_nulls,
+    validate_numeric_bounds,
+    validation_failure_indices,
+)
+
+LEGACY_ISO8601_REGEX = re.compile(
+    r"^\d{4}-\d{2}-\d{2}(T\d{2}:\d{2}:\d{2}(\.\d+)?(Z|[+-]\d{2}:\d{2})?)?$"
+)
+
+
+def legacy_string_scan(df: pd.DataFrame, columns: List[str]) -> None:
+    """Per-cell string scan previously done by validate_dataframe."""
+    for col in columns:
+        if df[col].dtype == "object":
+            for x in df[col]:
+                if isinstance(x, str):
+                    raise ValueError(f"Column '{col}' must be numeric: {col}")
+
+
+def legacy_iso8601(df: pd.DataFrame, columns: List[str]) -> Dict[str, bool]:
+    """Per-value regex loop previously done by validate_iso8601_dates."""
+    validation: Dict[str, bool] = {}
+    for col in columns:
+        valid = True
+        for val in df[col]:
+            if pd.isnull(val) or isinstance(val, datetime):
+                continue
+            if not isinstance(val, str) or not LEGACY_ISO8601_REGEX.match(val):
+                valid = False
+                break
+        validation[f"{col}_iso8601"] = valid
+    return validation
+
+
+def build_tape(rows: int, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    data = {col: rng.uniform(0, 1_000_000, rows) for col in NUMERIC_COLUMNS}
+    # Object columns holding floats exercise the string scan without raising.
+    data["dpd_0_7_usd"] = pd.Series(data["dpd_0_7_usd"], dtype=object)
+    dates = pd.date_range("2020-01-01", periods=2000, freq="D").strftime("%Y-%m-%d")
+    data["measurement_date"] = rng.choice(np.asarray(dates, dtype=object), rows)
+    return pd.DataFrame(data)
+
+
+def _time(func: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def run(rows: int) -> Dict[str, float]:
+    df = build_tape(rows)
+    date_cols = ["measurement_date"]
+
+    legacy = _time(lambda: legacy_string_scan(df, ["dpd_0_7_usd"])) + _time(
+        lambda: legacy_iso8601(df, date_cols)
+    )
+    vectorized = _time(
+        lambda: validate_dataframe(df.copy(), numeric_columns=["dpd_0_7_usd"])
+    ) + _time(lambda: validate_iso8601_dates(df, date_cols))
+
+    assert legacy_iso8601(df, date_cols) == validate_iso8601_dates(df, date_cols)
+    failures = _time(lambda: validation_failure_indices(df, date_columns=date_cols))
+    bounds = _time(lambda: (validate_numeric_bounds(df), validate_no_nulls(df)))
+
+    return {
+        "rows": rows,
+        "legacy_s": round(legacy, 4),
+        "vectorized_s": round(vectorized, 4),
+        "speedup": round(legacy / vectorized, 1) if vectorized else float("inf"),
+        "failure_indices_s": round(failures, 4),
+        "bounds_and_nulls_s": round(bounds, 4),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    args = parser.parse_args()
+    results = pd.DataFrame([run(rows) for rows in args.rows])
+    print(results.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
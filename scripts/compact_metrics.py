@@ -0,0 +1,38 @@
+"""
+Merge per-run KPI files in the partitioned metrics dataset.
+
+Usage:
+    python scripts/compact_metrics.py --root data/metrics/kpis --min-files 8
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from python.metrics_store import MetricsStore  # noqa: E402
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--root", default="data/metrics/kpis", help="Metrics dataset directory")
+    parser.add_argument(
+        "--min-files",
+        type=int,
+        default=2,
+        help="Only compact date partitions holding at least this many files",
+    )
+    args = parser.parse_args()
+
+    merged = MetricsStore(Path(args.root)).compact(min_files=args.min_files)
+    for partition, files in merged.items():
+        print(f"{partition}: merged {files} files")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,9 +5,12 @@ build dark presentation slides consistent with the ABACO design tokens.
 
 import json
 from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional
 
 from python.theme import ABACO_THEME
 
+DEFAULT_OUTPUT_DIR = Path("exports/presentation")
+
 SLIDE_TOPICS = [
     {
         "title": "Portfolio Pulse",
@@ -32,7 +35,20 @@ SLIDE_TOPICS = [
 ]
 
 
-def export_payload(output_dir: Path) -> Path:
+def kpi_metrics(kpis: Mapping[str, Any]) -> List[Dict[str, str]]:
+    """Slide metrics for ``name -> value`` or ``name -> {"value": ...}`` KPIs."""
+    metrics = []
+    for key, entry in kpis.items():
+        value = entry.get("value") if isinstance(entry, dict) else entry
+        label = entry.get("metric", key) if isinstance(entry, dict) else key
+        metrics.append(
+            {"label": label, "value": f"{value:.2f}" if isinstance(value, float) else str(value)}
+        )
+    return metrics
+
+
+def export_payload(output_dir: Path, kpis: Optional[Mapping[str, Any]] = None) -> Path:
+    """Write the slide payload; computed run ``kpis`` are included when given."""
     payload = {
         "theme": ABACO_THEME,
         "slides": SLIDE_TOPICS,
@@ -42,6 +58,8 @@ def export_payload(output_dir: Path) -> Path:
             "Embed the growth path and treemap HTML artifacts from exports/presentation/.",
         ],
     }
+    if kpis:
+        payload["kpis"] = kpi_metrics(kpis)
     output_dir.mkdir(parents=True, exist_ok=True)
     path = output_dir / "copilot-slide-payload.json"
     path.write_text(json.dumps(payload, indent=2))
@@ -49,6 +67,5 @@ def export_payload(output_dir: Path) -> Path:
 
 
 if __name__ == "__main__":
-    target = Path("exports/presentation")
-    payload_file = export_payload(target)
+    payload_file = export_payload(DEFAULT_OUTPUT_DIR)
     print(f"Copilot payload written to {payload_file}")
@@ -7,12 +7,18 @@ exports/presentation/.
 
 import textwrap
 from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
 
 import pandas as pd
 import plotly.express as px
 
 from python.analytics import project_growth
 from python.theme import ABACO_THEME
+from scripts.export_copilot_slide_payload import kpi_metrics
+
+DEFAULT_OUTPUT_DIR = Path("exports/presentation")
+# kpi_df columns plotted by build_kpi_trend when present.
+TREND_COLUMNS = ["par30_pct", "par90_pct", "collection_rate_pct"]
 
 
 def apply_theme(fig: px.Figure) -> px.Figure:
@@ -76,7 +82,26 @@ def build_treemap(output_dir: Path) -> Path:
     return output_path
 
 
-def build_markdown_summary(output_dir: Path) -> Path:
+def build_kpi_trend(output_dir: Path, kpi_df: pd.DataFrame) -> Optional[Path]:
+    """Chart the run's PAR and collection rates by measurement date, if present."""
+    columns = [col for col in TREND_COLUMNS if col in kpi_df.columns]
+    if "measurement_date" not in kpi_df.columns or not columns:
+        return None
+    trend = kpi_df[["measurement_date", *columns]].copy()
+    trend["measurement_date"] = pd.to_datetime(trend["measurement_date"], errors="coerce")
+    trend = trend.dropna(subset=["measurement_date"]).sort_values("measurement_date")
+    fig = px.line(trend, x="measurement_date", y=columns, markers=True, title="KPI Trend")
+    apply_theme(fig)
+    output_path = output_dir / "kpi-trend.html"
+    fig.write_html(
+        str(output_path),
+        include_plotlyjs="cdn",
+        full_html=False,
+    )
+    return output_path
+
+
+def build_markdown_summary(output_dir: Path, kpis: Optional[Mapping[str, Any]] = None) -> Path:
     summary = textwrap.dedent(
         """
         # ABACO Slide Assets
@@ -92,21 +117,46 @@ def build_markdown_summary(output_dir: Path) -> Path:
         Use the HTML files as iframe backgrounds or screenshot them for Figma. Keep the markdown text for slide captions, KPIs, and spotlight highlights.
         """
     ).strip()
+    if kpis:
+        lines = [f"- **{metric['label']}:** {metric['value']}" for metric in kpi_metrics(kpis)]
+        summary += "\n\n## Run KPIs\n\n" + "\n".join(lines)
     summary_path = output_dir / "presentation-summary.md"
     summary_path.write_text(summary)
     return summary_path
 
 
-def main():
-    output_dir = Path("exports/presentation")
+def export_presentation(
+    output_dir: Path = DEFAULT_OUTPUT_DIR,
+    kpi_df: Optional[pd.DataFrame] = None,
+    kpis: Optional[Mapping[str, Any]] = None,
+) -> Dict[str, Path]:
+    """
+    Write the presentation assets and return ``asset name -> path``.
+
+    Callers that already hold the run's ``kpi_df`` and KPIs (such as the
+    data pipeline) pass them in; the KPI trend chart and the summary's KPI
+    section are only written when they are given.
+    """
+    output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
-    growth_chart = build_growth_chart(output_dir)
-    treemap = build_treemap(output_dir)
-    summary = build_markdown_summary(output_dir)
+    assets = {
+        "growth-path": build_growth_chart(output_dir),
+        "sales-treemap": build_treemap(output_dir),
+    }
+    if kpi_df is not None:
+        trend = build_kpi_trend(output_dir, kpi_df)
+        if trend is not None:
+            assets["kpi-trend"] = trend
+    assets["presentation-summary"] = build_markdown_summary(output_dir, kpis)
+    return assets
+
+
+def main():
+    assets = export_presentation(DEFAULT_OUTPUT_DIR)
     print("Exports ready:")
-    print(f"- Growth chart: {growth_chart}")
-    print(f"- Treemap: {treemap}")
-    print(f"- Summary: {summary}")
+    print(f"- Growth chart: {assets['growth-path']}")
+    print(f"- Treemap: {assets['sales-treemap']}")
+    print(f"- Summary: {assets['presentation-summary']}")
 
 
 if __name__ == "__main__":
@@ -1,27 +1,34 @@
 import argparse
-import json
 import logging
 import os
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
-from azure.core.exceptions import ResourceExistsError
-from azure.identity import DefaultAzureCredential
-from azure.storage.blob import BlobServiceClient, ContentSettings
 
 # Add project root to path for python/ modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
+from python.audit_store import AuditStore, append_ndjson, manifest_objects
+from python.blob_export import export_files
 from python.compliance import (
     build_compliance_report,
     create_access_log_entry,
     mask_pii_in_dataframe,
     write_compliance_report,
 )
-from python.ingestion import CascadeIngestion
+from python.incremental import (
+    PARTITION_COLUMN,
+    PartitionStateStore,
+    partition_fingerprints,
+    partition_sums,
+    select_partitions,
+)
+from python.ingestion import CascadeIngestion, is_columnar_file
 from python.kpi_engine import KPIEngine
+from python.metrics_store import MetricsStore
 from python.transformation import DataTransformation
 
 logging.basicConfig(
@@ -34,6 +41,9 @@ logger = logging.getLogger(__name__)
 DEFAULT_INPUT = os.getenv("PIPELINE_INPUT_FILE", "data/abaco_portfolio_calculations.csv")
 METRICS_DIR = Path("data/metrics")
 LOGS_DIR = Path("logs/runs")
+STATE_DIR = Path("data/state")
+METRICS_DATASET = "kpis"
+PRESENTATION_DIR = Path("exports/presentation")
 METRICS_DIR.mkdir(parents=True, exist_ok=True)
 LOGS_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -46,6 +56,15 @@ DEFAULT_AZURE_ACCOUNT_URL = os.getenv("PIPELINE_AZURE_ACCOUNT_URL") or os.getenv
 )
 DEFAULT_AZURE_BLOB_PREFIX = os.getenv("PIPELINE_AZURE_BLOB_PREFIX", "pipeline-runs")
 
+# processed_outputs entries that describe the run rather than name a file.
+NON_FILE_OUTPUTS = ("generated_at", "metrics_dataset", "row_scope", "partitions")
+# Which input rows the KPI dataset outputs hold.
+ROW_SCOPE_FULL = "full"
+ROW_SCOPE_CHANGED = "changed_partitions"
+ROW_SCOPE_NONE = "none"
+# Metrics the KPI stage reports; HealthScore is derived from PAR30 and CollectionRate.
+PIPELINE_METRICS = ["PAR30", "PAR90", "CollectionRate"]
+
 
 def log_stage(stage: str, message: str, **details: Any) -> None:
     detail_str = ", ".join(
@@ -66,17 +85,6 @@ def _is_dataframe_empty(df: Any) -> bool:
     return False
 
 
-def _guess_content_type(path: Path) -> str:
-    mapping = {
-        ".csv": "text/csv",
-        ".json": "application/json",
-        ".parquet": "application/octet-stream",
-        ".html": "text/html",
-        ".md": "text/markdown",
-    }
-    return mapping.get(path.suffix.lower(), "application/octet-stream")
-
-
 def upload_outputs_to_azure(
     processed_outputs: Dict[str, Any],
     run_id: str,
@@ -89,155 +97,319 @@ def upload_outputs_to_azure(
         raise ValueError("Azure container_name is required for export.")
     if not connection_string and not account_url:
         raise ValueError("Azure export requires a connection_string or account_url.")
-    blob_service_client = (
-        BlobServiceClient.from_connection_string(connection_string)
-        if connection_string
-        else BlobServiceClient(account_url=account_url, credential=DefaultAzureCredential())
-    )
-    container_client = blob_service_client.get_container_client(str(container_name).strip())
-    try:
-        container_client.create_container()
-    except ResourceExistsError:
-        logger.info("Azure container '%s' already exists.", container_client.container_name)
     prefix_parts = [blob_prefix.rstrip("/") if blob_prefix else None, run_id]
     prefix = "/".join([part for part in prefix_parts if part])
-    uploaded: Dict[str, str] = {}
 
-    # Upload all files in processed_outputs that point to existing files
+    # Upload all files in processed_outputs that point to existing files;
+    # metrics partition files keep their partition directory in the blob name.
+    files: Dict[str, Path] = {}
+    blob_names: Dict[str, str] = {}
     for key, file_path in processed_outputs.items():
-        if key == "generated_at":
+        if key in NON_FILE_OUTPUTS:
             continue
 
         if not file_path:
             continue
 
-        path_obj = Path(file_path)
-        if not path_obj.exists():
-            logger.warning("Azure export skipped missing file %s", path_obj)
-            continue
-
-        blob_name = f"{prefix}/{path_obj.name}" if prefix else path_obj.name
-        with path_obj.open("rb") as handle:
-            container_client.upload_blob(
-                name=blob_name,
-                data=handle,
-                overwrite=True,
-                content_settings=ContentSettings(content_type=_guess_content_type(path_obj)),
-            )
-        uploaded[key] = f"{container_client.container_name}/{blob_name}"
-
-    return uploaded
+        entries = file_path.items() if isinstance(file_path, dict) else [(None, file_path)]
+        for partition, entry in entries:
+            path_obj = Path(entry)
+            if not path_obj.exists():
+                logger.warning("Azure export skipped missing file %s", path_obj)
+                continue
+            if partition is None:
+                files[key] = path_obj
+            else:
+                name = f"{METRICS_DATASET}/{partition}/{path_obj.name}"
+                files[name] = path_obj
+                blob_names[name] = name
+
+    # The manifest refers to audit, lineage and raw files by hash; ship those
+    # objects under the same relative names so the exported copy resolves.
+    manifest_file = processed_outputs.get("manifest_file")
+    if manifest_file and Path(manifest_file).is_file():
+        for name, path_obj in manifest_objects(Path(manifest_file)).items():
+            files[name] = path_obj
+            blob_names[name] = name
+
+    return export_files(
+        files,
+        container_name,
+        connection_string=connection_string,
+        account_url=account_url,
+        prefix=prefix,
+        blob_names=blob_names,
+    )
 
 
-def rewrite_manifest(
-    manifest_path: Path,
+def build_manifest(
+    store: AuditStore,
     run_id: str,
     processed_outputs: Dict[str, Any],
     metadata: Dict[str, Any],
     compliance_path: Path,
-) -> None:
-    manifest = {
+    audit_ref: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Manifest whose audit, lineage and raw-file payloads are stored once by hash."""
+    return {
         "run_id": run_id,
         "timestamp": datetime.now(timezone.utc).isoformat(),
-        "raw_files": metadata.get("raw_files", []),
+        "raw_files": store.put(metadata.get("raw_files", [])),
         "processed_outputs": processed_outputs,
         "processed_data": metadata.get("processed_data"),
-        "lineage": metadata.get("lineage", []),
+        "lineage": store.put(metadata.get("lineage", [])),
         "user": metadata.get("user"),
         "action": metadata.get("action"),
-        "audit": metadata.get("audit", {}),
+        "audit": audit_ref or store.put(metadata.get("audit", {})),
         "compliance_report_file": str(compliance_path),
     }
-    manifest_path.parent.mkdir(parents=True, exist_ok=True)
-    with manifest_path.open("w", encoding="utf-8") as handle:
-        json.dump(manifest, handle, indent=2, default=str)
 
 
-def generate_presentation_assets(run_id: str) -> Dict[str, str]:
+def rewrite_manifest(
+    manifest_path: Path,
+    run_id: str,
+    processed_outputs: Dict[str, Any],
+    metadata: Dict[str, Any],
+    compliance_path: Path,
+) -> None:
+    store = AuditStore(LOGS_DIR)
+    manifest = build_manifest(store, run_id, processed_outputs, metadata, compliance_path)
+    store.write_manifest(manifest_path, manifest)
+
+
+def generate_presentation_assets(
+    run_id: str,
+    kpi_df: Optional[pd.DataFrame] = None,
+    kpis: Optional[Dict[str, Any]] = None,
+) -> Dict[str, str]:
     """
-    Run presentation export scripts and return paths to generated assets.
+    Export presentation assets in-process from the run's KPIs and return their paths.
     """
-    import subprocess
-
-    assets = {}
     try:
-        # Run export_presentation.py
-        subprocess.run(
-            [sys.executable, "scripts/export_presentation.py"],
-            check=True,
-            capture_output=True,
-            text=True,
-        )
+        # Imported here so runs only pay for plotly when assets are generated.
+        from scripts.export_copilot_slide_payload import export_payload
+        from scripts.export_presentation import export_presentation
 
-        # Run export_copilot_slide_payload.py
-        subprocess.run(
-            [sys.executable, "scripts/export_copilot_slide_payload.py"],
-            check=True,
-            capture_output=True,
-            text=True,
+        paths = export_presentation(PRESENTATION_DIR, kpi_df=kpi_df, kpis=kpis)
+        paths["copilot-slide-payload"] = export_payload(PRESENTATION_DIR, kpis=kpis)
+    except Exception as exc:
+        logger.error(f"Failed to generate presentation assets: {type(exc).__name__}: {exc}")
+        log_stage(
+            "pipeline:presentation", "Failed to generate assets", run_id=run_id, error=str(exc)
         )
+        return {}
+
+    assets = {f"presentation_{Path(path).stem}": str(path) for path in paths.values()}
+    log_stage("pipeline:presentation", "Generated presentation assets", count=len(assets))
+    return assets
 
-        # Collect generated files
-        presentation_dir = Path("exports/presentation")
-        if presentation_dir.exists():
-            for item in presentation_dir.glob("*"):
-                if item.is_file():
-                    assets[f"presentation_{item.stem}"] = str(item)
 
-        log_stage("pipeline:presentation", "Generated presentation assets", count=len(assets))
+def start_presentation_assets(
+    run_id: str, kpi_df: pd.DataFrame, kpis: Optional[Dict[str, Any]]
+) -> "Future[Dict[str, str]]":
+    """Generate presentation assets on a background thread."""
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="presentation")
+    future = executor.submit(generate_presentation_assets, run_id, kpi_df, kpis)
+    executor.shutdown(wait=False)
+    return future
 
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Failed to generate presentation assets: {e.stderr}")
-        log_stage("pipeline:presentation", "Failed to generate assets", error=str(e))
 
+def add_presentation_assets(
+    presentation: Optional["Future[Dict[str, str]]"], processed_outputs: Dict[str, Any]
+) -> Dict[str, str]:
+    """Wait for background assets and add any not yet listed to ``processed_outputs``."""
+    if presentation is None:
+        return {}
+    assets = {
+        key: path for key, path in presentation.result().items() if key not in processed_outputs
+    }
+    processed_outputs.update(assets)
     return assets
 
 
+def default_state_path(input_path: Path) -> Path:
+    return STATE_DIR / f"{input_path.stem}_partitions.json"
+
+
+def build_incremental_kpis(
+    state: PartitionStateStore, kpi_engine: KPIEngine
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Rebuild portfolio KPIs from the per-partition sums held in the state store,
+    with the engine's column and non-negative checks applied to the sums.
+    """
+    results = kpi_engine.calculate_metrics_from_partitions(
+        {key: entry.get("sums", {}) for key, entry in state.partitions.items()},
+        PIPELINE_METRICS,
+    )
+    return kpi_audit_entries(results, kpi_engine)
+
+
+def kpi_audit_entries(
+    results: Dict[str, Tuple[float, Dict[str, Any]]], kpi_engine: KPIEngine
+) -> Dict[str, Dict[str, Any]]:
+    """Audit ``kpis`` entries for ``PIPELINE_METRICS`` results plus the health score."""
+    par_30, par_ctx = results["PAR30"]
+    par_90, par90_ctx = results["PAR90"]
+    collection_rate, coll_ctx = results["CollectionRate"]
+    health_score, health_ctx = kpi_engine.calculate_portfolio_health(par_30, collection_rate)
+    return {
+        "par_30": {"value": par_30, **par_ctx},
+        "par_90": {"value": par_90, **par90_ctx},
+        "collection_rate": {"value": collection_rate, **coll_ctx},
+        "health_score": {"value": health_score, **health_ctx},
+    }
+
+
+def append_audit_log(audit_log: Optional[str], run_id: str, audit: Dict[str, Any]) -> None:
+    """Append this run's KPI audit entries to an NDJSON log, one line per entry."""
+    if not audit_log:
+        return
+    entries = [{"run_id": run_id, **entry} for entry in audit.get("kpi_audit_trail", [])]
+    appended = append_ndjson(Path(audit_log), entries)
+    log_stage("pipeline:audit_log", "Appended KPI audit entries", path=audit_log, entries=appended)
+
+
+def finish_unchanged_incremental_run(
+    run_id: str,
+    audit: Dict[str, Any],
+    state: PartitionStateStore,
+    user: str,
+    action: str,
+    compliance_log: List[Dict[str, Any]],
+    raw_files: List[Dict[str, Any]],
+    audit_log: Optional[str] = None,
+) -> bool:
+    """
+    Record KPIs from stored partition sums when no partition changed.
+
+    No KPI rows are written, but the run still gets its audit copy,
+    compliance report and manifest like any other run.
+    """
+    kpi_engine = KPIEngine(pd.DataFrame(), actor=user, action=action)
+    try:
+        audit["kpis"] = build_incremental_kpis(state, kpi_engine)
+        kpi_status = "completed"
+    except Exception as exc:
+        error_msg = f"KPI calculation error: {type(exc).__name__}: {exc}"
+        logger.exception(error_msg)
+        audit["errors"].append(error_msg)
+        kpi_status = "error"
+    audit["kpi_audit_trail"] = kpi_engine.get_audit_trail().to_dict(orient="records")
+    compliance_log.append(
+        create_access_log_entry(
+            "kpi", user, action, kpi_status, f"incremental partitions={len(state.partitions)}"
+        )
+    )
+    audit["incremental"]["skipped"] = True
+    audit["incremental"]["row_scope"] = ROW_SCOPE_NONE
+    audit["metadata"] = {
+        "user": user,
+        "action": action,
+        "initiated_at": datetime.now(timezone.utc).isoformat(),
+    }
+    audit["compliance"] = {
+        "pii_masked_columns": [],
+        "mask_stage": "not_run",
+        "access_log": compliance_log,
+    }
+
+    audit_path = LOGS_DIR / f"{run_id}.json"
+    manifest_path = LOGS_DIR / f"{run_id}_manifest.json"
+    compliance_path = LOGS_DIR / f"{run_id}_compliance_report.json"
+    processed_outputs = {
+        "manifest_file": str(manifest_path),
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "compliance_report_file": str(compliance_path),
+        "row_scope": ROW_SCOPE_NONE,
+    }
+    audit["processed_outputs"] = processed_outputs
+    compliance_report = build_compliance_report(
+        run_id, compliance_log, [], "not_run", audit["metadata"]
+    )
+    write_compliance_report(compliance_report, compliance_path)
+
+    store = AuditStore(LOGS_DIR)
+    audit_ref = store.put(audit)
+    store.copy_to(audit_ref, audit_path)
+    metadata_payload = {
+        "raw_files": raw_files,
+        "user": user,
+        "action": action,
+        "audit": audit,
+        "lineage": [],
+    }
+    store.write_manifest(
+        manifest_path,
+        build_manifest(
+            store,
+            run_id,
+            processed_outputs,
+            metadata_payload,
+            compliance_path,
+            audit_ref=audit_ref,
+        ),
+    )
+    if not audit["errors"]:
+        state.save()
+    append_audit_log(audit_log, run_id, audit)
+    log_stage(
+        "pipeline:complete",
+        "No changed partitions; KPIs rebuilt from partition state",
+        run_id=run_id,
+        partitions=len(state.partitions),
+        audit_file=str(audit_path),
+        manifest_file=str(manifest_path),
+    )
+    return not audit["errors"]
+
+
 def write_outputs(
     run_id: str,
     kpi_df: pd.DataFrame,
     audit: Dict[str, Any],
     metadata: Dict[str, Any],
     compliance_path: Path,
+    presentation_assets: Optional[Dict[str, str]] = None,
+    partitions: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
-    metrics_path = METRICS_DIR / f"{run_id}.parquet"
-    csv_path = METRICS_DIR / f"{run_id}.csv"
+    """
+    Persist the KPI rows, presentation assets, audit copy and manifest.
+
+    ``partitions`` lists the measurement dates ``kpi_df`` was limited to in
+    an incremental run; the outputs then hold only those rows, which
+    ``row_scope`` records.
+    """
+    metrics_store = MetricsStore(METRICS_DIR / METRICS_DATASET)
     audit_path = LOGS_DIR / f"{run_id}.json"
     manifest_path = LOGS_DIR / f"{run_id}_manifest.json"
 
-    kpi_df.to_parquet(metrics_path, index=False)
-    kpi_df.to_csv(csv_path, index=False)
+    metrics_files = metrics_store.append(kpi_df, run_id)
 
-    # Generate presentation assets
-    presentation_assets = generate_presentation_assets(run_id)
+    # Generate presentation assets unless the caller renders them in the background
+    if presentation_assets is None:
+        presentation_assets = generate_presentation_assets(run_id, kpi_df, audit.get("kpis"))
 
     processed_outputs = {
-        "metrics_file": str(metrics_path),
-        "csv_file": str(csv_path),
+        "metrics_dataset": str(metrics_store.root),
+        "metrics_files": {partition: str(path) for partition, path in metrics_files.items()},
         "manifest_file": str(manifest_path),
         "generated_at": datetime.now(timezone.utc).isoformat(),
         "compliance_report_file": str(compliance_path),
+        "row_scope": ROW_SCOPE_FULL if partitions is None else ROW_SCOPE_CHANGED,
         **presentation_assets,
     }
-
-    manifest = {
-        "run_id": run_id,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "raw_files": metadata.get("raw_files", []),
-        "processed_outputs": processed_outputs,
-        "processed_data": metadata.get("processed_data"),
-        "lineage": metadata.get("lineage", []),
-        "user": metadata.get("user"),
-        "action": metadata.get("action"),
-        "audit": metadata.get("audit", {}),
-        "compliance_report_file": str(compliance_path),
-    }
-
-    with audit_path.open("w", encoding="utf-8") as handle:
-        json.dump(audit, handle, indent=2, default=str)
-
-    with manifest_path.open("w", encoding="utf-8") as handle:
-        json.dump(manifest, handle, indent=2, default=str)
+    if partitions is not None:
+        processed_outputs["partitions"] = list(partitions)
+
+    # The audit is serialized once; the run file is a copy of the stored object.
+    store = AuditStore(LOGS_DIR)
+    audit_ref = store.put(audit)
+    store.copy_to(audit_ref, audit_path)
+    manifest = build_manifest(
+        store, run_id, processed_outputs, metadata, compliance_path, audit_ref=audit_ref
+    )
+    store.write_manifest(manifest_path, manifest)
 
     return processed_outputs
 
@@ -250,7 +422,18 @@ def run_pipeline(
     azure_connection_string: str | None = None,
     azure_account_url: str | None = None,
     azure_blob_prefix: str | None = None,
+    incremental: bool = False,
+    state_file: str | None = None,
+    portfolio_col: str | None = None,
+    audit_log: str | None = None,
+    background_presentation: bool = False,
+    low_memory: bool = False,
 ) -> bool:
+    if incremental and portfolio_col:
+        raise ValueError(
+            "portfolio_col is not supported in incremental mode; "
+            "per-portfolio KPIs need every partition's rows"
+        )
     user = user or os.getenv("PIPELINE_RUN_USER", "system")
     action = action or os.getenv("PIPELINE_RUN_ACTION", "manual")
     azure_container = azure_container or DEFAULT_AZURE_CONTAINER
@@ -293,9 +476,46 @@ def run_pipeline(
     )
     record_access("pipeline:start", "started", f"input_file={input_path}")
 
+    partition_state: Optional[PartitionStateStore] = None
+    fingerprints: Dict[str, str] = {}
+    file_hash: Optional[str] = None
+    if incremental:
+        partition_state = PartitionStateStore(
+            Path(state_file) if state_file else default_state_path(input_path)
+        )
+        file_hash = partition_state.input_hash(input_path) if input_path.exists() else None
+        audit["incremental"] = {
+            "state_file": str(partition_state.path),
+            "file_hash": file_hash,
+            "changed_partitions": [],
+            "skipped": False,
+            "row_scope": ROW_SCOPE_CHANGED,
+        }
+        if file_hash and file_hash == partition_state.file_hash:
+            record_access("incremental", "skipped", "input file unchanged")
+            unchanged_file = {
+                "file": str(input_path),
+                "status": "unchanged",
+                "sha256": file_hash,
+                "timestamp": ingestion.timestamp,
+            }
+            return finish_unchanged_incremental_run(
+                ingestion.run_id,
+                audit,
+                partition_state,
+                user,
+                action,
+                compliance_log,
+                [unchanged_file],
+                audit_log,
+            )
+
     df = pd.DataFrame()
     try:
-        df = ingestion.ingest_csv(input_path.name)
+        if is_columnar_file(input_path):
+            df = ingestion.ingest_columnar(input_path.name, columns=None)
+        else:
+            df = ingestion.ingest_csv(input_path.name)
     finally:
         raw_files = ingestion.raw_files or [
             {
@@ -319,6 +539,41 @@ def run_pipeline(
             f"rows={len(df)}, errors={len(ingestion.errors)}",
         )
 
+    if partition_state is not None and not _is_dataframe_empty(df):
+        if PARTITION_COLUMN in df.columns:
+            fingerprints = partition_fingerprints(df)
+            changed = partition_state.changed_partitions(fingerprints)
+            audit["incremental"]["changed_partitions"] = changed
+            log_stage(
+                "pipeline:incremental",
+                "Partition fingerprints compared",
+                run_id=ingestion.run_id,
+                partitions=len(fingerprints),
+                changed=len(changed),
+            )
+            if not changed:
+                partition_state.update(fingerprints, {}, file_hash)
+                record_access("incremental", "skipped", "no changed partitions")
+                return finish_unchanged_incremental_run(
+                    ingestion.run_id,
+                    audit,
+                    partition_state,
+                    user,
+                    action,
+                    compliance_log,
+                    raw_files,
+                    audit_log,
+                )
+            df = select_partitions(df, changed)
+            record_access("incremental", "started", f"changed_partitions={len(changed)}")
+        else:
+            logger.warning(
+                "Incremental mode needs a '%s' column; running a full rebuild.", PARTITION_COLUMN
+            )
+            audit["incremental"]["full_rebuild"] = True
+            audit["incremental"]["row_scope"] = ROW_SCOPE_FULL
+            partition_state = None
+
     try:
         if not _is_dataframe_empty(df):
             df = ingestion.validate_loans(df)
@@ -367,7 +622,9 @@ def run_pipeline(
             log_stage(
                 "pipeline:transformation", "Transforming to KPI dataset", run_id=ingestion.run_id
             )
-            kpi_df = transformer.transform_to_kpi_dataset(df)
+            kpi_df = transformer.transform_to_kpi_dataset(
+                df, low_memory=low_memory, measure_peak=low_memory
+            )
             kpi_df, masked_columns = mask_pii_in_dataframe(kpi_df)
             mask_stage = "post_transformation"
             record_access("compliance", "pii_masked", f"columns={masked_columns}")
@@ -398,35 +655,49 @@ def run_pipeline(
     lineage_records = transformer.get_lineage()
 
     try:
-        if not _is_dataframe_empty(kpi_df):
+        if not _is_dataframe_empty(kpi_df) and partition_state is not None:
+            log_stage(
+                "pipeline:kpi", "Rebuilding KPIs from partition sums", run_id=ingestion.run_id
+            )
+            partition_state.update(fingerprints, partition_sums(kpi_df), file_hash)
+            kpi_engine = KPIEngine(kpi_df, actor=user, action=action)
+            audit["kpis"] = build_incremental_kpis(partition_state, kpi_engine)
+            audit["kpi_audit_trail"] = kpi_engine.get_audit_trail().to_dict(orient="records")
+            record_access(
+                "kpi",
+                "completed",
+                f"incremental partitions={len(partition_state.partitions)}",
+            )
+        elif not _is_dataframe_empty(kpi_df):
             log_stage("pipeline:kpi", "Calculating KPIs", run_id=ingestion.run_id)
             kpi_engine = KPIEngine(kpi_df)
-            par_30, par_ctx = kpi_engine.calculate_par_30()
-            par_90, par90_ctx = kpi_engine.calculate_par_90()
-            collection_rate, coll_ctx = kpi_engine.calculate_collection_rate()
-            health_score, health_ctx = kpi_engine.calculate_portfolio_health(
-                par_30, collection_rate
+            audit["kpis"] = kpi_audit_entries(
+                kpi_engine.calculate_metrics(PIPELINE_METRICS), kpi_engine
             )
-            audit["kpis"] = {
-                "par_30": {"value": par_30, **par_ctx},
-                "par_90": {"value": par_90, **par90_ctx},
-                "collection_rate": {"value": collection_rate, **coll_ctx},
-                "health_score": {"value": health_score, **health_ctx},
-            }
+            if portfolio_col and portfolio_col in kpi_df.columns:
+                portfolio_kpis = kpi_engine.calculate_metrics_by(portfolio_col)
+                audit["portfolio_kpis"] = portfolio_kpis.to_dict(orient="records")
+                log_stage(
+                    "pipeline:kpi",
+                    "Portfolio KPIs calculated",
+                    portfolio_col=portfolio_col,
+                    portfolios=portfolio_kpis[portfolio_col].nunique(),
+                    run_id=ingestion.run_id,
+                )
+            elif portfolio_col:
+                logger.warning(
+                    "Portfolio column '%s' not found; skipping per-portfolio KPIs", portfolio_col
+                )
+                audit.setdefault("warnings", []).append(
+                    f"Portfolio column not found: {portfolio_col}"
+                )
             audit["kpi_audit_trail"] = kpi_engine.get_audit_trail().to_dict(orient="records")
-            log_stage(
-                "pipeline:kpi",
-                "KPIs calculated",
-                par_30=par_30,
-                par_90=par_90,
-                collection_rate=collection_rate,
-                health_score=health_score,
-                run_id=ingestion.run_id,
-            )
+            values = {name: entry["value"] for name, entry in audit["kpis"].items()}
+            log_stage("pipeline:kpi", "KPIs calculated", **values, run_id=ingestion.run_id)
             record_access(
                 "kpi",
                 "completed",
-                f"par_30={par_30}, par_90={par_90}",
+                f"par_30={values['par_30']}, par_90={values['par_90']}",
             )
         else:
             log_stage(
@@ -472,13 +743,24 @@ def run_pipeline(
     }
 
     compliance_path = LOGS_DIR / f"{ingestion.run_id}_compliance_report.json"
+    presentation: Optional["Future[Dict[str, str]]"] = None
     try:
         if _is_dataframe_empty(kpi_df):
             raise ValueError("No KPI dataset generated; cannot persist outputs.")
         log_stage("pipeline:output", "Writing outputs", run_id=ingestion.run_id)
         record_access("output", "started", "persisting metrics/csv/manifest")
+        if background_presentation:
+            presentation = start_presentation_assets(ingestion.run_id, kpi_df, audit.get("kpis"))
         processed_outputs = write_outputs(
-            ingestion.run_id, kpi_df, audit, metadata_payload, compliance_path
+            ingestion.run_id,
+            kpi_df,
+            audit,
+            metadata_payload,
+            compliance_path,
+            presentation_assets={} if presentation is not None else None,
+            partitions=(
+                audit["incremental"]["changed_partitions"] if partition_state is not None else None
+            ),
         )
         record_access("output", "completed", "metrics/csv/manifest persisted")
         record_access("compliance_report", "started", f"path={compliance_path}")
@@ -492,6 +774,14 @@ def run_pipeline(
         write_compliance_report(compliance_report, compliance_path)
         audit["processed_outputs"] = processed_outputs
 
+        azure_options = {
+            "container_name": azure_container,
+            "connection_string": azure_connection_string,
+            "account_url": azure_account_url,
+            "blob_prefix": azure_blob_prefix,
+        }
+        azure_uploads: Dict[str, str] = {}
+        azure_ok = False
         if azure_container:
             log_stage(
                 "pipeline:azure_export",
@@ -502,42 +792,67 @@ def run_pipeline(
             record_access("azure_export", "started", f"container={azure_container}")
             try:
                 azure_uploads = upload_outputs_to_azure(
-                    processed_outputs,
-                    ingestion.run_id,
-                    container_name=azure_container,
-                    connection_string=azure_connection_string,
-                    account_url=azure_account_url,
-                    blob_prefix=azure_blob_prefix,
+                    processed_outputs, ingestion.run_id, **azure_options
                 )
+                azure_ok = True
             except Exception as azure_exc:
                 error_msg = f"Azure export failed: {type(azure_exc).__name__}: {azure_exc}"
                 logger.exception(error_msg)
                 audit["errors"].append(error_msg)
                 pipeline_success = False
                 record_access("azure_export", "error", error_msg)
+
+        # Background assets rendered while the outputs above were uploading.
+        assets = add_presentation_assets(presentation, processed_outputs)
+        presentation = None
+        if assets and azure_ok:
+            # Assets are optional, so a failed upload keeps the run's result.
+            try:
+                azure_uploads.update(
+                    upload_outputs_to_azure(assets, ingestion.run_id, **azure_options)
+                )
+            except Exception as azure_exc:
+                warning = (
+                    "Azure export of presentation assets failed: "
+                    f"{type(azure_exc).__name__}: {azure_exc}"
+                )
+                logger.warning(warning, exc_info=True)
+                audit.setdefault("warnings", []).append(warning)
+                record_access("azure_export", "warning", warning)
+        if azure_ok:
+            if azure_uploads:
+                processed_outputs["azure_blobs"] = azure_uploads
+                record_access("azure_export", "completed", f"uploaded={list(azure_uploads.keys())}")
             else:
-                if azure_uploads:
-                    processed_outputs["azure_blobs"] = azure_uploads
-                    audit["processed_outputs"] = processed_outputs
-                    metadata_payload["audit"] = audit
-                    rewrite_manifest(
-                        Path(processed_outputs["manifest_file"]),
-                        ingestion.run_id,
-                        processed_outputs,
-                        metadata_payload,
-                        compliance_path,
-                    )
-                    record_access(
-                        "azure_export", "completed", f"uploaded={list(azure_uploads.keys())}"
-                    )
-                else:
-                    record_access("azure_export", "skipped", "no files uploaded")
+                record_access("azure_export", "skipped", "no files uploaded")
+
+        # write_outputs wrote the manifest; rewrite it once if anything was added since.
+        if assets or azure_uploads:
+            audit["processed_outputs"] = processed_outputs
+            metadata_payload["audit"] = audit
+            rewrite_manifest(
+                Path(processed_outputs["manifest_file"]),
+                ingestion.run_id,
+                processed_outputs,
+                metadata_payload,
+                compliance_path,
+            )
     except Exception as exc:
         error_msg = f"Failed to write outputs: {type(exc).__name__}: {exc}"
         logger.exception(error_msg)
         audit["errors"].append(error_msg)
         record_access("output", "error", error_msg)
         pipeline_success = False
+    finally:
+        if presentation is not None:
+            # Outputs failed before the assets were collected; do not leave the
+            # worker running past the run.
+            wait([presentation])
+
+    if partition_state is not None and pipeline_success and not audit.get("errors"):
+        partition_state.save()
+
+    append_audit_log(audit_log, ingestion.run_id, audit)
 
     log_stage(
         "pipeline:complete",
@@ -554,7 +869,9 @@ def run_pipeline(
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Run the ABACO data pipeline")
-    parser.add_argument("--input", default=DEFAULT_INPUT, help="Path to the CSV input file")
+    parser.add_argument(
+        "--input", default=DEFAULT_INPUT, help="Path to the CSV, Parquet or Arrow input file"
+    )
     parser.add_argument("--user", help="Identifier for the user or system triggering the pipeline")
     parser.add_argument("--action", help="Action context (e.g., github-action, manual-run)")
     parser.add_argument("--azure-container", help="Azure Blob container to upload cleaned outputs")
@@ -566,7 +883,39 @@ if __name__ == "__main__":
     parser.add_argument(
         "--azure-blob-prefix", help="Prefix for blob paths (default: pipeline-runs/<run_id>)"
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only process new or changed measurement_date partitions",
+    )
+    parser.add_argument(
+        "--state-file",
+        help=(
+            "Partition state file for incremental runs "
+            "(default: data/state/<input>_partitions.json)"
+        ),
+    )
+    parser.add_argument(
+        "--portfolio-col",
+        help="Also compute KPIs per value of this column (e.g. lender, facility)",
+    )
+    parser.add_argument(
+        "--audit-log",
+        help="Append each run's KPI audit entries to this newline-delimited JSON file",
+    )
+    parser.add_argument(
+        "--background-presentation",
+        action="store_true",
+        help="Render presentation assets on a background thread, overlapping the Azure upload",
+    )
+    parser.add_argument(
+        "--low-memory",
+        action="store_true",
+        help="Transform on a single copy of the input and record its peak memory in the lineage",
+    )
     args = parser.parse_args()
+    if args.incremental and args.portfolio_col:
+        parser.error("--portfolio-col cannot be combined with --incremental")
     run_pipeline(
         input_file=args.input,
         user=args.user,
@@ -575,4 +924,10 @@ if __name__ == "__main__":
         azure_connection_string=args.azure_connection_string,
         azure_account_url=args.azure_account_url,
         azure_blob_prefix=args.azure_blob_prefix,
+        incremental=args.incremental,
+        state_file=args.state_file,
+        portfolio_col=args.portfolio_col,
+        audit_log=args.audit_log,
+        background_presentation=args.background_presentation,
+        low_memory=args.low_memory,
     )
@@ -2,15 +2,76 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
-from typing import Iterable, List, Optional
+from itertools import combinations
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
+CASHFLOW_SCHEDULES = ("even", "amortizing")
+DEFAULT_CASHFLOW_CHUNK_SIZE = 50_000
+SEGMENT_TOTAL_LABEL = "All"
+# Known loan statuses after normalization; "" marks a missing status.
+STATUS_CATEGORIES = ("current", "arrears", "npl", "default", "prepaid", "")
+DEFAULT_DATE_FORMAT = "%Y-%m-%d"
+# Additive per-loan measures kept as sufficient statistics by the engine.
+STATISTIC_COLUMNS = (
+    "loans",
+    "principal",
+    "rate_x_principal",
+    "write_off_amount",
+    "payments_made",
+    "balance",
+)
+
+
+def _month_end_timestamps(ordinals: np.ndarray) -> pd.DatetimeIndex:
+    """Month-end timestamps for monthly period ordinals."""
+    periods = pd.PeriodIndex.from_ordinals(ordinals, freq="M")
+    return periods.to_timestamp(how="start") + pd.offsets.MonthEnd(0)
+
+
+def _parse_dates(values: pd.Series, date_format: Optional[str]) -> pd.Series:
+    """Parse each distinct value once, trying ``date_format`` before inference.
+
+    Raises ValueError when a value cannot be parsed.
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    codes, uniques = pd.factorize(values)
+    try:
+        parsed = pd.to_datetime(uniques, format=date_format)
+    except (ValueError, TypeError):
+        parsed = pd.to_datetime(uniques)
+    dates = pd.DatetimeIndex(parsed).take(codes, allow_fill=True, fill_value=pd.NaT)
+    return pd.Series(dates, index=values.index, name=values.name)
+
+
+def _normalize_status(values: pd.Series) -> pd.Categorical:
+    """Lower-cased, stripped status as a categorical over ``STATUS_CATEGORIES``.
+
+    Unexpected statuses are appended to the category set rather than dropped.
+    """
+    codes, uniques = pd.factorize(values)
+    labels = pd.Index(uniques).astype(str).str.lower().str.strip()
+    labels = labels.where(labels != "nan", "")
+    categories = pd.Index([*STATUS_CATEGORIES, *sorted(set(labels).difference(STATUS_CATEGORIES))])
+    # Missing values (code -1) pick the trailing "" code.
+    label_codes = np.append(categories.get_indexer(labels), categories.get_loc(""))
+    return pd.Categorical.from_codes(label_codes[codes], categories=categories)
+
+
+def _quarter_labels(dates: pd.Series) -> np.ndarray:
+    """Quarter labels such as 2024Q1, formatting each distinct quarter once."""
+    codes, quarters = pd.factorize(dates.dt.to_period("Q"))
+    return np.append(quarters.astype(str).to_numpy(), "NaT")[codes]
+
 
 @dataclass(frozen=True)
 class LoanAnalyticsConfig:
     arrears_threshold: int = 90
     currency: str = "USD"
+    date_format: Optional[str] = DEFAULT_DATE_FORMAT
 
 
 class LoanAnalyticsEngine:
@@ -45,6 +106,38 @@ class LoanAnalyticsEngine:
     def __init__(self, frame: pd.DataFrame, config: Optional[LoanAnalyticsConfig] = None):
         self.config = config or LoanAnalyticsConfig()
         self.data = self._prepare_data(frame.copy())
+        self._statistics[()] = self._sufficient_statistics(self.data)
+
+    @classmethod
+    def from_prepared(
+        cls,
+        data: pd.DataFrame,
+        config: Optional[LoanAnalyticsConfig] = None,
+        statistics: Optional[pd.DataFrame] = None,
+    ) -> "LoanAnalyticsEngine":
+        """Wrap data that already went through ``_prepare_data``.
+
+        Used by worker processes that rebuild the prepared columns from shared
+        memory; ``statistics`` reuses the parent's precomputed sums.
+        """
+        engine = cls.__new__(cls)
+        engine.config = config or LoanAnalyticsConfig()
+        engine.data = data
+        if statistics is None:
+            statistics = cls._sufficient_statistics(data)
+        engine._statistics[()] = statistics
+        return engine
+
+    @property
+    def data(self) -> pd.DataFrame:
+        """Prepared loan rows; assigning new rows drops the cached statistics."""
+        return self._data
+
+    @data.setter
+    def data(self, frame: pd.DataFrame) -> None:
+        self._data = frame
+        # Per-status sums reused by every KPI call; keyed by segment columns.
+        self._statistics: Dict[Tuple[str, ...], pd.DataFrame] = {}
 
     def _prepare_data(self, frame: pd.DataFrame) -> pd.DataFrame:
         missing = self.REQUIRED_COLUMNS.difference(frame.columns)
@@ -53,28 +146,30 @@ class LoanAnalyticsEngine:
 
         # strict date validation
         try:
-            frame["origination_date"] = pd.to_datetime(frame["origination_date"], errors="raise")
+            frame["origination_date"] = _parse_dates(
+                frame["origination_date"], self.config.date_format
+            )
         except Exception as exc:  # pragma: no cover - error rewrapped
             raise ValueError("Invalid origination_date values") from exc
 
         # numeric coercion with validation
-        coerced = frame[self.NUMERIC_COLUMNS].apply(pd.to_numeric, errors="coerce")
-        if coerced.isna().any().any():
-            invalid_cols = coerced.columns[coerced.isna().any()].tolist()
+        for col in self.NUMERIC_COLUMNS:
+            if not pd.api.types.is_numeric_dtype(frame[col]):
+                frame[col] = pd.to_numeric(frame[col], errors="coerce")
+        invalid = frame[self.NUMERIC_COLUMNS].isna().any()
+        if invalid.any():
+            invalid_cols = invalid.index[invalid].tolist()
             raise ValueError(f"Invalid numeric values encountered in columns: {invalid_cols}")
-        frame[self.NUMERIC_COLUMNS] = coerced
 
-        frame["status"] = frame["status"].astype(str).str.lower().str.strip().replace({"nan": ""})
+        frame["status"] = _normalize_status(frame["status"])
+        is_default = (frame["status"] == "default").to_numpy()
 
-        frame["arrears_flag"] = (
-            frame["status"].isin({"arrears", "npl", "default"})
-            | (frame["days_in_arrears"] >= self.config.arrears_threshold)
+        frame["arrears_flag"] = frame["status"].isin({"arrears", "npl", "default"}) | (
+            frame["days_in_arrears"] >= self.config.arrears_threshold
         )
 
-        frame["origination_quarter"] = frame["origination_date"].dt.to_period("Q").astype(str)
-        frame["exposure_at_default"] = frame.apply(
-            lambda row: row["balance"] if row["status"] == "default" else 0.0, axis=1
-        )
+        frame["origination_quarter"] = _quarter_labels(frame["origination_date"])
+        frame["exposure_at_default"] = np.where(is_default, frame["balance"].to_numpy(), 0.0)
         frame["currency"] = frame.get(
             "currency",
             pd.Series(self.config.currency, index=frame.index),
@@ -82,111 +177,342 @@ class LoanAnalyticsEngine:
 
         return frame
 
-    def portfolio_kpis(self) -> dict:
-        df = self.data
-        exposure = df["principal"].sum()
-        if exposure <= 0:
-            raise ValueError("Total exposure cannot be zero")
+    @property
+    def statistics(self) -> pd.DataFrame:
+        """Sums of ``STATISTIC_COLUMNS`` per status and arrears flag.
+
+        Computed at construction and again after ``data`` is reassigned;
+        changes made to ``data`` in place are not reflected.
+        """
+        if () not in self._statistics:
+            self._statistics[()] = self._sufficient_statistics(self.data)
+        return self._statistics[()]
+
+    def portfolio_kpis(self, statuses: Optional[Iterable[str]] = None) -> dict:
+        """Portfolio KPIs from the precomputed statistics.
 
-        weighted_interest_rate = (df["interest_rate"] * df["principal"]).sum() / exposure
-        arrears_exposure = df.loc[df["arrears_flag"], "principal"].sum()
-        default_exposure = df.loc[df["status"] == "default", "principal"].sum()
-        prepaid_exposure = df.loc[df["status"] == "prepaid", "principal"].sum()
-
-        lgd = self._calculate_lgd(df)
-        repayment_velocity = self._repayment_velocity(df)
-
-        return {
-            "currency": df["currency"].iloc[0],
-            "exposure": exposure,
-            "weighted_interest_rate": weighted_interest_rate,
-            "npl_ratio": arrears_exposure / exposure,
-            "default_rate": default_exposure / exposure,
-            "lgd": lgd,
-            "prepayment_rate": prepaid_exposure / exposure,
-            "repayment_velocity": repayment_velocity,
-        }
+        ``statuses`` restricts the portfolio to loans with those statuses, e.g.
+        to see KPIs with prepaid loans excluded, without rescanning the book.
+        """
+        stats = self.statistics
+        if statuses is not None:
+            wanted = {str(status).lower().strip() for status in statuses}
+            stats = stats[stats.index.get_level_values("status").isin(wanted)]
+        return self._portfolio_kpis_from_statistics(stats)
+
+    def _portfolio_kpis_from_statistics(self, stats: pd.DataFrame) -> dict:
+        """Portfolio KPIs plus the currency of the first loan the statistics cover."""
+        sums = self._components_from_statistics(stats)
+        kpis = self._kpis_from_sums(sums).iloc[0].to_dict()
+        return {"currency": sums["currency"].iloc[0], **kpis}
+
+    def _statistics_for_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        return self.statistics if df is self.data else self._sufficient_statistics(df)
 
     def _calculate_lgd(self, df: pd.DataFrame) -> float:
-        default_exposure = df.loc[df["status"] == "default", "principal"].sum()
-        if default_exposure == 0:
+        sums = self._components_from_statistics(self._statistics_for_frame(df)).iloc[0]
+        if sums["default_principal"] == 0:
             return 0.0
-        write_offs = df.loc[df["status"] == "default", "write_off_amount"].sum()
-        return write_offs / default_exposure
+        return sums["write_offs"] / sums["default_principal"]
 
     def _repayment_velocity(self, df: pd.DataFrame) -> float:
-        exposure = df["principal"].sum()
-        if exposure == 0:
+        sums = self._components_from_statistics(self._statistics_for_frame(df)).iloc[0]
+        if sums["exposure"] == 0:
             return 0.0
-        payments = df["payments_made"].sum()
-        return payments / exposure
+        return sums["payments_made"] / sums["exposure"]
+
+    @staticmethod
+    def _sufficient_statistics(df: pd.DataFrame, keys: Sequence[str] = ()) -> pd.DataFrame:
+        """Sum ``STATISTIC_COLUMNS`` by ``keys`` then status and arrears flag.
+
+        Each group also keeps its first row position and that row's currency,
+        so currencies derived from the statistics are those of the first loan
+        in frame order, as ``df["currency"].iloc[0]`` would give.
+        """
+        principal = df["principal"]
+        values = pd.DataFrame(
+            {
+                "loans": np.ones(len(df), dtype=np.int64),
+                "principal": principal,
+                "rate_x_principal": df["interest_rate"] * principal,
+                "write_off_amount": df["write_off_amount"],
+                "payments_made": df["payments_made"],
+                "balance": df["balance"],
+                "currency": df["currency"],
+                "first_row": np.arange(len(df)),
+            },
+            index=df.index,
+        )
+        aggregations = {col: "sum" for col in STATISTIC_COLUMNS}
+        aggregations["currency"] = "first"
+        aggregations["first_row"] = "min"
+        by = [df[key] for key in keys] + [df["status"], df["arrears_flag"]]
+        return values.groupby(by, observed=True).agg(aggregations)
+
+    @staticmethod
+    def _components_from_statistics(stats: pd.DataFrame, n_keys: int = 0) -> pd.DataFrame:
+        """Additive KPI terms from status-level statistics, summed to the first
+        ``n_keys`` index levels (a single total row when zero)."""
+        is_default = stats.index.get_level_values(n_keys) == "default"
+        is_prepaid = stats.index.get_level_values(n_keys) == "prepaid"
+        in_arrears = stats.index.get_level_values(n_keys + 1).to_numpy(dtype=bool)
+        principal = stats["principal"].to_numpy()
+        components = pd.DataFrame(
+            {
+                "exposure": principal,
+                "rate_x_principal": stats["rate_x_principal"].to_numpy(),
+                "arrears_principal": np.where(in_arrears, principal, 0.0),
+                "default_principal": np.where(is_default, principal, 0.0),
+                "prepaid_principal": np.where(is_prepaid, principal, 0.0),
+                "write_offs": np.where(is_default, stats["write_off_amount"].to_numpy(), 0.0),
+                "payments_made": stats["payments_made"].to_numpy(),
+                "currency": stats["currency"].to_numpy(),
+                "first_row": stats["first_row"].to_numpy(),
+            },
+            index=stats.index,
+        )
+        # Earliest rows first, so "first" picks the currency of each group's first loan.
+        components = components.sort_values("first_row", kind="stable")
+        aggregations = {col: "sum" for col in components.columns}
+        aggregations.update(currency="first", first_row="min")
+        if n_keys:
+            return components.groupby(level=list(range(n_keys)), observed=True).agg(aggregations)
+        total = components.drop(columns=["currency", "first_row"]).sum().to_frame().T
+        total["currency"] = components["currency"].iloc[0] if len(components) else None
+        total["first_row"] = components["first_row"].iloc[0] if len(components) else None
+        return total
+
+    @staticmethod
+    def _kpis_from_sums(sums: pd.DataFrame) -> pd.DataFrame:
+        """Derive the KPI ratios column-wise from aggregated components."""
+        exposure = sums["exposure"]
+        if (exposure <= 0).any():
+            raise ValueError("Total exposure cannot be zero")
+        defaults = sums["default_principal"]
+        return pd.DataFrame(
+            {
+                "exposure": exposure,
+                "weighted_interest_rate": sums["rate_x_principal"] / exposure,
+                "npl_ratio": sums["arrears_principal"] / exposure,
+                "default_rate": defaults / exposure,
+                "lgd": (sums["write_offs"] / defaults).where(defaults != 0, 0.0),
+                "prepayment_rate": sums["prepaid_principal"] / exposure,
+                "repayment_velocity": sums["payments_made"] / exposure,
+            },
+            index=sums.index,
+        )
 
-    def _portfolio_kpis_for_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _portfolio_kpis_for_frame(self, df: pd.DataFrame) -> dict:
         """
         Compute portfolio KPIs for an already-prepared DataFrame without
         re-running data normalization or schema checks.
-        This reuses the existing `portfolio_kpis` implementation by
-        temporarily swapping `self.data`.
         """
-        original_data = self.data
-        try:
-            self.data = df
-            return self.portfolio_kpis()
-        finally:
-            self.data = original_data
-
-    def segment_kpis(self, segment: str) -> pd.DataFrame:
-        if segment not in self.data.columns:
-            raise ValueError(f"Segment column '{segment}' not found")
-
-        rows = []
-        for value, group in self.data.groupby(segment):
-            metrics = self._portfolio_kpis_for_frame(group)
-            metrics[segment] = value
-            rows.append(metrics)
-        return pd.DataFrame(rows)
+        return self._portfolio_kpis_from_statistics(self._statistics_for_frame(df))
+
+    def segment_kpis(
+        self,
+        segment: Union[str, Sequence[str]],
+        rollup: bool = False,
+        cube: bool = False,
+    ) -> pd.DataFrame:
+        """Portfolio KPIs per segment, from a single grouped aggregation.
+
+        The per-segment statistics are cached, so repeated calls for the same
+        keys only re-derive the ratios.
+
+        ``segment`` may be one column or several. ``rollup`` adds subtotals
+        for each prefix of the keys plus a grand total; ``cube`` adds every
+        combination. Subtotal rows carry ``SEGMENT_TOTAL_LABEL`` in the
+        aggregated-away key columns.
+        """
+        keys = [segment] if isinstance(segment, str) else list(segment)
+        for key in keys:
+            if key not in self.data.columns:
+                raise ValueError(f"Segment column '{key}' not found")
+
+        cache_key = tuple(keys)
+        if cache_key not in self._statistics:
+            self._statistics[cache_key] = self._sufficient_statistics(self.data, keys)
+        sums = self._components_from_statistics(self._statistics[cache_key], len(keys))
+        aggregations = {col: "sum" for col in sums.columns}
+        aggregations.update(currency="first", first_row="min")
+
+        if rollup or cube:
+            if cube:
+                grouping_sets = [
+                    list(subset)
+                    for size in range(len(keys), -1, -1)
+                    for subset in combinations(keys, size)
+                ]
+            else:
+                grouping_sets = [keys[:size] for size in range(len(keys), -1, -1)]
+            sums = pd.concat(
+                [self._subtotal(sums, keys, subset, aggregations) for subset in grouping_sets]
+            )
+
+        result = self._kpis_from_sums(sums)
+        if "currency" not in keys:
+            result.insert(0, "currency", sums["currency"])
+        return result.reset_index()[[*result.columns, *keys]]
+
+    @staticmethod
+    def _subtotal(
+        sums: pd.DataFrame, keys: List[str], subset: List[str], aggregations: dict
+    ) -> pd.DataFrame:
+        """Re-aggregate finest-level sums over ``subset`` of the segment keys."""
+        if len(subset) == len(keys):
+            return sums
+        sums = sums.sort_values("first_row", kind="stable")
+        if subset:
+            grouped = sums.groupby(level=subset, observed=True).agg(aggregations).reset_index()
+        else:
+            grand_total = np.zeros(len(sums), dtype=np.int8)
+            grouped = sums.groupby(grand_total).agg(aggregations).reset_index(drop=True)
+        for key in keys:
+            if key not in subset:
+                grouped[key] = SEGMENT_TOTAL_LABEL
+        return grouped.set_index(keys)
 
     def vintage_default_table(self) -> pd.DataFrame:
         df = self.data
-        grouped = df.groupby("origination_quarter")
-        rows = []
-        for quarter, group in grouped:
-            principal = group["principal"].sum()
-            defaulted = group.loc[group["status"] == "default", "principal"].sum()
-            rows.append(
+        principal = df["principal"]
+        sums = (
+            pd.DataFrame(
                 {
-                    "origination_quarter": quarter,
                     "principal": principal,
-                    "default_rate": defaulted / principal if principal else 0.0,
-                    "defaults_principal": defaulted,
+                    "defaults_principal": principal.where(df["status"] == "default", 0.0),
                 }
             )
-        result = pd.DataFrame(rows)
-        return result.sort_values("origination_quarter").reset_index(drop=True)
+            .groupby(df["origination_quarter"])
+            .sum()
+            .reset_index()
+        )
+        sums["default_rate"] = (sums["defaults_principal"] / sums["principal"]).where(
+            sums["principal"] != 0, 0.0
+        )
+        return sums[["origination_quarter", "principal", "default_rate", "defaults_principal"]]
 
-    def cashflow_curve(self, freq: str = "M") -> pd.DataFrame:
-        """Simulate expected cashflows by spreading payments evenly across term."""
+    @staticmethod
+    def _schedule_months(frame: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """First cashflow month (monthly period ordinal) and whole-month term per loan.
 
-        records = []
-        for _, row in self.data.iterrows():
-            monthly_payment = row["payments_made"] / max(row["term_months"], 1)
-            periods = pd.date_range(start=row["origination_date"], periods=row["term_months"], freq="M")
-            for period in periods:
-                records.append({"period": period, "cashflow": monthly_payment})
+        Matches the month-ends ``pd.date_range(origination_date,
+        periods=term_months, freq="ME")`` yields for each loan. Raises
+        ValueError when a loan has no origination_date.
+        """
+        undated = int(frame["origination_date"].isna().sum())
+        if undated:
+            raise ValueError(
+                f"Cannot project cashflows: {undated} loans have no origination_date"
+            )
+        start = frame["origination_date"].dt.to_period("M").array.asi8
+        terms = np.trunc(frame["term_months"].to_numpy(dtype="float64")).clip(min=0)
+        return start, terms.astype(np.int64)
+
+    def _cashflow_schedule(
+        self, frame: pd.DataFrame, schedule: str = "even"
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Optional[np.ndarray]]:
+        """Expand loans into (loan position, month ordinal, cashflow, principal) arrays."""
+        if schedule not in CASHFLOW_SCHEDULES:
+            raise ValueError(
+                f"Unknown cashflow schedule '{schedule}', expected one of {CASHFLOW_SCHEDULES}"
+            )
 
-        curve = pd.DataFrame(records)
-        if curve.empty:
+        start, terms = self._schedule_months(frame)
+        loan_pos = np.repeat(np.arange(len(frame)), terms)
+        offsets = np.arange(int(terms.sum())) - np.repeat(np.cumsum(terms) - terms, terms)
+        months = start[loan_pos] + offsets
+
+        if schedule == "even":
+            per_month = frame["payments_made"].to_numpy(dtype="float64") / np.maximum(terms, 1)
+            return loan_pos, months, per_month[loan_pos], None
+
+        principal = frame["principal"].to_numpy(dtype="float64")
+        rate = frame["interest_rate"].to_numpy(dtype="float64") / 12
+        n = np.maximum(terms, 1).astype("float64")
+        with np.errstate(divide="ignore", invalid="ignore"):
+            installment = np.where(
+                rate > 0, rate * principal / (1 - np.power(1 + rate, -n)), principal / n
+            )
+        # Principal share of installment k (0-based) is installment * (1 + r) ** -(n - k).
+        loan_rate = rate[loan_pos]
+        principal_part = np.where(
+            loan_rate > 0,
+            installment[loan_pos] * np.power(1 + loan_rate, -(n[loan_pos] - offsets)),
+            installment[loan_pos],
+        )
+        return loan_pos, months, installment[loan_pos], principal_part
+
+    def iter_cashflow_schedule(
+        self, schedule: str = "even", chunk_size: int = DEFAULT_CASHFLOW_CHUNK_SIZE
+    ) -> Iterator[pd.DataFrame]:
+        """Yield loan-level projected cashflows (loan_id, period, cashflow) in loan chunks."""
+        for begin in range(0, len(self.data), chunk_size):
+            chunk = self.data.iloc[begin : begin + chunk_size]
+            loan_pos, months, cashflow, principal_part = self._cashflow_schedule(chunk, schedule)
+            out = pd.DataFrame(
+                {
+                    "loan_id": chunk["loan_id"].to_numpy()[loan_pos],
+                    "period": _month_end_timestamps(months),
+                    "cashflow": cashflow,
+                }
+            )
+            if principal_part is not None:
+                out["principal"] = principal_part
+                out["interest"] = cashflow - principal_part
+            yield out
+
+    def cashflow_curve(
+        self,
+        freq: str = "ME",
+        schedule: str = "even",
+        chunk_size: int = DEFAULT_CASHFLOW_CHUNK_SIZE,
+    ) -> pd.DataFrame:
+        """Project expected cashflows per period.
+
+        ``schedule="even"`` spreads ``payments_made`` evenly across the term;
+        ``schedule="amortizing"`` projects the level annuity installment on
+        ``principal`` at ``interest_rate / 12`` and adds principal/interest
+        columns. Loans are expanded ``chunk_size`` at a time and binned into
+        monthly totals, so memory is bounded by the chunk rather than the book.
+        """
+        start, terms = self._schedule_months(self.data)
+        active = terms > 0
+        if not active.any():
             return pd.DataFrame(columns=["period", "cashflow", "cumulative_cashflow"])
 
-        agg = (
-            curve.set_index("period")
-            .groupby(pd.Grouper(freq=freq))
-            .sum(numeric_only=True)
-            .rename_axis("period")
-            .reset_index()
+        first_month = int(start[active].min())
+        span = int((start + terms)[active].max()) - first_month
+        totals = {"cashflow": np.zeros(span)}
+        if schedule == "amortizing":
+            totals["principal"] = np.zeros(span)
+
+        for begin in range(0, len(self.data), chunk_size):
+            chunk = self.data.iloc[begin : begin + chunk_size]
+            _, months, cashflow, principal_part = self._cashflow_schedule(chunk, schedule)
+            index = months - first_month
+            totals["cashflow"] += np.bincount(index, weights=cashflow, minlength=span)
+            if principal_part is not None:
+                totals["principal"] += np.bincount(index, weights=principal_part, minlength=span)
+
+        curve = pd.DataFrame(
+            {"period": _month_end_timestamps(np.arange(first_month, first_month + span))}
         )
-        agg["cumulative_cashflow"] = agg["cashflow"].cumsum()
-        return agg
+        curve["cashflow"] = totals["cashflow"]
+        if "principal" in totals:
+            curve["principal"] = totals["principal"]
+            curve["interest"] = curve["cashflow"] - curve["principal"]
+
+        if pd.tseries.frequencies.to_offset(freq) != pd.offsets.MonthEnd():
+            curve = (
+                curve.set_index("period")
+                .groupby(pd.Grouper(freq=freq))
+                .sum(numeric_only=True)
+                .rename_axis("period")
+                .reset_index()
+            )
+        curve["cumulative_cashflow"] = curve["cashflow"].cumsum()
+        return curve
 
     def scorecard(self) -> pd.DataFrame:
         kpis = self.portfolio_kpis()
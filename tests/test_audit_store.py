@@ -0,0 +1,73 @@
+import json
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from python.audit_store import AuditStore, append_ndjson, dumps, load_manifest, manifest_objects
+
+
+def test_put_writes_each_object_once_and_copies_run_file(tmp_path):
+    store = AuditStore(tmp_path)
+    audit = {"run_id": "r1", "kpis": {"PAR30": np.float64(1.5)}, "at": pd.Timestamp("2024-01-31")}
+
+    ref = store.put(audit)
+    path = store.object_path(ref["sha256"])
+    mtime = path.stat().st_mtime_ns
+    assert store.put(dict(reversed(list(audit.items())))) == ref
+    assert path.stat().st_mtime_ns == mtime
+    assert len(list(store.objects_dir.iterdir())) == 1
+    assert path.stat().st_mode & 0o777 == 0o444
+
+    loaded = store.get(ref)
+    assert loaded["kpis"]["PAR30"] == 1.5
+    assert loaded["at"] == "2024-01-31T00:00:00"
+    run_file = store.copy_to(ref, tmp_path / "r1.json")
+    assert json.loads(run_file.read_bytes()) == loaded
+    run_file.write_text("{}")
+    assert store.get(ref) == loaded
+    assert b"\n" not in dumps(audit) and b", " not in dumps(audit)
+
+
+def test_dumps_is_canonical_for_numpy_and_dates():
+    payload = {
+        "int": np.int64(3),
+        "float": np.float32(0.5),
+        "nan": float("nan"),
+        "array": np.arange(3),
+        "when": pd.Timestamp("2024-01-31 10:00"),
+        "day": date(2024, 1, 2),
+        "text": "é",
+        "nested": [{"b": True, "a": (1, None)}],
+    }
+    encoded = dumps(payload)
+    assert encoded == dumps(dict(reversed(list(payload.items()))))
+    assert encoded.startswith(b'{"array":[0,1,2],"day":"2024-01-02"')
+    assert "é".encode("utf-8") in encoded
+    decoded = json.loads(encoded)
+    assert decoded["int"] == 3 and decoded["float"] == 0.5
+    assert decoded["when"] == "2024-01-31T10:00:00"
+    assert decoded["nested"] == [{"a": [1, None], "b": True}]
+
+
+def test_manifest_references_resolve_relative_to_manifest(tmp_path):
+    store = AuditStore(tmp_path)
+    lineage = [{"stage": "transform", "rows": 10}]
+    manifest_path = store.write_manifest(
+        tmp_path / "r1_manifest.json", {"run_id": "r1", "lineage": store.put(lineage)}
+    )
+
+    objects = manifest_objects(manifest_path)
+    assert list(objects) == [f"objects/{store.put(lineage)['sha256']}.json"]
+    manifest = load_manifest(manifest_path)
+    assert manifest["lineage"] == lineage
+    assert manifest["manifest_version"] == 2
+
+
+def test_append_ndjson_appends_one_line_per_record(tmp_path):
+    log = tmp_path / "audit.ndjson"
+    assert append_ndjson(log, [{"metric": "PAR30", "value": 1.0}]) == 1
+    assert append_ndjson(log, [{"metric": "PAR90"}, {"metric": "HealthScore"}]) == 2
+    assert append_ndjson(log, []) == 0
+    lines = log.read_text().splitlines()
+    assert [json.loads(line)["metric"] for line in lines] == ["PAR30", "PAR90", "HealthScore"]
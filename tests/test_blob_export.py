@@ -0,0 +1,123 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+from azure.core.exceptions import (
+    HttpResponseError,
+    ResourceExistsError,
+    ResourceNotFoundError,
+)
+
+from python import blob_export
+from python.blob_export import BlobExporter, export_files, file_md5
+
+
+class FakeBlobClient:
+    def __init__(self, container, name):
+        self.container = container
+        self.name = name
+
+    def get_blob_properties(self):
+        self.container.property_reads += 1
+        if self.container.write_only:
+            raise HttpResponseError("This request is not authorized to perform this operation.")
+        if self.name not in self.container.blobs:
+            raise ResourceNotFoundError("missing")
+        _, settings = self.container.blobs[self.name]
+        return SimpleNamespace(content_settings=settings)
+
+
+class FakeContainerClient:
+    """In-memory stand-in for azure.storage.blob.ContainerClient."""
+
+    def __init__(self, container_name="exports"):
+        self.container_name = container_name
+        self.blobs = {}
+        self.create_calls = 0
+        self.upload_threads = set()
+        self.property_reads = 0
+        self.write_only = False
+
+    def create_container(self):
+        self.create_calls += 1
+        if self.create_calls > 1:
+            raise ResourceExistsError("exists")
+
+    def get_blob_client(self, name):
+        return FakeBlobClient(self, name)
+
+    def upload_blob(self, name, data, overwrite=False, content_settings=None, **kwargs):
+        self.upload_threads.add(threading.get_ident())
+        self.blobs[name] = (data.read(), content_settings)
+
+
+class FakeServiceClient:
+    def __init__(self):
+        self.container = FakeContainerClient()
+
+    def get_container_client(self, name):
+        return self.container
+
+
+def _outputs(tmp_path):
+    (tmp_path / "metrics.csv").write_text("a,b\n1,2\n")
+    (tmp_path / "run.json").write_text('{"ok": true}')
+    return {"csv_file": tmp_path / "metrics.csv", "audit": tmp_path / "run.json"}
+
+
+def test_blob_exporter_uploads_with_md5_and_skips_unchanged(tmp_path):
+    files = _outputs(tmp_path)
+    container = FakeContainerClient()
+    exporter = BlobExporter(container, max_workers=2)
+
+    result = exporter.upload_files(files, prefix="runs/r1")
+
+    assert result == {
+        "csv_file": "exports/runs/r1/metrics.csv",
+        "audit": "exports/runs/r1/run.json",
+    }
+    data, settings = container.blobs["runs/r1/metrics.csv"]
+    assert data == b"a,b\n1,2\n"
+    assert settings.content_type == "text/csv"
+    assert bytes(settings.content_md5) == file_md5(files["csv_file"])
+    assert container.property_reads == 0
+
+    (tmp_path / "run.json").write_text('{"ok": false}')
+    rerun = BlobExporter(container, skip_unchanged=True)
+    assert rerun.upload_files(files, prefix="runs/r1") == result
+    assert list(rerun.skipped) == ["csv_file"]
+    assert list(rerun.uploaded) == ["audit"]
+
+
+def test_skip_unchanged_uploads_when_properties_are_forbidden(tmp_path):
+    files = _outputs(tmp_path)
+    container = FakeContainerClient()
+    container.write_only = True
+    exporter = BlobExporter(container, skip_unchanged=True)
+
+    exporter.upload_files(files, prefix="runs/r1")
+    exporter.upload_files(files, prefix="runs/r1")
+
+    assert container.property_reads == 4
+    assert sorted(exporter.uploaded) == ["audit", "csv_file"]
+    assert set(container.blobs) == {"runs/r1/metrics.csv", "runs/r1/run.json"}
+
+
+def test_export_files_reuses_client_and_creates_container_once(tmp_path, monkeypatch):
+    service = FakeServiceClient()
+    monkeypatch.setattr(blob_export, "_clients", {("conn", None): service})
+    monkeypatch.setattr(blob_export, "_ready_containers", set())
+    files = _outputs(tmp_path)
+
+    export_files(files, "exports", connection_string="conn", prefix="r1")
+    export_files(files, "exports", connection_string="conn", prefix="r2")
+
+    assert service.container.create_calls == 1
+    assert set(service.container.blobs) == {
+        "r1/metrics.csv",
+        "r1/run.json",
+        "r2/metrics.csv",
+        "r2/run.json",
+    }
+    with pytest.raises(ValueError):
+        export_files(files, " ", connection_string="conn")
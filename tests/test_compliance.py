@@ -1,6 +1,9 @@
+import numpy as np
 import pandas as pd
 
 from python.compliance import (
+    DigestCache,
+    _mask_value,
     build_compliance_report,
     create_access_log_entry,
     mask_pii_in_dataframe,
@@ -37,3 +40,37 @@ def test_build_compliance_report_includes_metadata():
     assert report["run_id"] == "run123"
     assert report["mask_stage"] == "none"
     assert report["metadata"]["user"] == "u"
+
+
+def test_mask_pii_hashes_distinct_values_once_and_keeps_nulls():
+    cache = DigestCache(maxsize=2)
+    df = pd.DataFrame(
+        {
+            "borrower_name": ["Alice", "Bob", "Alice", None, "Alice"],
+            "loan_amount": [1.0, 2.0, 3.0, 4.0, 5.0],
+        }
+    )
+
+    masked_df, _ = mask_pii_in_dataframe(df, cache=cache)
+
+    names = masked_df["borrower_name"]
+    assert names.iloc[0] == names.iloc[2] == _mask_value("Alice")
+    assert names.iloc[1] == _mask_value("Bob")
+    assert names.iloc[3] is None
+    assert cache.misses == 2
+    assert df["borrower_name"].iloc[0] == "Alice"
+    assert np.shares_memory(masked_df["loan_amount"].to_numpy(), df["loan_amount"].to_numpy())
+
+    mask_pii_in_dataframe(pd.DataFrame({"email": ["Alice", "c@x.io"]}), cache=cache)
+    assert cache.hits == 1
+    assert len(cache) == 2
+
+
+def test_mask_pii_keeps_distinct_text_of_equal_object_values():
+    df = pd.DataFrame({"borrower_name": [1, 1.0, True, "1", None]})
+
+    masked = mask_pii_in_dataframe(df)[0]["borrower_name"]
+
+    assert masked.tolist()[:4] == [_mask_value(value) for value in [1, 1.0, True, "1"]]
+    assert masked.iloc[0] == masked.iloc[3] != masked.iloc[1]
+    assert masked.iloc[4] is None
@@ -1,7 +1,9 @@
 import math
 import sys
+import warnings
 from pathlib import Path
 
+import pandas as pd
 import pytest
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -9,6 +11,7 @@ if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 from src.enterprise_analytics_engine import (  # noqa: E402
+    LoanAnalyticsEngine,
     LoanPosition,
     PortfolioKPIs,
     calculate_monthly_payment,
@@ -193,3 +196,167 @@ def test_calculate_portfolio_kpis_extreme_values_remain_finite():
     assert math.isfinite(kpis.expected_loss)
     assert math.isfinite(kpis.weighted_rate)
     assert math.isfinite(kpis.expected_monthly_interest)
+
+
+def _loan_book() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "loan_id": ["L1", "L2", "L3"],
+            "principal": [12_000.0, 6_000.0, 1_000.0],
+            "interest_rate": [0.12, 0.0, 0.2],
+            "term_months": [3, 2, 0],
+            "origination_date": ["2024-01-15", "2024-02-29", "2024-03-01"],
+            "status": ["current", "current", "prepaid"],
+            "days_in_arrears": [0, 0, 0],
+            "balance": [8_000.0, 3_000.0, 0.0],
+            "payments_made": [3_000.0, 600.0, 1_000.0],
+            "write_off_amount": [0.0, 0.0, 0.0],
+        }
+    )
+
+
+def test_cashflow_curve_spreads_payments_evenly_by_month_end():
+    with warnings.catch_warnings():
+        # The default month-end frequency must not use the deprecated "M" alias.
+        warnings.simplefilter("error", FutureWarning)
+        curve = LoanAnalyticsEngine(_loan_book()).cashflow_curve()
+
+    assert list(curve["period"].dt.strftime("%Y-%m-%d")) == [
+        "2024-01-31",
+        "2024-02-29",
+        "2024-03-31",
+    ]
+    assert curve["cashflow"].tolist() == pytest.approx([1_000.0, 1_300.0, 1_300.0])
+    assert curve["cumulative_cashflow"].iloc[-1] == pytest.approx(3_600.0)
+
+
+def test_cashflow_curve_amortizing_repays_principal_and_streams_in_chunks():
+    engine = LoanAnalyticsEngine(_loan_book())
+
+    curve = engine.cashflow_curve(schedule="amortizing", chunk_size=1)
+    installment = calculate_monthly_payment(
+        LoanPosition(principal=12_000.0, annual_interest_rate=0.12, term_months=3)
+    )
+
+    assert curve["principal"].sum() == pytest.approx(18_000.0)
+    assert curve["cashflow"].iloc[0] == pytest.approx(installment)
+    assert curve["interest"].iloc[0] == pytest.approx(120.0)
+
+    loan_rows = pd.concat(engine.iter_cashflow_schedule(schedule="amortizing", chunk_size=2))
+    assert loan_rows.groupby("loan_id")["cashflow"].size().to_dict() == {"L1": 3, "L2": 2}
+    assert loan_rows["cashflow"].sum() == pytest.approx(curve["cashflow"].sum())
+
+    with pytest.raises(ValueError):
+        engine.cashflow_curve(schedule="balloon")
+
+
+def test_cashflow_curve_rejects_missing_origination_date():
+    book = _loan_book()
+    book.loc[1, "origination_date"] = None
+    engine = LoanAnalyticsEngine(book)
+
+    with pytest.raises(ValueError, match="1 loans have no origination_date"):
+        engine.cashflow_curve()
+    with pytest.raises(ValueError, match="no origination_date"):
+        next(engine.iter_cashflow_schedule())
+
+
+def test_segment_kpis_matches_portfolio_kpis_per_segment():
+    book = _loan_book()
+    book["status"] = ["default", "current", "prepaid"]
+    book["write_off_amount"] = [3_000.0, 0.0, 0.0]
+    book["region"] = ["north", "south", "north"]
+    engine = LoanAnalyticsEngine(book)
+
+    segments = engine.segment_kpis("region")
+
+    assert segments["region"].tolist() == ["north", "south"]
+    north = LoanAnalyticsEngine(book[book["region"] == "north"]).portfolio_kpis()
+    for metric, value in north.items():
+        assert segments.iloc[0][metric] == pytest.approx(value)
+
+    vintages = engine.vintage_default_table()
+    assert vintages["origination_quarter"].tolist() == ["2024Q1"]
+    assert vintages["default_rate"].iloc[0] == pytest.approx(12_000.0 / 19_000.0)
+
+
+def test_segment_kpis_rollup_adds_subtotals_and_grand_total():
+    book = _loan_book()
+    book["region"] = ["north", "south", "north"]
+    book["product"] = ["sme", "sme", "retail"]
+    engine = LoanAnalyticsEngine(book)
+
+    rollup = engine.segment_kpis(["region", "product"], rollup=True)
+    cube = engine.segment_kpis(["region", "product"], cube=True)
+
+    grand_total = rollup[(rollup["region"] == "All") & (rollup["product"] == "All")]
+    assert grand_total["exposure"].iloc[0] == pytest.approx(engine.portfolio_kpis()["exposure"])
+    assert len(rollup) == 3 + 2 + 1
+    assert len(cube) == 3 + 2 + 2 + 1
+
+    with pytest.raises(ValueError):
+        engine.segment_kpis(["region", "missing"])
+
+
+def test_prepare_data_normalizes_status_and_derives_fields_vectorized():
+    book = _loan_book()
+    book["status"] = [" DEFAULT", None, "Restructured "]
+    book["origination_date"] = ["2024-01-15 09:00", "2024-02-29 12:00", "2024-03-01 10:30"]
+    engine = LoanAnalyticsEngine(book)
+    data = engine.data
+
+    assert data["status"].dtype == "category"
+    assert data["status"].tolist() == ["default", "", "restructured"]
+    assert data["exposure_at_default"].tolist() == [8_000.0, 0.0, 0.0]
+    assert data["arrears_flag"].tolist() == [True, False, False]
+    assert data["origination_quarter"].tolist() == ["2024Q1"] * 3
+    assert data["origination_date"].iloc[2] == pd.Timestamp("2024-03-01 10:30")
+    assert engine.segment_kpis("status")["status"].tolist() == ["default", "", "restructured"]
+
+    book["origination_date"] = ["2024-01-15", "not a date", "2024-03-01"]
+    with pytest.raises(ValueError):
+        LoanAnalyticsEngine(book)
+
+
+def test_portfolio_kpis_read_precomputed_status_statistics():
+    book = _loan_book()
+    book["status"] = ["default", "current", "prepaid"]
+    book["write_off_amount"] = [3_000.0, 0.0, 0.0]
+    engine = LoanAnalyticsEngine(book)
+
+    stats = engine.statistics
+    assert stats.xs("default", level="status")["principal"].sum() == 12_000.0
+    assert stats["loans"].sum() == 3
+    assert engine._calculate_lgd(engine.data) == pytest.approx(0.25)
+    assert engine._repayment_velocity(engine.data) == pytest.approx(4_600.0 / 19_000.0)
+
+    what_if = engine.portfolio_kpis(statuses=["Current", "prepaid"])
+    expected = LoanAnalyticsEngine(book[book["status"] != "default"]).portfolio_kpis()
+    for metric, value in expected.items():
+        assert what_if[metric] == pytest.approx(value)
+
+    # Later KPI calls read the statistics, not the loan rows.
+    engine.data["principal"] = 0.0
+    assert engine.portfolio_kpis()["default_rate"] == pytest.approx(12_000.0 / 19_000.0)
+
+    # Reassigning the rows refreshes them.
+    engine.data = LoanAnalyticsEngine(book.iloc[1:]).data
+    assert engine.portfolio_kpis()["default_rate"] == 0.0
+    assert engine.statistics["loans"].sum() == 2
+
+
+def test_currency_is_first_loan_currency_for_statistics_and_frames():
+    book = _loan_book()
+    book["status"] = ["prepaid", "current", "default"]
+    book["currency"] = ["EUR", "USD", "USD"]
+    book["region"] = ["north", "south", "north"]
+    engine = LoanAnalyticsEngine(book)
+
+    assert engine.portfolio_kpis()["currency"] == "EUR"
+    assert engine._portfolio_kpis_for_frame(engine.data)["currency"] == "EUR"
+    subset = engine.data.iloc[1:]
+    assert engine._portfolio_kpis_for_frame(subset)["currency"] == "USD"
+    assert engine.portfolio_kpis(statuses=["current", "default"])["currency"] == "USD"
+
+    rollup = engine.segment_kpis("region", rollup=True)
+    assert rollup["currency"].tolist() == ["EUR", "USD", "EUR"]
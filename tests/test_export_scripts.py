@@ -23,3 +23,15 @@ class TestExportScripts(unittest.TestCase):
             self.assertIn("slides", data)
             self.assertIsInstance(data["slides"], list)
             self.assertTrue(len(data["slides"]) > 0)
+
+    def test_export_copilot_slide_payload_includes_run_kpis(self):
+        """Computed KPIs passed in-process are added to the payload."""
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            kpis = {"par_30": {"value": 1.2345, "metric": "PAR30"}, "loans": 12}
+            json_path = export_payload(Path(tmpdirname), kpis=kpis)
+            data = json.loads(json_path.read_text(encoding="utf-8"))
+
+            self.assertEqual(
+                data["kpis"],
+                [{"label": "PAR30", "value": "1.23"}, {"label": "loans", "value": "12"}],
+            )
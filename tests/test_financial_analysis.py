@@ -4,7 +4,7 @@ from datetime import date, datetime, timedelta
 import numpy as np
 import pandas as pd
 
-from python.financial_analysis import FinancialAnalyzer
+from python.financial_analysis import BinningConfig, Classification, FinancialAnalyzer
 
 
 class TestFinancialAnalyzer(unittest.TestCase):
@@ -122,6 +122,98 @@ class TestFinancialAnalyzer(unittest.TestCase):
         self.assertIn("line_utilization", result.columns)
         self.assertIn("apr_zscore", result.columns)
 
+    def test_vectorized_buckets_match_scalar_rules(self):
+        values = [-1, 0, 0.5, 29, 29.5, 59, 89, 119, 149, 179, 179.5, 1000, np.nan]
+        df = pd.DataFrame({"days_past_due": values, "outstanding_balance": values})
+        df["outstanding_balance"] = df["outstanding_balance"] * 100
+
+        result = self.analyzer.segment_clients_by_exposure(self.analyzer.classify_dpd_buckets(df))
+
+        self.assertListEqual(
+            result["dpd_bucket"].tolist(),
+            [Classification.dpd_bucket_rules(v) for v in df["days_past_due"]],
+        )
+        self.assertListEqual(
+            result["exposure_segment"].tolist(),
+            [Classification.exposure_segment_rules(v) for v in df["outstanding_balance"]],
+        )
+        self.assertIsInstance(result["dpd_bucket"].dtype, pd.CategoricalDtype)
+        self.assertTrue(result["dpd_bucket"].cat.ordered)
+
+    def test_classify_client_type_handles_missing_values(self):
+        today = date(2025, 1, 1)
+        df = pd.DataFrame(
+            {
+                "customer_id": [1, 2, 3],
+                "loan_count": [1.7, np.nan, 3],
+                "last_active_date": [today, today - timedelta(days=200), None],
+            }
+        )
+        result = self.analyzer.classify_client_type(df, reference_date=today)
+        self.assertListEqual(result["client_type"].tolist(), ["New", "Recovered", "Recurring"])
+
+    def test_binning_config_overrides_edges(self):
+        analyzer = FinancialAnalyzer(
+            BinningConfig(dpd_edges=(0, 30), dpd_labels=("Current", "1-30", "30+"))
+        )
+        result = analyzer.classify_dpd_buckets(pd.DataFrame({"dpd": [0, 30, 31]}))
+        self.assertListEqual(result["dpd_bucket"].tolist(), ["Current", "1-30", "30+"])
+        with self.assertRaises(ValueError):
+            BinningConfig(exposure_edges=(10, 1))
+
+    def _master_frame(self):
+        today = date(2025, 1, 1)
+        return today, pd.DataFrame(
+            {
+                "loan_id": [1, 2, 3],
+                "customer_id": ["C1", "C2", "C3"],
+                "outstanding_balance": [5000, 15000, 800],
+                "line_amount": [10000, 20000, 1000],
+                "days_past_due": [10, 45, 0],
+                "loan_count": [1, 5, 2],
+                "last_active_date": [today, today - timedelta(days=200), today],
+                "apr": [0.15, 0.12, 0.2],
+            }
+        )
+
+    def test_enrich_master_dataframe_matches_stepwise_pipeline(self):
+        today, df = self._master_frame()
+        original = df.copy()
+        result = self.analyzer.enrich_master_dataframe(df, reference_date=today)
+
+        expected = self.analyzer.classify_dpd_buckets(df)
+        expected = self.analyzer.segment_clients_by_exposure(expected)
+        expected = self.analyzer.classify_client_type(expected, reference_date=today)
+        expected = self.analyzer.calculate_line_utilization(expected)
+        for metric in ["apr", "days_past_due", "outstanding_balance", "line_utilization"]:
+            values = expected[metric]
+            expected[f"{metric}_zscore"] = (values - values.mean()) / values.std()
+
+        pd.testing.assert_frame_equal(result, expected, check_like=True)
+        pd.testing.assert_frame_equal(df, original)
+
+    def test_enrich_master_dataframe_column_selector(self):
+        today, df = self._master_frame()
+        result = self.analyzer.enrich_master_dataframe(
+            df, reference_date=today, columns=["dpd_bucket", "line_utilization_zscore"]
+        )
+        self.assertListEqual(
+            list(result.columns), list(df.columns) + ["dpd_bucket", "line_utilization_zscore"]
+        )
+        with self.assertRaises(ValueError):
+            self.analyzer.enrich_master_dataframe(df, columns=["not_a_feature"])
+
+
+    def test_enrich_master_dataframe_coerces_string_amounts(self):
+        today, df = self._master_frame()
+        numeric = self.analyzer.enrich_master_dataframe(df, reference_date=today)
+        df["outstanding_balance"] = df["outstanding_balance"].astype(str)
+        df["line_amount"] = df["line_amount"].astype(str)
+
+        result = self.analyzer.enrich_master_dataframe(df, reference_date=today)
+
+        pd.testing.assert_series_equal(result["line_utilization"], numeric["line_utilization"])
+        self.assertTrue(pd.api.types.is_numeric_dtype(result["outstanding_balance"]))
 
 if __name__ == "__main__":
     unittest.main()
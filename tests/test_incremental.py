@@ -0,0 +1,118 @@
+import os
+
+import pandas as pd
+import pytest
+
+from python.incremental import (
+    RACY_WINDOW_NS,
+    PartitionStateStore,
+    file_sha256,
+    partition_fingerprints,
+    partition_sums,
+    select_partitions,
+)
+from python.kpi_engine import KPIEngine
+
+
+def tape():
+    return pd.DataFrame(
+        {
+            "measurement_date": ["2025-01-31", "2025-01-31", "2025-02-28"],
+            "total_receivable_usd": [1000.0, 2000.0, 3000.0],
+            "total_eligible_usd": [900.0, 1800.0, 2700.0],
+            "cash_available_usd": [800.0, 1700.0, 2600.0],
+            "dpd_30_60_usd": [100.0, 200.0, 300.0],
+            "dpd_60_90_usd": [50.0, 50.0, 60.0],
+            "dpd_90_plus_usd": [25.0, 25.0, 30.0],
+            "_ingest_run_id": ["run_a", "run_a", "run_a"],
+        }
+    )
+
+
+def test_partition_fingerprints_ignore_bookkeeping_columns():
+    first = partition_fingerprints(tape())
+    rerun = tape().assign(_ingest_run_id="run_b")
+    assert partition_fingerprints(rerun) == first
+
+    changed = tape()
+    changed.loc[2, "dpd_90_plus_usd"] = 31.0
+    fingerprints = partition_fingerprints(changed)
+    assert fingerprints["2025-01-31"] == first["2025-01-31"]
+    assert fingerprints["2025-02-28"] != first["2025-02-28"]
+
+
+def test_state_store_tracks_changed_partitions(tmp_path):
+    store = PartitionStateStore(tmp_path / "state.json")
+    df = tape()
+    fingerprints = partition_fingerprints(df)
+    assert store.changed_partitions(fingerprints) == ["2025-01-31", "2025-02-28"]
+
+    store.update(fingerprints, partition_sums(df), "hash-1")
+    store.save()
+
+    reloaded = PartitionStateStore(tmp_path / "state.json")
+    assert reloaded.file_hash == "hash-1"
+    assert reloaded.changed_partitions(fingerprints) == []
+
+    del fingerprints["2025-01-31"]
+    reloaded.update(fingerprints, {}, "hash-2")
+    assert list(reloaded.partitions) == ["2025-02-28"]
+
+
+def test_kpis_from_partition_sums_match_full_engine(tmp_path):
+    df = tape()
+    store = PartitionStateStore(tmp_path / "state.json")
+    fingerprints = partition_fingerprints(df)
+    store.update(fingerprints, partition_sums(select_partitions(df, ["2025-01-31"])), None)
+    store.update(fingerprints, partition_sums(select_partitions(df, ["2025-02-28"])), None)
+
+    stored = {key: entry["sums"] for key, entry in store.partitions.items()}
+    results = KPIEngine(pd.DataFrame()).calculate_metrics_from_partitions(stored)
+    engine = KPIEngine(df)
+    assert results["PAR30"][0] == pytest.approx(engine.calculate_par_30()[0])
+    assert results["PAR90"][0] == pytest.approx(engine.calculate_par_90()[0])
+    assert results["CollectionRate"][0] == pytest.approx(engine.calculate_collection_rate()[0])
+
+
+def test_partition_sums_reject_negative_receivables():
+    df = tape()
+    df.loc[2, "total_receivable_usd"] = "n/a"
+    with pytest.raises(ValueError, match=r"total_receivable_usd \(partitions \['2025-02-28'\]\)"):
+        partition_sums(df)
+
+
+def test_metrics_from_partitions_check_stored_sums():
+    sums = partition_sums(tape())
+    results = KPIEngine(pd.DataFrame()).calculate_metrics_from_partitions(sums)
+    assert results["PAR30"][0] == pytest.approx(KPIEngine(tape()).calculate_par_30()[0])
+    assert results["PAR30"][1]["method"] == "incremental"
+
+    del sums["2025-01-31"]["cash_available_usd"]
+    engine = KPIEngine(pd.DataFrame())
+    value, ctx = engine.calculate_metrics_from_partitions(sums)["CollectionRate"]
+    assert (value, ctx["status"]) == (0.0, "error")
+    assert engine.errors[0]["missing"] == ["cash_available_usd"]
+
+    sums["2025-02-28"]["total_receivable_usd"] = -1.0
+    with pytest.raises(ValueError, match="partition 2025-02-28"):
+        KPIEngine(pd.DataFrame()).calculate_metrics_from_partitions(sums)
+
+
+def test_input_hash_reuses_hash_of_unmodified_file(tmp_path):
+    path = tmp_path / "tape.csv"
+    tape().to_csv(path, index=False)
+    store = PartitionStateStore(tmp_path / "state.json")
+    assert store.input_hash(path) == file_sha256(path)
+    # Freshly written files are always hashed.
+    assert "file_signature" not in store.state
+
+    old = path.stat().st_mtime_ns - 2 * RACY_WINDOW_NS
+    os.utime(path, ns=(old, old))
+    store.update({}, {}, store.input_hash(path))
+    store.save()
+
+    reloaded = PartitionStateStore(tmp_path / "state.json")
+    reloaded.state["file_hash"] = "stored"
+    assert reloaded.input_hash(path) == "stored"
+    os.utime(path, ns=(old + 1, old + 1))
+    assert reloaded.input_hash(path) == file_sha256(path)
@@ -129,3 +129,118 @@ def test_update_summary_tracks_counts():
     assert summary["rows_ingested"] == 35
     assert summary["files"]["file1.csv"] == 10
     assert summary["files"]["file2.csv"] == 5
+
+
+def _write_tape(path, rows):
+    header = (
+        "period,measurement_date,total_receivable_usd,dpd_0_7_usd,dpd_7_30_usd,dpd_30_60_usd,"
+        "dpd_60_90_usd,dpd_90_plus_usd,total_eligible_usd,discounted_balance_usd,cash_available_usd"
+    )
+    lines = [header]
+    for i in range(rows):
+        day = (i % 28) + 1
+        lines.append(f"2025Q4,2025-12-{day:02d},{1000 + i},100,100,100,100,100,800,700,500")
+    path.write_text("\n".join(lines))
+
+
+def test_iter_csv_chunks_streams_tagged_chunks(tmp_path):
+    _write_tape(tmp_path / "tape.csv", 25)
+    ingestion = CascadeIngestion(data_dir=tmp_path)
+    chunks = list(ingestion.iter_csv_chunks("tape.csv", chunksize=10))
+
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    for chunk in chunks:
+        assert (chunk["_ingest_run_id"] == ingestion.run_id).all()
+        assert (chunk["_ingest_timestamp"] == ingestion.timestamp).all()
+
+    summary = ingestion.get_ingest_summary()
+    assert summary["rows_ingested"] == 25
+    assert summary["files"]["tape.csv"] == 25
+    assert ingestion.raw_files[-1]["rows"] == 25
+    assert ingestion.raw_files[-1]["status"] == "ingested"
+    assert not ingestion.errors
+
+
+def test_ingest_csv_streaming_matches_full_read(tmp_path):
+    _write_tape(tmp_path / "tape.csv", 12)
+    collected = []
+    streaming = CascadeIngestion(data_dir=tmp_path)
+    rows = streaming.ingest_csv_streaming("tape.csv", collected.append, chunksize=5)
+    full = CascadeIngestion(data_dir=tmp_path).ingest_csv("tape.csv")
+
+    assert rows == 12
+    streamed = pd.concat(collected, ignore_index=True)
+    assert streamed["total_receivable_usd"].sum() == full["total_receivable_usd"].sum()
+
+
+def test_iter_csv_chunks_stops_on_invalid_chunk(tmp_path):
+    _write_tape(tmp_path / "tape.csv", 6)
+    with (tmp_path / "tape.csv").open("a") as handle:
+        handle.write("\n2025Q4,2025-12-01,bad,100,100,100,100,100,800,700,500")
+    ingestion = CascadeIngestion(data_dir=tmp_path)
+    chunks = list(ingestion.iter_csv_chunks("tape.csv", chunksize=3))
+
+    assert [len(chunk) for chunk in chunks] == [3, 3]
+    assert ingestion.errors
+    assert ingestion.raw_files[-1]["status"] == "invalid_schema"
+    assert ingestion.get_ingest_summary()["rows_ingested"] == 6
+
+    streaming = CascadeIngestion(data_dir=tmp_path)
+    assert streaming.ingest_csv_streaming("tape.csv", lambda chunk: None, chunksize=4) == 4
+    assert streaming.get_ingest_summary()["files"]["tape.csv"] == 4
+
+
+def test_iter_csv_chunks_missing_file(tmp_path):
+    ingestion = CascadeIngestion(data_dir=tmp_path)
+    assert list(ingestion.iter_csv_chunks("missing.csv")) == []
+    assert "no such file" in ingestion.errors[0]["error"].lower()
+
+
+def test_ingest_columnar_projects_columns_and_filters_dates(tmp_path):
+    _write_tape(tmp_path / "tape.csv", 28)
+    tape = pd.read_csv(tmp_path / "tape.csv")
+    tape["notes"] = "n/a"
+    tape.to_parquet(tmp_path / "tape.parquet", index=False)
+    tape.to_feather(tmp_path / "tape.arrow")
+
+    ingestion = CascadeIngestion(data_dir=tmp_path)
+    df = ingestion.ingest_columnar(
+        "tape.parquet", start_date="2025-12-10", end_date="2025-12-19"
+    )
+
+    assert len(df) == 10
+    assert "notes" not in df.columns and "period" not in df.columns
+    assert df["measurement_date"].between("2025-12-10", "2025-12-19").all()
+    assert (df["_ingest_run_id"] == ingestion.run_id).all()
+    assert ingestion.raw_files[-1]["status"] == "ingested"
+
+    arrow = ingestion.ingest_columnar("tape.arrow", columns=["notes"])
+    assert len(arrow) == 28
+    assert "notes" in arrow.columns
+    assert ingestion.validate_loans(arrow)["_validation_passed"].all()
+
+
+def test_ingest_columnar_filters_typed_dates_and_reports_errors(tmp_path):
+    _write_tape(tmp_path / "tape.csv", 28)
+    tape = pd.read_csv(tmp_path / "tape.csv", parse_dates=["measurement_date"])
+    tape.to_parquet(tmp_path / "tape.parquet", index=False)
+
+    ingestion = CascadeIngestion(data_dir=tmp_path)
+    df = ingestion.ingest_columnar("tape.parquet", columns=None, start_date="2025-12-27")
+
+    assert len(df) == 2
+    assert "period" in df.columns
+    assert pd.api.types.is_datetime64_any_dtype(df["measurement_date"])
+
+    tape["measurement_date"] += pd.Timedelta(hours=18)
+    tape.to_parquet(tmp_path / "timed.parquet", index=False)
+    tape["measurement_date"] = tape["measurement_date"].dt.strftime("%Y-%m-%dT%H:%M:%S")
+    tape.to_parquet(tmp_path / "timed_text.parquet", index=False)
+    for name in ["timed.parquet", "timed_text.parquet"]:
+        same_day = ingestion.ingest_columnar(
+            name, start_date="2025-12-27 20:00", end_date="2025-12-27"
+        )
+        assert len(same_day) == 1
+
+    assert ingestion.ingest_columnar("missing.parquet").empty
+    assert "no such file" in ingestion.errors[-1]["error"].lower()
@@ -2,6 +2,7 @@ import pandas as pd
 import pytest
 
 from python.kpi_engine import KPIEngine
+from python.kpis.portfolio_health import calculate_portfolio_health
 
 
 def sample_portfolio():
@@ -82,3 +83,111 @@ def test_validate_schema_missing_columns():
     engine = KPIEngine(df)
     with pytest.raises(ValueError, match="Missing required columns"):
         engine.validate_schema()
+
+
+def test_calculate_metrics_fused_matches_individual_calculators():
+    df = sample_portfolio()
+    df["dpd_30_60_usd"] = df["dpd_30_60_usd"].astype(str).radd("$")
+    standard = KPIEngine(df.copy())
+    expected = {
+        "PAR30": standard.calculate_par_30()[0],
+        "PAR90": standard.calculate_par_90()[0],
+        "CollectionRate": standard.calculate_collection_rate()[0],
+    }
+
+    fused = KPIEngine(df.copy())
+    results = fused.calculate_metrics()
+
+    assert {key: value for key, (value, _) in results.items()} == expected
+    assert [entry["method"] for entry in fused.audit_trail] == ["fused"] * 3
+    assert results["PAR30"][1]["metric"] == "PAR30"
+
+
+def test_calculate_metrics_fused_reports_missing_columns_and_zero_denominator():
+    df = pd.DataFrame(
+        {
+            "dpd_90_plus_usd": [0.0],
+            "total_receivable_usd": [0.0],
+        }
+    )
+    engine = KPIEngine(df)
+    results = engine.calculate_metrics(["PAR90", "CollectionRate"])
+
+    assert results["PAR90"][0] == 0.0
+    assert results["CollectionRate"][1]["status"] == "error"
+    assert any(w["metric"] == "PAR90" for w in engine.warnings)
+    assert any(e["metric"] == "CollectionRate" for e in engine.errors)
+
+
+def test_calculate_metrics_fused_rejects_negative_receivables():
+    df = sample_portfolio()
+    df.loc[0, "total_receivable_usd"] = -1.0
+    with pytest.raises(ValueError, match="total_receivable_usd"):
+        KPIEngine(df).calculate_metrics(["PAR30"])
+
+
+def test_calculate_metrics_fused_matches_standard_on_dirty_input():
+    df = sample_portfolio().astype(object)
+    df["total_receivable_usd"] = ["$1,000.00", "2,000"]
+    df["cash_available_usd"] = ["€900", "n/a"]
+    df["dpd_90_plus_usd"] = ["25", None]
+    engine = KPIEngine(df)
+
+    fused = engine.calculate_metrics()
+    standard = {key: engine.calculate_metric(key) for key in KPIEngine.METRICS}
+    for key, (value, _) in standard.items():
+        assert fused[key][0] == pytest.approx(value)
+    assert fused["PAR30"][0] == pytest.approx(14.17)
+
+    for receivable in (["$1,000.00", "n/a"], ["1000", "-5"], [1000.0, None]):
+        df["total_receivable_usd"] = receivable
+        with pytest.raises(ValueError):
+            KPIEngine(df).calculate_metrics(["PAR30"])
+        with pytest.raises(ValueError):
+            KPIEngine(df).calculate_par_30()
+
+
+def test_calculate_metrics_unknown_metric():
+    with pytest.raises(ValueError, match="Unknown metric"):
+        KPIEngine(sample_portfolio()).calculate_metrics(["NOPE"])
+
+
+def test_calculate_metrics_by_portfolio_matches_per_portfolio_engines():
+    df = pd.concat([sample_portfolio()] * 2, ignore_index=True)
+    df["lender"] = ["L2", "L1", "L1", "L2"]
+    df.loc[3, "total_eligible_usd"] = "$1,800.00"
+    engine = KPIEngine(df)
+
+    batch = engine.calculate_metrics_by("lender")
+
+    assert batch["lender"].unique().tolist() == ["L1", "L2"]
+    for lender, group in df.groupby("lender"):
+        single = KPIEngine(group.copy()).calculate_metrics()
+        values = batch[batch["lender"] == lender].set_index("metric")["value"]
+        for key, (value, _) in single.items():
+            assert values[key] == pytest.approx(value)
+        assert values["HealthScore"] == pytest.approx(
+            calculate_portfolio_health(single["PAR30"][0], single["CollectionRate"][0])
+        )
+    assert [entry["lender"] for entry in engine.audit_trail] == ["L1"] * 4 + ["L2"] * 4
+    assert {entry["method"] for entry in engine.audit_trail} == {"batch"}
+
+
+def test_calculate_metrics_by_isolates_invalid_portfolios():
+    df = sample_portfolio()
+    df["facility"] = ["F1", "F2"]
+    df.loc[1, "total_receivable_usd"] = -1.0
+    engine = KPIEngine(df)
+
+    batch = engine.calculate_metrics_by("facility", ["PAR30", "PAR90"])
+
+    assert batch.set_index(["facility", "metric"])["status"].to_dict() == {
+        ("F1", "PAR30"): "ok",
+        ("F1", "PAR90"): "ok",
+        ("F2", "PAR30"): "error",
+        ("F2", "PAR90"): "error",
+    }
+    assert [error["facility"] for error in engine.errors] == ["F2"]
+    assert batch[batch["status"] == "error"]["value"].isna().all()
+    with pytest.raises(ValueError, match="Portfolio column"):
+        engine.calculate_metrics_by("region")
@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from python.loan_book import LoanBook, compact_float
+
+
+def _frames():
+    loans = pd.DataFrame(
+        {
+            "loan_id": ["L1", "L2", "L3"],
+            "customer_id": ["C1", "C2", "C1"],
+            "disburse_date": ["2025-01-05", "2025-02-10", None],
+            "disburse_principal": [1000.25, 2500.5, 300.0],
+            "product_type": ["factoring", "factoring", "sme"],
+            "loan_status": ["Current", "Default", "Current"],
+        }
+    )
+    customers = pd.DataFrame({"customer_id": ["C1", "C2"], "gender": ["F", "M"]})
+    transactions = pd.DataFrame(
+        {
+            "loan_id": ["L2", "L1", "L9", "L2"],
+            "transaction_type": ["PAYMENT", "PAYMENT", "PAYMENT", "DISBURSEMENT"],
+            "date_paid": ["2025-03-01", "2025-02-01", "2025-02-02", "2025-02-10"],
+            "principal": [10.0, 20.0, 30.0, 2500.5],
+        }
+    )
+    snapshots = pd.DataFrame(
+        {
+            "loan_id_raw": ["L1", "L2"],
+            "reporting_date": ["2025-02-28", "2025-02-28"],
+            "is_writeoff": ["False", "True"],
+            "outstanding_balance_usd": [980.25, 2490.5],
+        }
+    )
+    return {
+        "loans": loans,
+        "customers": customers,
+        "transactions": transactions,
+        "loan_par_balances": snapshots,
+    }
+
+
+def test_loan_book_encodes_keys_and_compact_dtypes():
+    book = LoanBook.from_frames(_frames())
+    loans, transactions = book["loans"], book["transactions"]
+
+    assert loans["loan_key"].tolist() == [0, 1, 2]
+    assert loans["customer_key"].tolist() == [0, 1, 0]
+    assert loans["product_type"].dtype == "category"
+    assert loans["disburse_principal"].dtype == np.float32
+    assert pd.isna(loans["disburse_date"].iloc[2])
+    assert transactions["date_paid"].dtype == "datetime64[ns]"
+    # Ids missing from loans extend the dictionary rather than being dropped.
+    assert book.decode_loan_ids(transactions["loan_key"]).tolist() == ["L2", "L1", "L9", "L2"]
+    assert book["loan_par_balances"]["is_writeoff"].tolist() == [False, True]
+    assert compact_float(pd.Series([123456789.01])).dtype == np.float64
+
+
+def test_loan_book_join_index_and_attach():
+    book = LoanBook.from_frames(_frames())
+
+    rows = book.rows_for_loans("transactions", ["L2", "L404"])
+    assert rows["principal"].tolist() == [10.0, 2500.5]
+    assert book.join_index("transactions").counts().tolist() == [1, 2, 0, 1]
+
+    attached = book.attach("transactions", ["loan_status"])
+    assert attached["loan_status"].tolist()[:2] == ["Default", "Current"]
+    assert pd.isna(attached["loan_status"].iloc[2])
+    genders = book.attach("loans", ["gender"], source="customers", key="customer_key")
+    assert genders["gender"].tolist() == ["F", "M", "F"]
+
+
+def test_loan_book_load_uses_less_memory(tmp_path):
+    rng = np.random.default_rng(3)
+    n = 5_000
+    loans = pd.DataFrame(
+        {
+            "loan_id": [f"ABF - DSB{i:06d}-001" for i in range(n)],
+            "customer_id": [f"CUST-{i % 400:05d}" for i in range(n)],
+            "disburse_date": pd.Timestamp("2024-01-01")
+            + pd.to_timedelta(rng.integers(0, 365, n), unit="D"),
+            "disburse_principal": rng.integers(100, 100_000, n) / 100,
+            "currency": "USD",
+            "loan_status": rng.choice(["Current", "Complete", "Default"], n),
+        }
+    )
+    loans.to_csv(tmp_path / "loans.csv", index=False)
+
+    book = LoanBook.load(tmp_path)
+    default = pd.read_csv(tmp_path / "loans.csv").memory_usage(deep=True).sum()
+
+    assert default / sum(book.memory_usage().values()) >= 2
+    assert book["loans"]["disburse_principal"].sum() == pytest.approx(
+        loans["disburse_principal"].sum()
+    )
@@ -0,0 +1,62 @@
+import pandas as pd
+import pytest
+
+from python.kpi_engine import KPIEngine
+from python.kpis.loan_par import build_par_series, load_par_series
+
+
+def _snapshots():
+    return pd.DataFrame(
+        {
+            "loan_id_raw": ["A", "B", "C", "D", "A", "B"],
+            "reporting_date": [
+                "2025-01-31",
+                "2025-01-31",
+                "2025-01-31",
+                "2025-01-31",
+                "2025-02-28",
+                "2025-02-28",
+            ],
+            "dpd": [0, 7, 45, 200, 30, 91],
+            "is_writeoff": [False, False, False, True, False, False],
+            "outstanding_balance_usd": [100.0, 200.0, 300.0, 0.0, 400.0, 600.0],
+            "writeoff_outstanding_balance_usd": [0.0, 0.0, 0.0, 50.0, 0.0, 0.0],
+        }
+    )
+
+
+def test_build_par_series_buckets_balances_per_reporting_date():
+    series = build_par_series(_snapshots())
+
+    assert series["measurement_date"].tolist() == ["2025-01-31", "2025-02-28"]
+    jan = series.iloc[0]
+    assert jan["total_receivable_usd"] == 600.0
+    assert jan["dpd_0_7_usd"] == 100.0
+    assert jan["dpd_7_30_usd"] == 200.0
+    assert jan["dpd_30_60_usd"] == 300.0
+    assert jan["par_7_balance_usd"] == 500.0
+    assert jan["par30_pct"] == pytest.approx(50.0)
+    assert jan["writeoff_count"] == 1
+    assert jan["writeoff_balance_usd"] == 50.0
+    assert jan["loans_count"] == 4
+    assert jan["active_loans"] == 3
+
+    feb = series.iloc[1]
+    assert feb["par_90_balance_usd"] == 600.0
+    assert feb["par30_pct"] == pytest.approx(100.0)
+
+
+def test_par_series_feeds_kpi_engine_and_streams_from_csv(tmp_path):
+    _snapshots().to_csv(tmp_path / "balances.csv", index=False)
+    series = load_par_series(tmp_path / "balances.csv")
+    chunked = load_par_series(tmp_path / "balances.csv", chunksize=2)
+
+    pd.testing.assert_frame_equal(series, chunked)
+    results = KPIEngine(series.iloc[[0]]).calculate_metrics(["PAR30", "PAR90"])
+    assert results["PAR30"][0] == pytest.approx(50.0)
+    assert results["PAR90"][0] == 0.0
+
+
+def test_build_par_series_requires_snapshot_columns():
+    with pytest.raises(ValueError, match="Missing required columns"):
+        build_par_series(_snapshots().drop(columns=["dpd"]))
@@ -0,0 +1,106 @@
+import pandas as pd
+import pytest
+
+from python import metrics_store
+from python.metrics_store import MetricsStore
+
+
+def _kpis(dates, par30):
+    return pd.DataFrame(
+        {
+            "measurement_date": dates,
+            "period": [f"P{i}" for i in range(len(dates))],
+            "par30_pct": par30,
+        }
+    )
+
+
+def test_append_partitions_by_date_and_reads_date_range(tmp_path):
+    store = MetricsStore(tmp_path)
+    written = store.append(_kpis(["2025-09-30", "2025-12-02", None], [9.2, 7.4, 1.0]), "run_a")
+    store.append(_kpis(["2025-12-02"], [7.0]), "run_b")
+
+    assert set(written) == {
+        "measurement_date=2025-09-30",
+        "measurement_date=2025-12-02",
+        "measurement_date=__HIVE_DEFAULT_PARTITION__",
+    }
+    history = store.read(start_date="2025-10-01", end_date="2025-12-31", columns=["par30_pct"])
+    assert list(history.columns) == ["measurement_date", "run_id", "par30_pct"]
+    assert sorted(history["par30_pct"]) == [7.0, 7.4]
+    assert isinstance(store.read()["period"].dtype, pd.CategoricalDtype)
+    assert store.read(run_ids=["run_b"])["par30_pct"].tolist() == [7.0]
+
+
+def test_compact_merges_run_files_and_keeps_rows(tmp_path):
+    store = MetricsStore(tmp_path)
+    for run in range(3):
+        store.append(_kpis(["2025-12-02", "2025-09-30"], [float(run), 1.0]), f"run_{run}")
+    before = store.read().sort_values(["run_id", "measurement_date"], ignore_index=True)
+
+    assert store.compact() == {"measurement_date=2025-09-30": 3, "measurement_date=2025-12-02": 3}
+    assert len(store.files()) == 2
+    after = store.read().sort_values(["run_id", "measurement_date"], ignore_index=True)
+    pd.testing.assert_frame_equal(
+        before.astype({"run_id": str, "period": str}), after.astype({"run_id": str, "period": str})
+    )
+
+    store.append(_kpis(["2025-12-02"], [9.0]), "run_1")
+    # Before compaction the new file already hides the run's compacted rows in that date.
+    assert sorted(store.read(run_ids=["run_1"])["par30_pct"]) == [1.0, 9.0]
+    assert store.read(run_ids=["run_1"], start_date="2025-12-01")["par30_pct"].tolist() == [9.0]
+    store.compact()
+    rows = store.read(run_ids=["run_1"], start_date="2025-12-01")
+    assert rows["par30_pct"].tolist() == [9.0]
+
+
+def test_interrupted_compaction_never_duplicates_rows(tmp_path, monkeypatch):
+    store = MetricsStore(tmp_path)
+    for run in range(3):
+        store.append(_kpis(["2025-12-02"], [float(run)]), f"run_{run}")
+
+    def crash(self, *args, **kwargs):
+        raise OSError("crashed before removing merged files")
+
+    with monkeypatch.context() as patched:
+        patched.setattr(metrics_store.Path, "unlink", crash)
+        with pytest.raises(OSError):
+            store.compact()
+
+    assert len(list((tmp_path / "measurement_date=2025-12-02").glob("*.parquet"))) == 4
+    assert sorted(store.read()["par30_pct"]) == [0.0, 1.0, 2.0]
+    assert store.compact() == {}
+    assert len(list((tmp_path / "measurement_date=2025-12-02").glob("*.parquet"))) == 1
+    assert sorted(store.read()["par30_pct"]) == [0.0, 1.0, 2.0]
+
+
+def test_compaction_keeps_runs_rewritten_while_merging(tmp_path, monkeypatch):
+    store = MetricsStore(tmp_path)
+    for run in range(2):
+        store.append(_kpis(["2025-12-02"], [float(run)]), f"run_{run}")
+    write_table = metrics_store._write_table
+
+    def rewrite_run_then_write(table, path):
+        monkeypatch.setattr(metrics_store, "_write_table", write_table)
+        store.append(_kpis(["2025-12-02"], [9.0]), "run_1")
+        write_table(table, path)
+
+    monkeypatch.setattr(metrics_store, "_write_table", rewrite_run_then_write)
+    store.compact()
+
+    assert (tmp_path / "measurement_date=2025-12-02" / "run_1.parquet").exists()
+    store.compact()
+    assert store.read(run_ids=["run_1"])["par30_pct"].tolist() == [9.0]
+
+
+def test_compact_skips_partitions_locked_by_another_compaction(tmp_path):
+    store = MetricsStore(tmp_path)
+    for run in range(2):
+        store.append(_kpis(["2025-12-02", "2025-09-30"], [float(run), 1.0]), f"run_{run}")
+    lock = metrics_store._PartitionLock(tmp_path / "measurement_date=2025-12-02")
+    assert lock.acquire()
+    try:
+        assert store.compact() == {"measurement_date=2025-09-30": 2}
+    finally:
+        lock.release()
+    assert store.compact() == {"measurement_date=2025-12-02": 2}
@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from python.kpi_engine import KPIEngine
+from python.parallel_kpis import ParallelKPIExecutor, SharedFrame, run_attached
+from src.enterprise_analytics_engine import LoanAnalyticsEngine
+
+
+def _loan_book(n=60):
+    rng = np.random.default_rng(5)
+    return pd.DataFrame(
+        {
+            "loan_id": [f"L{i}" for i in range(n)],
+            "principal": rng.uniform(1_000, 10_000, n),
+            "interest_rate": rng.uniform(0.05, 0.3, n),
+            "term_months": rng.choice([6, 12], n),
+            "origination_date": ["2024-01-15", "2024-05-02", "2024-09-30"] * (n // 3),
+            "status": rng.choice(["current", "default", "prepaid"], n),
+            "days_in_arrears": rng.integers(0, 120, n),
+            "balance": rng.uniform(0, 5_000, n),
+            "payments_made": rng.uniform(0, 5_000, n),
+            "write_off_amount": rng.uniform(0, 500, n),
+            "region": rng.choice(["north", "south", "east"], n),
+        }
+    )
+
+
+def _facilities():
+    return pd.DataFrame(
+        {
+            "facility": ["F2", "F1", "F2", "F1", "F3"],
+            "total_receivable_usd": [1000.0, 2000.0, 500.0, 1000.0, -300.0],
+            "dpd_30_60_usd": [100.0, 50.0, 0.0, 25.0, 0.0],
+            "dpd_60_90_usd": [0.0, 25.0, 10.0, 0.0, 0.0],
+            "dpd_90_plus_usd": [0.0, 0.0, 40.0, 0.0, 5.0],
+            "cash_available_usd": [900.0, 1500.0, 400.0, 900.0, 300.0],
+            "total_eligible_usd": [1000.0, 2000.0, 500.0, 1000.0, 300.0],
+        }
+    )
+
+
+def test_shared_frame_round_trips_columns():
+    frame = _loan_book(6)
+    frame["status"] = frame["status"].astype("category")
+
+    with SharedFrame(frame, ["principal", "status", "region"]) as shared:
+        copy = run_attached(shared.spec, lambda view: view.copy())
+
+    assert copy["principal"].tolist() == frame["principal"].tolist()
+    assert copy["status"].astype(str).tolist() == frame["status"].astype(str).tolist()
+    assert copy["region"].astype(str).tolist() == frame["region"].tolist()
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_parallel_segment_kpis_match_engine(workers):
+    engine = LoanAnalyticsEngine(_loan_book())
+
+    with ParallelKPIExecutor(max_workers=workers) as executor:
+        results = executor.segment_kpis(
+            engine, ["region", "currency", ["region", "status"]], rollup=True
+        )
+
+    pd.testing.assert_frame_equal(results["region"], engine.segment_kpis("region", rollup=True))
+    assert results["currency"]["currency"].tolist() == ["USD", "All"]
+    pd.testing.assert_frame_equal(
+        results[("region", "status")], engine.segment_kpis(["region", "status"], rollup=True)
+    )
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_parallel_portfolio_metrics_match_calculate_metrics_by(workers):
+    facilities = _facilities()
+    engine = KPIEngine(facilities, actor="batch")
+    expected = engine.calculate_metrics_by("facility")
+
+    with ParallelKPIExecutor(max_workers=workers) as executor:
+        metrics = executor.portfolio_metrics(facilities, "facility", actor="batch")
+        trail = executor.get_audit_trail()
+
+    pd.testing.assert_frame_equal(metrics, expected)
+    f1 = metrics[metrics["facility"] == "F1"].set_index("metric")["value"]
+    assert f1["HealthScore"] == pytest.approx(10.0)
+
+    assert trail["facility"].tolist() == ["F1"] * 4 + ["F2"] * 4 + ["F3"] * 3
+    assert (trail["actor"] == "batch").all()
+    # The negative amount only fails its own portfolio.
+    assert [error["facility"] for error in executor.errors] == ["F3"]
+    f3 = metrics[metrics["facility"] == "F3"]
+    assert f3["value"].isna().all() and (f3["status"] == "error").all()
+
+
+@pytest.mark.parametrize("workers", [0, 3])
+def test_parallel_portfolio_metrics_coerce_raw_string_amounts(workers):
+    facilities = _facilities()
+    facilities["total_receivable_usd"] = ["$1,000", "2000", "500", None, "1,000"]
+    expected = KPIEngine(facilities).calculate_metrics_by("facility")
+
+    with ParallelKPIExecutor(max_workers=workers) as executor:
+        metrics = executor.portfolio_metrics(facilities, "facility")
+
+    pd.testing.assert_frame_equal(metrics, expected)
+    assert [error["facility"] for error in executor.errors] == ["F1"]
+    f2 = metrics[metrics["facility"] == "F2"].set_index("metric")["value"]
+    assert f2["PAR30"] == pytest.approx(100 * 150.0 / 1500.0)
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from python.financial_analysis import Classification
+from python.kpis.roll_rates import (
+    EXITED_STATE,
+    ROLL_STATES,
+    RollRateMatrix,
+    roll_rates,
+    snapshot_states,
+)
+
+
+def _snapshots():
+    rows = [
+        ("A", "2025-01-31", 0, False, 100.0),
+        ("B", "2025-01-31", 10, False, 200.0),
+        ("C", "2025-01-31", 200, False, 50.0),
+        ("A", "2025-02-28", 15, False, 90.0),
+        ("B", "2025-02-28", 40, False, 180.0),
+        ("C", "2025-02-28", 230, True, 0.0),
+        ("A", "2025-03-31", 0, False, 80.0),
+        ("C", "2025-03-31", 260, True, 0.0),
+    ]
+    return pd.DataFrame(
+        rows,
+        columns=["loan_id_raw", "reporting_date", "dpd", "is_writeoff", "outstanding_balance_usd"],
+    )
+
+
+def test_snapshot_states_follow_classification_rules():
+    dpd = [-3, 0, 1, 29, 30, 59, 60, 89, 90, 119, 120, 149, 150, 179, 180, 500]
+    states = snapshot_states(pd.DataFrame({"dpd": dpd}))
+    assert [ROLL_STATES[code] for code in states] == [
+        Classification.dpd_bucket_rules(value) for value in dpd
+    ]
+
+
+def test_roll_rates_count_and_balance_weighted():
+    counts = roll_rates(_snapshots())
+    assert counts.loc["Current", "1-29"] == pytest.approx(1.0)
+    assert counts.loc["1-29", "30-59"] == pytest.approx(0.5)
+    assert counts.loc["1-29", "Current"] == pytest.approx(0.5)
+    assert counts.loc["30-59", EXITED_STATE] == pytest.approx(1.0)
+    assert counts.loc["180+", "Write-off"] == pytest.approx(1.0)
+
+    matrix = RollRateMatrix.from_snapshots(_snapshots())
+    balances = matrix.matrix(weight="balance", normalize=False)
+    assert balances.loc["1-29", "30-59"] == 200.0
+    assert balances.loc["1-29", "Current"] == 90.0
+    assert matrix.matrix(normalize=False, end="2025-01-31").to_numpy().sum() == 3
+
+
+def test_incremental_update_matches_full_history():
+    history = _snapshots()
+    full = RollRateMatrix.from_snapshots(history)
+
+    incremental = RollRateMatrix.from_snapshots(history[history["reporting_date"] < "2025-03-01"])
+    incremental.update(history[history["reporting_date"] > "2025-03-01"])
+
+    assert incremental.dates == full.dates
+    np.testing.assert_allclose(incremental.counts, full.counts)
+    np.testing.assert_allclose(incremental.balances, full.balances)
+    with pytest.raises(ValueError):
+        incremental.update(history[history["reporting_date"] == "2025-02-28"])
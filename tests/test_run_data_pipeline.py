@@ -3,7 +3,14 @@ from unittest.mock import MagicMock, patch
 
 import pandas as pd
 
-from scripts.run_data_pipeline import run_pipeline
+from python.audit_store import load_manifest
+from scripts.run_data_pipeline import (
+    add_presentation_assets,
+    run_pipeline,
+    start_presentation_assets,
+    upload_outputs_to_azure,
+    write_outputs,
+)
 
 
 class TestRunDataPipeline(unittest.TestCase):
@@ -39,9 +46,11 @@ class TestRunDataPipeline(unittest.TestCase):
         mock_transform.get_lineage.return_value = []
 
         mock_kpi = mock_kpi_cls.return_value
-        mock_kpi.calculate_par_30.return_value = (1.0, {"metric": "PAR30"})
-        mock_kpi.calculate_par_90.return_value = (0.5, {"metric": "PAR90"})
-        mock_kpi.calculate_collection_rate.return_value = (98.0, {"metric": "CR"})
+        mock_kpi.calculate_metrics.return_value = {
+            "PAR30": (1.0, {"metric": "PAR30"}),
+            "PAR90": (0.5, {"metric": "PAR90"}),
+            "CollectionRate": (98.0, {"metric": "CR"}),
+        }
         mock_kpi.calculate_portfolio_health.return_value = (9.0, {"metric": "Health"})
         mock_kpi.get_audit_trail.return_value = MagicMock(to_dict=lambda **k: [])
 
@@ -60,9 +69,18 @@ class TestRunDataPipeline(unittest.TestCase):
         self.assertTrue(result)
         mock_ingest.ingest_csv.assert_called()
         mock_transform.transform_to_kpi_dataset.assert_called()
-        mock_kpi.calculate_portfolio_health.assert_called()
+        self.assertEqual(
+            mock_transform.transform_to_kpi_dataset.call_args.kwargs,
+            {"low_memory": False, "measure_peak": False},
+        )
+        mock_kpi.calculate_metrics.assert_called_with(["PAR30", "PAR90", "CollectionRate"])
+        mock_kpi.calculate_portfolio_health.assert_called_with(1.0, 98.0)
         mock_write_outputs.assert_called()
 
+        # A missing portfolio column is skipped, not a failed run.
+        self.assertTrue(run_pipeline("dummy.csv", portfolio_col="lender"))
+        mock_kpi.calculate_metrics_by.assert_not_called()
+
     @patch("scripts.run_data_pipeline.CascadeIngestion")
     def test_run_pipeline_validation_failure(self, mock_ingest_cls):
         mock_ingest = mock_ingest_cls.return_value
@@ -116,9 +134,11 @@ class TestRunDataPipeline(unittest.TestCase):
         mock_transform.get_lineage.return_value = []
 
         mock_kpi = mock_kpi_cls.return_value
-        mock_kpi.calculate_par_30.return_value = (1.0, {"metric": "PAR30"})
-        mock_kpi.calculate_par_90.return_value = (0.5, {"metric": "PAR90"})
-        mock_kpi.calculate_collection_rate.return_value = (98.0, {"metric": "CR"})
+        mock_kpi.calculate_metrics.return_value = {
+            "PAR30": (1.0, {"metric": "PAR30"}),
+            "PAR90": (0.5, {"metric": "PAR90"}),
+            "CollectionRate": (98.0, {"metric": "CR"}),
+        }
         mock_kpi.calculate_portfolio_health.return_value = (9.0, {"metric": "Health"})
         mock_kpi.get_audit_trail.return_value = MagicMock(to_dict=lambda **k: [])
 
@@ -143,3 +163,132 @@ class TestRunDataPipeline(unittest.TestCase):
         self.assertTrue(result)
         mock_upload.assert_called_once()
         mock_rewrite_manifest.assert_called_once()
+
+        # A failed asset upload keeps the main uploads, and the manifest is
+        # rewritten once with both the assets and the blobs.
+        mock_write_outputs.return_value = dict(processed_paths)
+        mock_upload.reset_mock()
+        mock_rewrite_manifest.reset_mock()
+        mock_upload.side_effect = [
+            {"metrics_file": "container/metrics.parquet"},
+            RuntimeError("asset upload failed"),
+        ]
+        with patch(
+            "scripts.run_data_pipeline.generate_presentation_assets",
+            return_value={"presentation_growth-path": "growth-path.html"},
+        ):
+            result = run_pipeline(
+                "dummy.csv",
+                azure_container="container",
+                azure_connection_string="UseDevelopmentStorage=true",
+                background_presentation=True,
+            )
+
+        self.assertTrue(result)
+        self.assertEqual(mock_upload.call_count, 2)
+        mock_rewrite_manifest.assert_called_once()
+        outputs = mock_rewrite_manifest.call_args.args[2]
+        self.assertEqual(outputs["azure_blobs"], {"metrics_file": "container/metrics.parquet"})
+        self.assertEqual(outputs["presentation_growth-path"], "growth-path.html")
+
+    @patch("scripts.run_data_pipeline.write_compliance_report")
+    @patch("scripts.run_data_pipeline.build_compliance_report")
+    @patch("scripts.run_data_pipeline.write_outputs")
+    def test_run_pipeline_incremental_skips_unchanged_partitions(
+        self, mock_write_outputs, mock_build_report, mock_write_report
+    ):
+        import tempfile
+        from pathlib import Path
+
+        mock_write_outputs.return_value = {"manifest_file": "manifest.json"}
+        mock_build_report.return_value = {}
+        source = Path("data/abaco_portfolio_calculations.csv")
+
+        with tempfile.TemporaryDirectory() as tmp, patch(
+            "scripts.run_data_pipeline.LOGS_DIR", Path(tmp)
+        ):
+            input_path = Path(tmp) / "tape.csv"
+            state_path = Path(tmp) / "state.json"
+            input_path.write_text(source.read_text())
+
+            self.assertTrue(
+                run_pipeline(str(input_path), incremental=True, state_file=str(state_path))
+            )
+            first_rows = len(mock_write_outputs.call_args.args[1])
+            self.assertTrue(state_path.exists())
+
+            with patch("scripts.run_data_pipeline.CascadeIngestion.ingest_csv") as mock_ingest:
+                self.assertTrue(
+                    run_pipeline(str(input_path), incremental=True, state_file=str(state_path))
+                )
+                mock_ingest.assert_not_called()
+            # Unchanged runs still get their compliance report and manifest.
+            self.assertEqual(mock_write_report.call_count, 2)
+            manifests = sorted(Path(tmp).glob("*_manifest.json"))
+            self.assertEqual(len(manifests), 1)
+            self.assertEqual(load_manifest(manifests[0])["processed_outputs"]["row_scope"], "none")
+
+            tape = pd.read_csv(input_path)
+            tape.loc[0, "cash_available_usd"] += 1.0
+            tape.to_csv(input_path, index=False)
+            self.assertTrue(
+                run_pipeline(str(input_path), incremental=True, state_file=str(state_path))
+            )
+            self.assertEqual(len(mock_write_outputs.call_args.args[1]), 1)
+            self.assertGreater(first_rows, 1)
+            self.assertEqual(len(mock_write_outputs.call_args.kwargs["partitions"]), 1)
+
+    def test_run_pipeline_rejects_portfolio_col_when_incremental(self):
+        with self.assertRaises(ValueError):
+            run_pipeline("dummy.csv", incremental=True, portfolio_col="lender")
+
+    @patch("scripts.run_data_pipeline.generate_presentation_assets")
+    def test_background_presentation_assets_merge_once(self, mock_generate):
+        mock_generate.return_value = {
+            "presentation_growth-path": "growth-path.html",
+            "manifest_file": "other.json",
+        }
+        kpi_df = pd.DataFrame({"metric": [1.0]})
+        kpis = {"par_30": {"value": 1.0}}
+        outputs = {"manifest_file": "manifest.json"}
+
+        future = start_presentation_assets("run_1", kpi_df, kpis)
+        self.assertEqual(
+            add_presentation_assets(future, outputs),
+            {"presentation_growth-path": "growth-path.html"},
+        )
+        self.assertEqual(add_presentation_assets(future, outputs), {})
+        self.assertEqual(outputs["manifest_file"], "manifest.json")
+        mock_generate.assert_called_once_with("run_1", kpi_df, kpis)
+
+    @patch("scripts.run_data_pipeline.generate_presentation_assets", return_value={})
+    def test_azure_export_ships_manifest_objects(self, _mock_assets):
+        import tempfile
+        from pathlib import Path
+
+        from python.audit_store import load_manifest
+
+        with tempfile.TemporaryDirectory() as tmp, patch(
+            "scripts.run_data_pipeline.LOGS_DIR", Path(tmp)
+        ), patch("scripts.run_data_pipeline.METRICS_DIR", Path(tmp)), patch(
+            "scripts.run_data_pipeline.export_files", return_value={}
+        ) as mock_export:
+            audit = {"errors": []}
+            metadata = {"audit": audit, "lineage": [{"stage": "x"}], "raw_files": ["a.csv"]}
+            outputs = write_outputs(
+                "run_1",
+                pd.DataFrame({"measurement_date": ["2025-01-31"], "metric": [1.0]}),
+                audit,
+                metadata,
+                Path(tmp) / "compliance.json",
+            )
+            upload_outputs_to_azure(outputs, "run_1", "container", connection_string="conn")
+
+            manifest = load_manifest(Path(outputs["manifest_file"]))
+            self.assertEqual(manifest["lineage"], [{"stage": "x"}])
+            self.assertEqual(manifest["raw_files"], ["a.csv"])
+            files = mock_export.call_args.args[0]
+            blob_names = mock_export.call_args.kwargs["blob_names"]
+            objects = [name for name in files if name.startswith("objects/")]
+            self.assertEqual(len(objects), 3)
+            self.assertTrue(all(blob_names[name] == name for name in objects))
@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from python.kpis.schedule_collections import ScheduleBook, collections_summary
+
+
+def _schedules():
+    return pd.DataFrame(
+        {
+            "loan_id": ["A", "A", "B"],
+            "date_due": ["2025-01-31", "2025-02-28", "2025-01-15"],
+            "principal": [90.0, 90.0, 180.0],
+            "interest": [10.0, 10.0, 20.0],
+            "fees": [0.0, 0.0, 0.0],
+        }
+    )
+
+
+def _transactions():
+    return pd.DataFrame(
+        {
+            "loan_id": ["A", "A", "A", "B", "B", "Z"],
+            "transaction_type": [
+                "DISBURSEMENT",
+                "PAYMENT",
+                "PAYMENT",
+                "PAYMENT",
+                "PAYMENT",
+                "PAYMENT",
+            ],
+            "date_paid": [
+                "2025-01-01",
+                "2025-01-20",
+                "2025-03-10",
+                "2025-01-15",
+                "2025-03-01",
+                "2025-01-10",
+            ],
+            "principal": [180.0, 90.0, 90.0, 90.0, 45.0, 5.0],
+            "interest": [0.0, 10.0, 10.0, 10.0, 5.0, 0.0],
+        }
+    )
+
+
+def test_align_uses_latest_due_installment_or_first_for_early_payments():
+    book = ScheduleBook(_schedules())
+    days = pd.to_datetime(pd.Series(["2025-01-20", "2025-03-10", "2025-02-01"]))
+    positions = book.align(["A", "A", "Z"], days.to_numpy(dtype="datetime64[D]").astype(np.int64))
+
+    assert positions[2] == -1
+    assert book.due_day[positions[0]] == np.datetime64("2025-01-31").astype(np.int64)
+    assert book.due_day[positions[1]] == np.datetime64("2025-02-28").astype(np.int64)
+
+
+def test_collections_summary_efficiency_and_timing_buckets():
+    summary = collections_summary(_schedules(), _transactions(), chunksize=2)
+    jan = summary.set_index("period").loc["2025-01"]
+    feb = summary.set_index("period").loc["2025-02"]
+
+    assert jan["scheduled_usd"] == 300.0
+    assert jan["collected_usd"] == 250.0
+    assert jan["collection_efficiency_pct"] == pytest.approx(250.0 / 3.0)
+    assert jan["paid_early_usd"] == 100.0
+    assert jan["paid_on_time_usd"] == 100.0
+    assert jan["paid_late_31_60_usd"] == 50.0
+    assert jan["avg_days_to_pay"] == pytest.approx((-11 * 100 + 0 * 100 + 45 * 50) / 250)
+    assert feb["paid_late_8_30_count"] == 1
+
+
+def test_collections_summary_by_segment_streams_csv(tmp_path):
+    _transactions().to_csv(tmp_path / "transactions.csv", index=False)
+    loans = pd.DataFrame({"loan_id": ["A", "B"], "product_type": ["sme", "factoring"]})
+
+    summary = collections_summary(
+        _schedules(), tmp_path / "transactions.csv", loans, "product_type", chunksize=3
+    )
+
+    assert list(summary[["period", "product_type"]].itertuples(index=False, name=None)) == [
+        ("2025-01", "factoring"),
+        ("2025-01", "sme"),
+        ("2025-02", "sme"),
+    ]
+    assert summary["collected_usd"].sum() == pytest.approx(350.0)
+    with pytest.raises(ValueError):
+        collections_summary(_schedules(), _transactions(), loans, "region")
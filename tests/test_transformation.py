@@ -132,3 +132,48 @@ def test_transform_non_numeric_required_column_raises():
     df["total_receivable_usd"] = ["not-a-number", "also-bad"]
     with pytest.raises(ValueError):
         dt.transform_to_kpi_dataset(df)
+
+
+def test_transform_low_memory_matches_standard_output():
+    import tracemalloc
+
+    df = sample_df()
+    df.loc[1, "total_receivable_usd"] = 0.0
+    standard = DataTransformation().transform_to_kpi_dataset(df.copy())
+    dt = DataTransformation()
+    tracemalloc.start()
+    try:
+        low_memory = dt.transform_to_kpi_dataset(df.copy(), low_memory=True, measure_peak=True)
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+    stamp_cols = ["_transform_run_id", "_transform_timestamp"]
+    pd.testing.assert_frame_equal(
+        standard.drop(columns=stamp_cols), low_memory.drop(columns=stamp_cols)
+    )
+    assert list(standard.columns) == list(low_memory.columns)
+
+    low_memory.loc[0, "receivable_amount"] = -999.0
+    assert low_memory.loc[0, "total_receivable_usd"] != -999.0
+
+    complete = dt.get_lineage()[-1]
+    assert complete["details"]["low_memory"] is True
+    assert complete["details"]["peak_memory_bytes"] > 0
+
+
+def test_transform_measure_peak_traces_only_for_the_call():
+    import tracemalloc
+
+    assert not tracemalloc.is_tracing()
+    dt = DataTransformation()
+    dt.transform_to_kpi_dataset(sample_df(), low_memory=True, measure_peak=True)
+    assert not tracemalloc.is_tracing()
+    assert dt.get_lineage()[-1]["details"]["peak_memory_bytes"] > 0
+
+
+def test_transform_low_memory_leaves_input_untouched():
+    df = sample_df()
+    original = df.copy()
+    DataTransformation().transform_to_kpi_dataset(df, low_memory=True)
+    pd.testing.assert_frame_equal(df, original)
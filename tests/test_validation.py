@@ -5,7 +5,9 @@ from python.validation import (
     ANALYTICS_NUMERIC_COLUMNS,
     NUMERIC_COLUMNS,
     REQUIRED_ANALYTICS_COLUMNS,
+    column_index,
     find_column,
+    resolve_columns,
     validate_dataframe,
     validate_numeric_bounds,
 )
@@ -111,6 +113,20 @@ def test_find_column_edge_cases():
     assert find_column(empty_df, ["A"]) is None
 
 
+def test_column_index_is_shared_per_layout_and_tracks_new_columns():
+    df = pd.DataFrame({"Outstanding_Balance": [1.0], "client_id": ["C1"]})
+    assert column_index(df) is column_index(df.copy())
+
+    resolved = resolve_columns(
+        df,
+        {"exposure": ["outstanding_balance", "balance"], "customer": ["customer_id", "client"]},
+    )
+    assert resolved == {"exposure": "Outstanding_Balance", "customer": "client_id"}
+
+    df["customer_id"] = ["C1"]
+    assert find_column(df, ["customer_id", "client"]) == "customer_id"
+
+
 def test_safe_numeric_empty():
     """Test safe_numeric with empty input."""
     from python.validation import safe_numeric
@@ -160,3 +176,44 @@ def test_validate_iso8601_dates():
     assert results["iso_datetime_iso8601"] == True
     assert results["mixed_iso8601"] == False
     assert results["nulls_iso8601"] == True
+
+
+def test_iso8601_mask_matches_scalar_check():
+    from datetime import date
+
+    from python.validation import ColumnValidator
+
+    series = pd.Series(
+        ["2025-12-14", None, "14-12-2025", pd.Timestamp("2025-01-01"), date(2025, 1, 1), 5]
+    )
+    expected = [ColumnValidator.is_iso8601(val) for val in series]
+    assert ColumnValidator.iso8601_mask(series).tolist() == expected
+    assert ColumnValidator.iso8601_mask(series.iloc[:3]).tolist() == expected[:3]
+
+
+def test_validation_failure_indices_reports_failing_rows():
+    from python.validation import validation_failure_indices
+
+    df = pd.DataFrame(
+        {
+            "total_receivable_usd": [10.0, -1.0, 30.0, float("nan")],
+            "par30_pct": [5.0, 101.0, 50.0, 0.0],
+            "measurement_date": ["2025-01-31", "2025/02/28", None, "2025-04-30"],
+            "loans_count": [1, 3, 2, 4],
+        },
+        index=[10, 11, 12, 13],
+    )
+    failures = validation_failure_indices(df)
+
+    assert failures["total_receivable_usd_non_negative"].tolist() == [11, 13]
+    assert failures["total_receivable_usd_no_nulls"].tolist() == [13]
+    assert failures["par30_pct_in_0_100"].tolist() == [11]
+    assert failures["measurement_date_iso8601"].tolist() == [11]
+    assert failures["loans_count_monotonic_increasing"].tolist() == [12]
+    assert failures["total_receivable_usd_monotonic_increasing"].tolist() == [11]
+
+
+def test_validate_dataframe_detects_string_in_mixed_object_column():
+    df = pd.DataFrame({"amount": pd.Series([1.0, "2.0", None], dtype=object)})
+    with pytest.raises(ValueError, match="must be numeric"):
+        validate_dataframe(df, numeric_columns=["amount"])
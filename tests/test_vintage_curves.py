@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from python.kpis.vintage_curves import build_vintage_curves
+
+
+def _loans():
+    return pd.DataFrame(
+        {
+            "loan_id": ["A", "B", "C"],
+            "disburse_date": ["2025-01-05", "2025-01-20", "2025-02-10"],
+            "disburse_principal": [100.0, 300.0, 200.0],
+        }
+    )
+
+
+def _snapshots():
+    rows = [
+        ("A", "2025-01-31", 0, False, 100.0, 0.0),
+        ("B", "2025-01-31", 0, False, 300.0, 0.0),
+        ("A", "2025-02-28", 35, False, 90.0, 0.0),
+        ("B", "2025-02-28", 0, False, 250.0, 0.0),
+        ("C", "2025-02-28", 0, False, 200.0, 0.0),
+        ("A", "2025-03-31", 95, False, 90.0, 0.0),
+        ("B", "2025-03-31", 0, False, 200.0, 0.0),
+        ("C", "2025-03-31", 40, False, 200.0, 0.0),
+        ("A", "2025-04-30", 125, True, 0.0, 90.0),
+        ("B", "2025-04-30", 0, False, 150.0, 0.0),
+        ("C", "2025-04-30", 70, False, 200.0, 0.0),
+    ]
+    return pd.DataFrame(
+        rows,
+        columns=[
+            "loan_id_raw",
+            "reporting_date",
+            "dpd",
+            "is_writeoff",
+            "outstanding_balance_usd",
+            "writeoff_outstanding_balance_usd",
+        ],
+    )
+
+
+def test_vintage_curves_by_months_on_book():
+    curves = build_vintage_curves(_loans(), _snapshots())
+
+    jan = curves.cumulative_default_rate.loc["2025-01"]
+    assert jan.tolist() == pytest.approx([0.0, 0.0, 0.25, 0.25])
+    assert curves.cumulative_writeoff_rate.loc["2025-01", 3] == pytest.approx(90.0 / 400.0)
+    assert curves.par30.loc["2025-01", 1] == pytest.approx(90.0 / 340.0)
+
+    feb = curves.par30.loc["2025-02"]
+    assert feb.iloc[:3].tolist() == pytest.approx([0.0, 1.0, 1.0])
+    # The February cohort has only been on book for two months.
+    assert np.isnan(feb.iloc[3])
+    assert curves.cohort_principal.to_dict() == {"2025-01": 400.0, "2025-02": 200.0}
+
+
+def test_vintage_cache_processes_only_new_reporting_months(tmp_path):
+    snapshots = _snapshots()
+    full = build_vintage_curves(_loans(), snapshots)
+
+    build_vintage_curves(
+        _loans(), snapshots[snapshots["reporting_date"] <= "2025-02-28"], cache_dir=tmp_path
+    )
+    cached = build_vintage_curves(_loans(), snapshots, cache_dir=tmp_path)
+
+    assert (tmp_path / "cohort=2025-01.json").exists()
+    assert cached.last_reporting_date == "2025-04-30"
+    pd.testing.assert_frame_equal(cached.cumulative_default_rate, full.cumulative_default_rate)
+    pd.testing.assert_frame_equal(cached.cumulative_writeoff_rate, full.cumulative_writeoff_rate)
+    pd.testing.assert_frame_equal(cached.par30, full.par30)
+
+    rerun = build_vintage_curves(_loans(), snapshots, cache_dir=tmp_path)
+    pd.testing.assert_frame_equal(rerun.par30, full.par30)